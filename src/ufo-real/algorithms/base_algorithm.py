@@ -6,9 +6,13 @@ __copyright__ = "Copyright (c) 2025 HSLU PREN Team 2, FS25. All rights reserved.
 from abc import ABC
 from datetime import datetime
 from logging import getLogger
+from typing import Callable
 
 from pathfinder.ipathfinder import IPathfinder
-from pathfinder.dijkstra import DijkstraPathfinder
+from pathfinder.cached_pathfinder import CachedPathfinder
+from pathfinder.contingency import ContingencyPathfinder
+from pathfinder.heading import HeadingAwarePathfinder
+from pathfinder.registry import create_pathfinder
 from uart.receiver import UARTReceiver
 from uart.sender import UARTSender
 from ufo.actor import Ufo
@@ -20,6 +24,9 @@ from network.node import Node
 class BaseAlgorithm(BaseUfoListener, ABC):  # pylint: disable=too-many-instance-attributes
     """Base Algorithm"""
 
+    # see pathfinder.registry.PATHFINDERS, others are opt-in (use_pathfinder)
+    pathfinder_name = "dijkstra"
+
     def __init__(
         self,
         network_provider: NetworkProvider,
@@ -34,10 +41,30 @@ class BaseAlgorithm(BaseUfoListener, ABC):  # pylint: disable=too-many-instance-
         self._path: list[Node] = []
         self._target: Node | None = None
         self._start_time = datetime.now()
-        self._pathfinder: IPathfinder = DijkstraPathfinder()
+        # measured (angle, seconds) of the turns, calibrates turn costs
+        self.turn_timings: Callable[[], list[tuple[float, float]]] = list
+        self._contingencies = ContingencyPathfinder(
+            self._create_pathfinder(self.pathfinder_name)
+        )
+        self._pathfinder: IPathfinder = CachedPathfinder(self._contingencies)
         self._node_index = 0
         self._logger = getLogger(self.__class__.__name__)
 
+    def use_pathfinder(self, name: str) -> None:
+        """plan the next paths with the pathfinder registered as ``name``"""
+        self._contingencies.live = self._create_pathfinder(name)
+        self._pathfinder = CachedPathfinder(self._contingencies)
+        self.pathfinder_name = name
+        self._logger.info("Using pathfinder %s", name)
+
+    def _create_pathfinder(self, name: str) -> IPathfinder:
+        pathfinder = create_pathfinder(name)
+        if isinstance(pathfinder, HeadingAwarePathfinder):
+            pathfinder.heading_provider = lambda: self._ufo.current_deg
+            # pylint: disable-next=unnecessary-lambda # the engine sets it later
+            pathfinder.turn_timings = lambda: self.turn_timings()
+        return pathfinder
+
     def _set_new_path(self) -> None:
         assert self._target is not None
         self._path = self._pathfinder.find_path(
@@ -48,6 +75,8 @@ class BaseAlgorithm(BaseUfoListener, ABC):  # pylint: disable=too-many-instance-
     async def _on_start(self, target: Node) -> None:
         self._start_time = datetime.now()
         self._target = target
+        # the single failures of the run are then looked up
+        self._contingencies.schedule(self._network)
 
     def reset(self) -> None:
         """reset algorithm"""
@@ -57,6 +86,11 @@ class BaseAlgorithm(BaseUfoListener, ABC):  # pylint: disable=too-many-instance-
         self._path = []
         self._network = self._network_provider()
 
+    def stop(self) -> None:
+        """release what the algorithm holds, it is about to be replaced"""
+        self._logger.info("Stopping")
+        self._unsubscribe()
+
     async def _on_destination_reached(self) -> None:
         await self._ufo.destination_reached()
         self._logger.info(
@@ -71,6 +105,13 @@ class BaseAlgorithm(BaseUfoListener, ABC):  # pylint: disable=too-many-instance-
         """algorithm name"""
         return self.__class__.__name__
 
+    @property
+    def current_edge(self) -> str | None:
+        """edge the vehicle is driving on (or about to), e.g. ``"A-B"``"""
+        if self._target is None or self._next_node is None:
+            return None
+        return f"{self._current_node.label}-{self._next_node.label}"
+
     @property
     def _next_node_index(self) -> int:
         """index of next node in path"""
@@ -6,14 +6,34 @@ __copyright__ = "Copyright (c) 2025 HSLU PREN Team 2, FS25. All rights reserved.
 # code that uses image recognition
 
 import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+
+from cv2.typing import MatLike
+
+from capture.frame_capture import FrameCapture
+from capture.source import create_frame_source
 
 # newly added imports - subject to change
-from components import Camera, Edge, Graph, RealNode, RealNodeLabel, Robot
+from components import (
+    Camera,
+    Edge,
+    Graph,
+    Obstacle,
+    RealNode,
+    RealNodeLabel,
+    Robot,
+    VisualNode,
+)
 from network.network import NetworkProvider
 from network.node import Node, NodeLabel
 from uart.receiver import UARTReceiver
 from uart.sender import UARTSender
+from utilities.frame_preprocessor import PreprocessingConfig
 from utilities.image_synthesizer import ImageSynthesizer
+from utilities.inference_service import InferenceDroppedError, InferenceService
 from yolo_model_v11 import ImageDetection
 
 from .road_sense import RoadSenseAlgorithm
@@ -23,22 +43,35 @@ from .road_sense import RoadSenseAlgorithm
 # import run_image_recognition_async
 
 
-class OverSightAlgorithm(RoadSenseAlgorithm):
+@dataclass
+class RecognitionLatency:
+    """how long the image recognition on a node took"""
+
+    node: NodeLabel
+    seconds: float
+    timed_out: bool = False
+    capture_wait: float = 0.0  # seconds waited for a frame after ALIGNED
+
+
+class OverSightAlgorithm(RoadSenseAlgorithm):  # pylint: disable=too-many-instance-attributes
     """OverSight"""
 
     camera: Camera
     graph: Graph
     robot: Robot
 
-    IMAGE_RECOGNITION_EXPECTED_TIME: float = 4.0  # seconds
+    IMAGE_RECOGNITION_BUDGET: float = 4.0  # seconds, RoadSense fallback after
+    RECOGNITION_LATENCY_HISTORY: int = 100  # number of recognitions kept
 
     # YOLO specific parameters
     # TODO: # pylint: disable=fixme
     # refactor, make dynamic, test best settings
     _PATH_MODEL: str = "YOLO_Model_v11\\my_model.pt"  # final
-    _PATH_SOURCE: str = (
-        "YOLO_Model_v11\\test_image2.jpg"  # fake, change to picamera asap
-    )
+    # image, image directory, video file or camera device (/dev/video0)
+    _CAPTURE_SOURCE: Path = (
+        Path(__file__).parent.parent / "tests" / "images" / "test_image2.jpg"
+    )  # fake, change to picamera asap
+    _CAPTURE_BUFFER: int = 4  # frames kept by the capture
     _FRESHHOLD: float = (
         0.3  # test to see which one yields best result -> Range 0.3 to 1.0
     )
@@ -46,6 +79,10 @@ class OverSightAlgorithm(RoadSenseAlgorithm):
         "1280x720"  # final - could come from camere once its setup properly
     )
     _SAFE: bool = False  # test
+    # the frames come decoded from the capture, only the floor crop applies,
+    # a reduced JPEG decode would only matter to encoded frames
+    _PREPROCESSING: PreprocessingConfig = PreprocessingConfig()
+    _INFERENCE_TIMEOUT: float = 10.0  # seconds until a frame is given up on
 
     def __init__(
         self,
@@ -55,25 +92,90 @@ class OverSightAlgorithm(RoadSenseAlgorithm):
     ) -> None:
         super().__init__(network_provider, sender, receiver)
         self._image_recognition_setup()
+        # the model is loaded and warmed up once per process in the background,
+        # a START never has to wait for it
+        self.image_detection = ImageDetection(
+            self._PATH_MODEL,
+            self.camera,
+            self._FRESHHOLD,
+            self._RESOLUTION,
+            self._PREPROCESSING,
+        )
+        # keeps the blocking YOLO inference off the event loop
+        self._inference: InferenceService[
+            MatLike, tuple[list[VisualNode], list[Obstacle], MatLike]
+        ] = InferenceService(
+            self._detect,
+            timeout=self._INFERENCE_TIMEOUT,
+        )
+        self._recognition_latencies: deque[RecognitionLatency] = deque(
+            maxlen=self.RECOGNITION_LATENCY_HISTORY
+        )
+        # grabs frames all the time, so a fresh one is ready once aligned
+        self._capture = FrameCapture(
+            create_frame_source(
+                str(self._CAPTURE_SOURCE), self.image_detection.resolution
+            ),
+            self._CAPTURE_BUFFER,
+        )
+        self._capture_wait = 0.0
 
     async def _on_start(self, target: Node) -> None:
         self._image_recognition_setup()  # ensure camera and robot are set up
+        self.image_detection.camera = self.camera
+        self._capture.start()
         await super()._on_start(target)
 
+    def reset(self) -> None:
+        super().reset()
+        self._capture.stop()  # the next START starts it again
+
+    def stop(self) -> None:
+        super().stop()  # no START can start the capture again
+        self._capture.stop()
+        self._inference.stop()
+
     async def _on_aligned(self, hold: bool) -> None:
-        # TODO: oversight here
         self._logger.debug("Taking a picture real quick...")
-        await self._on_sight()  # run image recognition
-        await asyncio.sleep(
-            self.IMAGE_RECOGNITION_EXPECTED_TIME
-        )  # wait for the image recognition to finish
-        if hold:
-            return
-        await self._ufo.follow_to_next_node()
-        self._is_moving = True
+        node = self._ufo.current_or_last_node
+        start = time.monotonic()
+        timed_out = False
+        self._capture_wait = 0.0
+        try:
+            # continue as soon as the recognition and the network update are done
+            await asyncio.wait_for(self._on_sight(start), self.IMAGE_RECOGNITION_BUDGET)
+        except (TimeoutError, InferenceDroppedError):
+            # carry on like RoadSense would, without any new information
+            timed_out = True
+            self._logger.warning(
+                "Image recognition on %s exceeded %ss, continuing without it",
+                node,
+                self.IMAGE_RECOGNITION_BUDGET,
+            )
+        self._record_recognition_latency(
+            RecognitionLatency(
+                node.label, time.monotonic() - start, timed_out, self._capture_wait
+            )
+        )
+        await super()._on_aligned(hold)
+
+    def _record_recognition_latency(self, latency: RecognitionLatency) -> None:
+        self._recognition_latencies.append(latency)
+        self._logger.debug(
+            "Recognition on %s took %.3fs (%.3fs waiting for a frame)%s",
+            latency.node,
+            latency.seconds,
+            latency.capture_wait,
+            " (timed out)" if latency.timed_out else "",
+        )
+
+    @property
+    def recognition_latencies(self) -> deque[RecognitionLatency]:
+        """latency of the most recent image recognitions per node"""
+        return self._recognition_latencies
 
     # TODO: behold here my chaos takes over
-    async def _on_sight(self) -> None:
+    async def _on_sight(self, aligned_at: float) -> None:
         self._logger.debug("Running image recognition...")
 
         # 1.) Check if the system knows where we are and where we would like to go.
@@ -91,7 +193,7 @@ class OverSightAlgorithm(RoadSenseAlgorithm):
 
         # 3.) Trigger the image callculation and let it update the graph-object
         # TODO: create a temporary snapshot of the graph with this method for the next one
-        await self._run_image_recognition_async()
+        await self._run_image_recognition_async(aligned_at)
 
         # 4. Transfer information in updated graph-object to network
         self._apply_recognition_result_to_network()  # TODO: add argument of current snapshot graph
@@ -102,14 +204,18 @@ class OverSightAlgorithm(RoadSenseAlgorithm):
 
     # <-- TODO: Helper-Methods that will need to be allocated somewhere else. -->
 
-    async def _run_image_recognition_async(self) -> None:  # Graph:
+    async def _run_image_recognition_async(self, aligned_at: float) -> None:  # Graph:
         """
         Runs the YOLO image recognition pipeline asynchronously and returns
         an updated Graph with states for nodes and edges.
         """
         self._logger.debug("Taking picture now ...")
-        detected_nodes, detected_obstacles, _ = (
-            self.image_detection.yolo_detect_by_image(self._PATH_SOURCE)
+        # the first frame taken after the vehicle stood still
+        waiting_since = time.monotonic()
+        frame = await self._capture.frame_after(aligned_at)
+        self._capture_wait = time.monotonic() - waiting_since
+        detected_nodes, detected_obstacles, _ = await self._inference.submit(
+            frame.image
         )
         self._logger.debug("Evaluating picture ...")
         self.image_synthesizer.update_graph_by_objects(
@@ -117,6 +223,12 @@ class OverSightAlgorithm(RoadSenseAlgorithm):
             detected_obstacles,
         )
 
+    def _detect(
+        self, frame: MatLike
+    ) -> tuple[list[VisualNode], list[Obstacle], MatLike]:
+        """runs on the inference worker, never on the event loop"""
+        return self.image_detection.yolo_detect_by_frame(frame)
+
     def _apply_recognition_result_to_network(self) -> None:
         """
         Takes the result Graph from the image recognition and updates the
@@ -168,7 +280,6 @@ class OverSightAlgorithm(RoadSenseAlgorithm):
 
         self.graph = _setup_graph()
 
-        self.image_detection = ImageDetection(self._PATH_MODEL, self.camera, 4.0)
         self.image_synthesizer = ImageSynthesizer(self.camera, self.robot, self.graph)
 
     @staticmethod
@@ -182,6 +293,7 @@ class OverSightAlgorithm(RoadSenseAlgorithm):
     def _convert_networknode_to_graphcoordinates(self, node: Node) -> tuple[int, int]:
         return self.graph.get_node_by_str(node.label.value).get_coordinates
 
+
 def _setup_graph() -> Graph:  # pylint: disable=too-many-locals
     """--------------SETUP-NETWORK------------------"""
     a = RealNode(RealNodeLabel.A, 2933, 900)
@@ -205,7 +317,7 @@ def _setup_graph() -> Graph:  # pylint: disable=too-many-locals
     xz = Edge(x, z)
     xs = Edge(x, start)
 
-    nodes: list[RealNode] = [a, b, c, x, y, z, start]
+    nodes: list[RealNode] = [a, b, c, w, x, y, z, start]
     edges: list[Edge] = [ab, ay, az, bc, by, cw, wx, ws, xy, xz, xs]
 
     return Graph(nodes, edges)
@@ -0,0 +1,7 @@
+# -*- coding: utf-8 -*-
+"""
+Micro-benchmarks, run them from ``src/ufo-real`` with e.g.
+``python -m benchmarks.bench_edge_intersection``
+"""
+
+__copyright__ = "Copyright (c) 2025 HSLU PREN Team 2, FS25. All rights reserved."
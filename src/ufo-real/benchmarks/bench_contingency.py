@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""
+Contingency table benchmark:
+time and memory to build the table of every target and single failure, and
+a replan after one failure looked up against the live A* search.
+"""
+
+__copyright__ = "Copyright (c) 2025 HSLU PREN Team 2, FS25. All rights reserved."
+
+import random
+import time
+import tracemalloc
+
+from benchmarks.bench_network_lookup import grid_network
+from common.competition import create_network
+from network.network import Network
+from pathfinder.a_star import AStarPathfinder
+from pathfinder.contingency import ContingencyPathfinder
+
+REPLANS = 200
+
+
+def _replan(
+    pathfinder: ContingencyPathfinder | AStarPathfinder, network: Network
+) -> float:
+    """mean seconds of a replan after a single edge failed"""
+    rng = random.Random(0)
+    edges = sorted(network.edges, key=str)
+    nodes = sorted(network.nodes, key=str)
+    end = sorted(network.end, key=str)[-1]
+    elapsed = 0.0
+    for _ in range(REPLANS):
+        edge = rng.choice(edges)
+        edge.disabled = True
+        start = rng.choice(nodes)
+        started = time.perf_counter()
+        try:
+            pathfinder.find_path(network, start, end)
+        except ValueError:
+            pass
+        elapsed += time.perf_counter() - started
+        edge.disabled = False
+    return elapsed / REPLANS
+
+
+def main() -> None:
+    """run the benchmark"""
+    print(
+        f"{'nodes':>6} {'paths':>7} {'entries':>9} {'build [ms]':>11}"
+        f" {'memory [KiB]':>13} {'lookup [us]':>12} {'a_star [us]':>12}"
+    )
+    for network in (create_network(), grid_network(10), grid_network(20)):
+        tracemalloc.start()
+        traced = ContingencyPathfinder(AStarPathfinder()).build(network)
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del traced
+        pathfinder = ContingencyPathfinder(AStarPathfinder())
+        table = pathfinder.build(network)  # timed without tracing
+
+        lookup = _replan(pathfinder, network)
+        live = _replan(AStarPathfinder(), network)
+        print(
+            f"{len(network.nodes):>6} {len(table.trees):>7} {table.entries:>9}"
+            f" {table.build_seconds * 1e3:>11.1f} {memory / 1024:>13.0f}"
+            f" {lookup * 1e6:>12.1f} {live * 1e6:>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""
+Edge/obstacle intersection benchmark:
+per-pair ``_does_line_cross_any_obstacle`` against the batched
+``compute_intersection_matrix`` for growing edge and obstacle counts.
+"""
+
+__copyright__ = "Copyright (c) 2025 HSLU PREN Team 2, FS25. All rights reserved."
+
+import random
+import timeit
+
+from components import VisualNode
+from utilities.image_synthesizer import (
+    _does_line_cross_any_obstacle,  # pylint: disable=protected-access
+    compute_intersection_matrix,
+)
+
+REPEAT = 5
+
+
+def _random_segments(count: int, rng: random.Random) -> list[tuple[int, int, int, int]]:
+    return [
+        (
+            rng.randint(0, 1280),
+            rng.randint(0, 720),
+            rng.randint(0, 1280),
+            rng.randint(0, 720),
+        )
+        for _ in range(count)
+    ]
+
+
+def _random_obstacles(count: int, rng: random.Random) -> list[VisualNode]:
+    return [
+        VisualNode(
+            f"O{i}",
+            (rng.randint(0, 1280), rng.randint(0, 720)),
+            rng.randint(20, 200),
+            rng.randint(5, 60),
+        )
+        for i in range(count)
+    ]
+
+
+def _per_pair(
+    segments: list[tuple[int, int, int, int]], obstacles: list[VisualNode]
+) -> list[bool]:
+    return [
+        _does_line_cross_any_obstacle((x1, y1), (x2, y2), obstacles)
+        for x1, y1, x2, y2 in segments
+    ]
+
+
+def main() -> None:
+    """run the benchmark"""
+    rng = random.Random(0)
+    print(f"{'edges':>6} {'obstacles':>9} {'per-pair [ms]':>14} {'batched [ms]':>13}")
+
+    for edges in (11, 50, 200, 1000):
+        for obstacles in (1, 4, 16, 64):
+            segments = _random_segments(edges, rng)
+            ellipses = _random_obstacles(obstacles, rng)
+
+            scalar = min(
+                timeit.repeat(
+                    lambda: _per_pair(segments, ellipses),  # pylint: disable=cell-var-from-loop
+                    number=1,
+                    repeat=REPEAT,
+                )
+            )
+            batched = min(
+                timeit.repeat(
+                    lambda: compute_intersection_matrix(segments, ellipses).any(axis=1),  # pylint: disable=cell-var-from-loop
+                    number=1,
+                    repeat=REPEAT,
+                )
+            )
+            print(
+                f"{edges:>6} {obstacles:>9} {scalar * 1000:>14.3f} {batched * 1000:>13.3f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""
+Fleet benchmark:
+how many vehicles one core drives, every vehicle runs RoadSense against a
+loopback firmware answering every command at once, lap after lap.
+"""
+
+__copyright__ = "Copyright (c) 2025 HSLU PREN Team 2, FS25. All rights reserved."
+
+import asyncio
+import time
+
+from common.competition import create_network
+from uart.mock.bus import UARTBus as MockUARTBus
+from uart.protocol import UARTCommand, UARTEvent
+from uart.schema import encode_frame, get_codec
+from ufo.fleet import Fleet, NetworkTemplate
+
+DURATION = 2.0  # seconds per fleet size
+# a lap of the track takes about a minute and is answered by ~15 events,
+# two events per second and vehicle leave plenty of headroom
+EVENTS_PER_VEHICLE = 2.0
+
+_ANSWERS: dict[UARTCommand, bytes] = {
+    UARTCommand.TURN: get_codec(UARTEvent.ALIGNED).frame(0),
+    UARTCommand.FOLLOW_LINE: encode_frame(UARTEvent.POINT_REACHED.value),
+}
+
+
+class _LoopbackBus(MockUARTBus):
+    """answers the commands like the firmware, without any delay"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.events = 0
+        self.laps = 0
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    def start_lap(self) -> bytes:
+        """START to the next end node, the vehicle stays where it stopped"""
+        self.laps += 1
+        return get_codec(UARTEvent.START).frame(self.laps % 3)
+
+    async def send_command(self, command: UARTCommand, payload: bytes = b"") -> None:
+        if command == UARTCommand.DESTINAITON_REACHED:
+            answer: bytes | None = self.start_lap()
+        else:
+            answer = _ANSWERS.get(command)
+        if answer is not None:
+            task = asyncio.create_task(self.answer(answer))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def answer(self, frame: bytes) -> None:
+        """feed an event"""
+        self.events += 1
+        await self.mock_receive_message(frame)
+
+
+async def _run(vehicles: int) -> tuple[float, int]:
+    fleet = Fleet(NetworkTemplate(create_network))
+    buses = []
+    for i in range(vehicles):
+        bus = _LoopbackBus()
+        fleet.add(f"v{i}").engine.init(bus)
+        buses.append(bus)
+
+    for bus in buses:
+        await bus.answer(bus.start_lap())
+    started = time.perf_counter()
+    await asyncio.sleep(DURATION)
+    events = sum(bus.events for bus in buses)
+    return events / (time.perf_counter() - started), sum(bus.laps for bus in buses)
+
+
+def main() -> None:
+    """run the benchmark"""
+    print(f"{'vehicles':>8} {'events/s':>10} {'per vehicle':>12} {'laps':>6}")
+    rate = 0.0
+    for vehicles in (1, 4, 16, 64):
+        rate, laps = asyncio.run(_run(vehicles))
+        print(f"{vehicles:>8} {rate:>10.0f} {rate / vehicles:>12.1f} {laps:>6}")
+    print(
+        f"\none core sustains ~{int(rate / EVENTS_PER_VEHICLE)} vehicles"
+        f" at {EVENTS_PER_VEHICLE} events/s each"
+    )
+
+
+if __name__ == "__main__":
+    main()
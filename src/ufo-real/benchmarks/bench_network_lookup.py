@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+"""
+Network lookup benchmark:
+``nodes``, ``start``, ``end``, ``get_node_by_label`` and ``get_edge`` on
+square grids of growing size, the cost per call should stay flat.
+"""
+
+__copyright__ = "Copyright (c) 2025 HSLU PREN Team 2, FS25. All rights reserved."
+
+import random
+import timeit
+from typing import Callable, cast
+
+from network.edge import Edge
+from network.network import Network
+from network.node import Node, NodeLabel, NodeType
+
+CALLS = 2000
+
+
+def grid_network(side: int) -> Network:
+    """
+    square grid with the start in one corner and the ends in the others,
+    the nodes get generated labels as the NodeLabel values are too few
+    """
+    network = Network()
+    nodes = [
+        [Node(x, y, cast(NodeLabel, f"N{x}_{y}")) for x in range(side)]
+        for y in range(side)
+    ]
+    nodes[0][0].node_type = NodeType.START
+    for node in (nodes[0][-1], nodes[-1][0], nodes[-1][-1]):
+        node.node_type = NodeType.END
+    for y in range(side):
+        for x in range(side):
+            if x + 1 < side:
+                network.add_edge(Edge(nodes[y][x], nodes[y][x + 1]))
+            if y + 1 < side:
+                network.add_edge(Edge(nodes[y][x], nodes[y + 1][x]))
+    return network
+
+
+def _time(network: Network) -> dict[str, float]:
+    rng = random.Random(0)
+    edges = rng.choices(list(network.edges), k=CALLS)
+    labels = [edge.nodes[0].label for edge in edges]
+
+    def _per_call(statement: Callable[[], object]) -> float:
+        return min(timeit.repeat(statement, number=1, repeat=5)) / CALLS
+
+    return {
+        "nodes": _per_call(lambda: [network.nodes for _ in range(CALLS)]),
+        "start": _per_call(lambda: [network.start for _ in range(CALLS)]),
+        "end": _per_call(lambda: [network.end for _ in range(CALLS)]),
+        "by label": _per_call(
+            lambda: [network.get_node_by_label(label) for label in labels]
+        ),
+        "get_edge": _per_call(
+            lambda: [network.get_edge(*edge.nodes) for edge in edges]
+        ),
+    }
+
+
+def main() -> None:
+    """run the benchmark"""
+    columns = ("nodes", "start", "end", "by label", "get_edge")
+    print(f"{'nodes':>7} " + " ".join(f"{name + ' [us]':>14}" for name in columns))
+    for side in (3, 10, 32, 100):
+        network = grid_network(side)
+        timings = _time(network)
+        print(
+            f"{side * side:>7} "
+            + " ".join(f"{timings[name] * 1e6:>14.3f}" for name in columns)
+        )
+
+
+if __name__ == "__main__":
+    main()
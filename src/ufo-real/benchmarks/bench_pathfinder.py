@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+"""
+Pathfinder benchmark:
+the dense all-sources DijkstraPathfinder, the cached single-source
+SparseDijkstraPathfinder and the pure Python AStarPathfinder, from the
+competition network (8 nodes) to grids of 10000 nodes, every plan after an
+edge changed its state.
+"""
+
+__copyright__ = "Copyright (c) 2025 HSLU PREN Team 2, FS25. All rights reserved."
+
+import random
+import time
+
+from benchmarks.bench_network_lookup import grid_network
+from common.competition import create_network
+from network.network import Network
+from pathfinder.ipathfinder import IPathfinder
+from pathfinder.registry import create_pathfinder
+
+PLANS = 20
+DENSE_LIMIT = 1100  # nodes, the dense matrix does not fit beyond
+
+
+def _plan(pathfinder: IPathfinder, network: Network) -> tuple[float, float]:
+    """seconds of the first plan and the mean of the following ones"""
+    rng = random.Random(0)
+    edges = sorted(network.edges, key=str)
+    end = sorted(network.end, key=str)[-1]
+
+    started = time.perf_counter()
+    pathfinder.find_path(network, network.start, end)
+    first = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for _ in range(PLANS):
+        edge = rng.choice(edges)
+        edge.obstructed = not edge.obstructed
+        pathfinder.find_path(network, network.start, end)
+    return first, (time.perf_counter() - started) / PLANS
+
+
+def main() -> None:
+    """run the benchmark"""
+    print("mean plan after a change [ms] (first plan of the sparse Dijkstra)")
+    print(f"{'nodes':>6} {'dijkstra':>10} {'sparse':>18} {'a_star':>10}")
+    networks = [create_network()] + [grid_network(side) for side in (10, 32, 100)]
+    for network in networks:
+        sparse_first, sparse = _plan(create_pathfinder("sparse_dijkstra"), network)
+        _, a_star = _plan(create_pathfinder("a_star"), network)
+        dense_column = f"{'-':>10}"
+        if len(network.nodes) <= DENSE_LIMIT:
+            _, dense = _plan(create_pathfinder("dijkstra"), network)
+            dense_column = f"{dense * 1e3:>10.3f}"
+        sparse_column = f"{sparse * 1e3:.3f} ({sparse_first * 1e3:.1f})"
+        print(
+            f"{len(network.nodes):>6} {dense_column} {sparse_column:>18}"
+            f" {a_star * 1e3:>10.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+"""
+Serial stack benchmark:
+the production buses over a pseudo-terminal against the firmware simulator,
+latency of TURN -> ALIGNED round trips and throughput of a burst of
+FOLLOW_LINE -> POINT_REACHED.
+"""
+
+__copyright__ = "Copyright (c) 2025 HSLU PREN Team 2, FS25. All rights reserved."
+
+import asyncio
+import os
+import statistics
+import time
+from typing import Awaitable, Callable
+
+from serial_asyncio import open_serial_connection
+
+from uart.bus import UARTBus
+from uart.mock.firmware_simulator import FirmwareSimulator, SimulatorConfig, open_pty
+from uart.protocol import UARTEvent, UARTProtocol
+from uart.protocol_bus import open_protocol_bus
+from uart.receiver import UARTReceiver
+from uart.sender import UARTSender
+
+BAUDRATE = 115200
+ROUND_TRIPS = 200
+BURST = 500
+
+
+async def _stream_bus(device: str) -> UARTProtocol:
+    reader, writer = await open_serial_connection(url=device, baudrate=BAUDRATE)
+    return UARTBus(reader, writer)
+
+
+async def _protocol_bus(device: str) -> UARTProtocol:
+    return await open_protocol_bus(device, BAUDRATE)
+
+
+async def _measure(
+    open_bus: Callable[[str], Awaitable[UARTProtocol]],
+) -> tuple[list[float], float]:
+    master, slave, device = open_pty(BAUDRATE)
+    simulator = FirmwareSimulator(
+        master, SimulatorConfig(baudrate=BAUDRATE, delays={}, start_delay=None)
+    )
+    simulator.start()
+    bus = await open_bus(device)
+    await bus.start()
+    sender = UARTSender(bus)
+    receiver = UARTReceiver(bus)
+
+    latencies = []
+    for _ in range(ROUND_TRIPS):
+        started = time.perf_counter()
+        aligned = asyncio.create_task(receiver.wait_for(UARTEvent.ALIGNED, 1.0))
+        await sender.turn(90)
+        await aligned
+        latencies.append(time.perf_counter() - started)
+
+    reached = 0
+    done = asyncio.Event()
+
+    async def _on_point_reached() -> None:
+        nonlocal reached
+        reached += 1
+        if reached == BURST:
+            done.set()
+
+    receiver.on(UARTEvent.POINT_REACHED, _on_point_reached)
+    started = time.perf_counter()
+    await asyncio.gather(*(sender.follow_line() for _ in range(BURST)))
+    await asyncio.wait_for(done.wait(), 10.0)
+    throughput = BURST / (time.perf_counter() - started)
+
+    simulator.stop()
+    os.close(master)
+    os.close(slave)
+    return latencies, throughput
+
+
+def main() -> None:
+    """run the benchmark"""
+    print(f"baudrate {BAUDRATE}, {ROUND_TRIPS} round trips, burst of {BURST}")
+    print(
+        f"{'bus':>10} {'p50 [ms]':>9} {'p95 [ms]':>9} {'max [ms]':>9} {'burst [1/s]':>12}"
+    )
+    for name, open_bus in (("stream", _stream_bus), ("protocol", _protocol_bus)):
+        latencies, throughput = asyncio.run(_measure(open_bus))
+        latencies.sort()
+        print(
+            f"{name:>10} {statistics.median(latencies) * 1e3:>9.3f}"
+            f" {latencies[int(0.95 * len(latencies))] * 1e3:>9.3f}"
+            f" {latencies[-1] * 1e3:>9.3f} {throughput:>12.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""
+UART codec benchmark:
+the previous per-call ``struct.pack`` and XOR loop against the compiled
+codecs of ``uart.schema``, for encoding commands and decoding events.
+"""
+
+__copyright__ = "Copyright (c) 2025 HSLU PREN Team 2, FS25. All rights reserved."
+
+import struct
+import timeit
+
+from uart.frame_parser import FrameParser
+from uart.protocol import UARTCommand, UARTEvent
+from uart.schema import encode_frame, get_codec
+
+NUMBER = 20_000
+REPEAT = 5
+
+
+def _legacy_checksum(data: bytes) -> int:
+    checksum = 0
+    for byte in data:
+        checksum ^= byte
+    return checksum
+
+
+def _legacy_frame(message_id: int, payload: bytes) -> bytes:
+    message = bytes([message_id]) + payload
+    return message + bytes([_legacy_checksum(message)])
+
+
+def _legacy_encode() -> None:
+    _legacy_frame(UARTCommand.TURN.value, struct.pack("<" + "h?", 90, True))
+    _legacy_frame(UARTCommand.SET_SPEED.value, struct.pack("<" + "b", 50))
+    _legacy_frame(UARTCommand.FOLLOW_LINE.value, b"")
+
+
+_TURN = get_codec(UARTCommand.TURN)
+_SPEED = get_codec(UARTCommand.SET_SPEED)
+
+
+def _compiled_encode() -> None:
+    _TURN.frame(90, True)
+    _SPEED.frame(50)
+    encode_frame(UARTCommand.FOLLOW_LINE.value)
+
+
+def _legacy_decode(stream: bytes) -> int:
+    """same field by field parsing as the stream bus, without the awaits"""
+    events: list[tuple[UARTEvent, bytes]] = []
+    position = 0
+    while position < len(stream):
+        event_id = stream[position]
+        position += 1
+        payload = b""
+        if event_id in (UARTEvent.START.value, UARTEvent.ALIGNED.value):
+            payload = stream[position : position + 1]
+            position += 1
+        if event_id == UARTEvent.LOG_MESSAGE.value:
+            size = stream[position]
+            payload = stream[position + 1 : position + 1 + size]
+            position += 1 + size
+        checksum = stream[position]
+        position += 1
+        if _legacy_checksum(bytes([event_id]) + payload) == checksum:
+            events.append((UARTEvent(event_id), payload))
+    return len(events)
+
+
+def _stream(log_size: int) -> bytes:
+    log = get_codec(UARTEvent.LOG_MESSAGE).frame(b"x" * log_size)
+    return (
+        get_codec(UARTEvent.START).frame(0)
+        + encode_frame(UARTEvent.POINT_REACHED.value)
+        + get_codec(UARTEvent.ALIGNED).frame(1)
+        + log * 4
+    )
+
+
+def main() -> None:
+    """run the benchmark"""
+    legacy = min(timeit.repeat(_legacy_encode, number=NUMBER, repeat=REPEAT))
+    compiled = min(timeit.repeat(_compiled_encode, number=NUMBER, repeat=REPEAT))
+    print(f"encode 3 commands: {'legacy [us]':>12} {'compiled [us]':>14}")
+    print(f"{'':>18} {legacy / NUMBER * 1e6:>12.3f} {compiled / NUMBER * 1e6:>14.3f}")
+
+    print(f"\n{'log size':>8} {'legacy [us]':>12} {'parser [us]':>12}")
+    for log_size in (8, 64, 200):
+        stream = _stream(log_size)
+        parser = FrameParser()
+        assert _legacy_decode(stream) == len(parser.feed(stream)) == 7
+        legacy = min(
+            timeit.repeat(
+                lambda: _legacy_decode(stream),  # pylint: disable=cell-var-from-loop
+                number=NUMBER // 10,
+                repeat=REPEAT,
+            )
+        )
+        parsed = min(
+            timeit.repeat(
+                lambda: parser.feed(stream),  # pylint: disable=cell-var-from-loop
+                number=NUMBER // 10,
+                repeat=REPEAT,
+            )
+        )
+        print(
+            f"{log_size:>8} {legacy / NUMBER * 1e7:>12.3f} {parsed / NUMBER * 1e7:>12.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
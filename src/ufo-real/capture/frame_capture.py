@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+"""Continuous frame capture into a ring buffer."""
+
+__copyright__ = "Copyright (c) 2025 HSLU PREN Team 2, FS25. All rights reserved."
+
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Optional
+
+import cv2
+
+from .source import FrameSource
+
+
+@dataclass
+class Frame:
+    """A captured frame and when it was captured (``time.monotonic``)."""
+
+    timestamp: float
+    image: cv2.typing.MatLike = field(repr=False)
+
+
+@dataclass
+class CaptureStatistics:
+    """Counters of the capture."""
+
+    captured: int = 0
+    failed: int = 0
+
+
+class FrameRingBuffer:
+    """The most recent frames, oldest first. Not thread safe on its own."""
+
+    def __init__(self, capacity: int) -> None:
+        if capacity < 1:
+            raise ValueError("The buffer needs to hold at least one frame.")
+        self._frames: deque[Frame] = deque(maxlen=capacity)
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    def push(self, frame: Frame) -> None:
+        """Add a frame, drops the oldest one once full."""
+        self._frames.append(frame)
+
+    def latest(self) -> Optional[Frame]:
+        """The newest frame, if any."""
+        return self._frames[-1] if self._frames else None
+
+    def latest_after(self, timestamp: float) -> Optional[Frame]:
+        """The newest frame captured after ``timestamp``, if any."""
+        frame = self.latest()
+        if frame is not None and frame.timestamp > timestamp:
+            return frame
+        return None
+
+
+@dataclass
+class _Waiter:
+    timestamp: float
+    loop: asyncio.AbstractEventLoop
+    future: asyncio.Future[Frame]
+
+
+class FrameCapture:  # pylint: disable=too-many-instance-attributes
+    """Grabs frames from a source on a background thread, all the time."""
+
+    def __init__(self, source: FrameSource, capacity: int = 4) -> None:
+        self._source = source
+        self._buffer = FrameRingBuffer(capacity)
+        self._waiters: list[_Waiter] = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._statistics = CaptureStatistics()
+        self._logger = logging.getLogger("capture")
+
+    @property
+    def running(self) -> bool:
+        """Whether the capture thread is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def statistics(self) -> CaptureStatistics:
+        """Counters of the capture."""
+        return self._statistics
+
+    def start(self) -> None:
+        """Start capturing, does nothing if it already is."""
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="capture", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 1.0) -> None:
+        """
+        Stop capturing and wait up to ``timeout`` seconds for the thread to\n
+        finish. A thread stuck in a read is left to exit on its own.
+        """
+        self._stop.set()
+        if self._thread is None:
+            return
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            # still running, so a start does not open the source a second time
+            self._logger.warning("Capture did not stop within %.1fs", timeout)
+            return
+        self._thread = None
+
+    def latest(self) -> Optional[Frame]:
+        """The newest frame, if any."""
+        with self._lock:
+            return self._buffer.latest()
+
+    async def frame_after(
+        self, timestamp: float, timeout: Optional[float] = None
+    ) -> Frame:
+        """
+        The newest frame captured after ``timestamp``. Returns at once if\n
+        there already is one, else waits for the next frame to arrive.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            frame = self._buffer.latest_after(timestamp)
+            if frame is not None:
+                return frame
+            waiter = _Waiter(timestamp, loop, loop.create_future())
+            self._waiters.append(waiter)
+
+        try:
+            return await asyncio.wait_for(waiter.future, timeout)
+        finally:
+            with self._lock:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+
+    def _run(self) -> None:
+        try:
+            self._source.open()
+        except OSError as e:
+            self._logger.error("Capture could not be started: %s", e)
+            return
+
+        try:
+            while not self._stop.is_set():
+                image = self._source.read()
+                if image is None:
+                    self._statistics.failed += 1
+                    self._stop.wait(0.01)
+                    continue
+                self._push(Frame(time.monotonic(), image))
+        finally:
+            self._source.close()
+
+    def _push(self, frame: Frame) -> None:
+        with self._lock:
+            self._buffer.push(frame)
+            self._statistics.captured += 1
+            ready = [w for w in self._waiters if w.timestamp < frame.timestamp]
+            for waiter in ready:
+                self._waiters.remove(waiter)
+
+        for waiter in ready:
+            try:
+                waiter.loop.call_soon_threadsafe(_resolve, waiter.future, frame)
+            except RuntimeError:  # the loop of the waiter is already closed
+                pass
+
+
+def _resolve(future: asyncio.Future[Frame], frame: Frame) -> None:
+    if not future.done():
+        future.set_result(frame)
@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+"""Frame sources of the capture."""
+
+__copyright__ = "Copyright (c) 2025 HSLU PREN Team 2, FS25. All rights reserved."
+
+import os
+import time
+from abc import ABC, abstractmethod
+from typing import Optional
+
+import cv2
+
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".bmp")
+
+
+class FrameSource(ABC):
+    """Something that produces camera frames, one after another."""
+
+    def open(self) -> None:
+        """Prepare the source, called once from the capture thread."""
+
+    @abstractmethod
+    def read(self) -> Optional[cv2.typing.MatLike]:
+        """Block until the next frame is available, ``None`` if there is none."""
+
+    def close(self) -> None:
+        """Release the source."""
+
+
+class V4L2Source(FrameSource):
+    """A camera device, e.g. ``/dev/video0``."""
+
+    def __init__(
+        self, device: str | int, resolution: Optional[tuple[int, int]] = None
+    ) -> None:
+        self._device = device
+        self._resolution = resolution
+        self._capture: Optional[cv2.VideoCapture] = None  # pylint: disable=no-member
+
+    def open(self) -> None:
+        self._capture = cv2.VideoCapture(  # pylint: disable=no-member
+            self._device,
+            cv2.CAP_V4L2,  # pylint: disable=no-member
+        )
+        if not self._capture.isOpened():
+            raise OSError(f"Camera {self._device} could not be opened.")
+        # only keep the newest frame in the driver, we keep our own buffer
+        self._capture.set(cv2.CAP_PROP_BUFFERSIZE, 1)  # pylint: disable=no-member
+        if self._resolution is not None:
+            width, height = self._resolution
+            self._capture.set(cv2.CAP_PROP_FRAME_WIDTH, width)  # pylint: disable=no-member
+            self._capture.set(cv2.CAP_PROP_FRAME_HEIGHT, height)  # pylint: disable=no-member
+
+    def read(self) -> Optional[cv2.typing.MatLike]:
+        assert self._capture is not None, "Source is not open"
+        ok, frame = self._capture.read()
+        return frame if ok else None
+
+    def close(self) -> None:
+        if self._capture is not None:
+            self._capture.release()
+            self._capture = None
+
+
+class _PacedSource(FrameSource, ABC):
+    """A stand-in for a camera, hands out its frames at a camera like rate."""
+
+    def __init__(self, fps: float) -> None:
+        self._interval = 1 / fps
+        self._next_frame = 0.0
+
+    def read(self) -> Optional[cv2.typing.MatLike]:
+        delay = self._next_frame - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        self._next_frame = max(self._next_frame, time.monotonic()) + self._interval
+        return self._next()
+
+    @abstractmethod
+    def _next(self) -> Optional[cv2.typing.MatLike]:
+        """the next frame, without any pacing"""
+
+
+class ImageFilesSource(_PacedSource):
+    """A single image or a directory of images, repeated forever."""
+
+    def __init__(self, path: str, fps: float = 30.0) -> None:
+        super().__init__(fps)
+        if os.path.isdir(path):
+            self._paths = sorted(
+                os.path.join(path, name)
+                for name in os.listdir(path)
+                if name.lower().endswith(IMAGE_EXTENSIONS)
+            )
+        else:
+            self._paths = [path]
+        if not self._paths:
+            raise OSError(f"No images found in {path}.")
+        self._frames: list[cv2.typing.MatLike] = []
+        self._index = 0
+
+    def open(self) -> None:
+        # decode once up front, so a frame costs no more than a camera frame
+        self._frames = []
+        for path in self._paths:
+            frame = cv2.imread(path)  # pylint: disable=no-member
+            if frame is None:
+                raise OSError(f"File {path} could not be read.")
+            self._frames.append(frame)
+
+    def _next(self) -> Optional[cv2.typing.MatLike]:
+        frame = self._frames[self._index]
+        self._index = (self._index + 1) % len(self._frames)
+        return frame
+
+
+class VideoFileSource(_PacedSource):
+    """A video file, rewinds at the end."""
+
+    def __init__(self, path: str, fps: Optional[float] = None) -> None:
+        self._path = path
+        self._capture: Optional[cv2.VideoCapture] = None  # pylint: disable=no-member
+        self._fps = fps
+        super().__init__(fps or 30.0)
+
+    def open(self) -> None:
+        self._capture = cv2.VideoCapture(self._path)  # pylint: disable=no-member
+        if not self._capture.isOpened():
+            raise OSError(f"Video {self._path} could not be opened.")
+        if self._fps is None:
+            fps = self._capture.get(cv2.CAP_PROP_FPS)  # pylint: disable=no-member
+            if fps > 0:
+                self._interval = 1 / fps
+
+    def _next(self) -> Optional[cv2.typing.MatLike]:
+        assert self._capture is not None, "Source is not open"
+        ok, frame = self._capture.read()
+        if not ok:  # end of the video, start over
+            self._capture.set(cv2.CAP_PROP_POS_FRAMES, 0)  # pylint: disable=no-member
+            ok, frame = self._capture.read()
+        return frame if ok else None
+
+    def close(self) -> None:
+        if self._capture is not None:
+            self._capture.release()
+            self._capture = None
+
+
+def create_frame_source(
+    spec: str, resolution: Optional[tuple[int, int]] = None
+) -> FrameSource:
+    """
+    Create the source from a string: a device (``/dev/video0`` or ``0``),\n
+    an image, a directory of images or a video file.
+    """
+    if spec.isdigit():
+        return V4L2Source(int(spec), resolution)
+    if spec.startswith("/dev/"):
+        return V4L2Source(spec, resolution)
+    if os.path.isdir(spec) or spec.lower().endswith(IMAGE_EXTENSIONS):
+        return ImageFilesSource(spec)
+    return VideoFileSource(spec)
@@ -167,6 +167,19 @@ class Camera:
 
         return (x, y)
 
+    def compute_horizon_position(self) -> int:
+        """
+        Computes the image row of the horizon, nothing above it can be\n
+        on the floor. Same as ``compute_image_position`` for an object\n
+        infinitely far away.\n
+        - return    = (``int``) px height of the horizon\n
+        (negative if the horizon is above the image)\n
+        """
+        beta_diff = 90.0 - (self.angle - (self.vfov / 2))
+        return int(
+            round(self.image_height - (beta_diff / self.vfov * self.image_height))
+        )
+
     def _compute_pylon_distance(self, pylon: Pylon) -> float:
         """
         Computes the distance to a pylon based on its height the camera stats.
@@ -6,22 +6,36 @@ __copyright__ = "Copyright (c) 2025 HSLU PREN Team 2, FS25. All rights reserved.
 import logging
 import logging.config
 import asyncio
+import atexit
+import os
 from argparse import ArgumentParser, Namespace
+from pathlib import Path
 from typing import Awaitable, Callable, cast
 
 import uvloop  # pylint: disable=import-error
 from serial_asyncio import open_serial_connection
 
 from common.application import log_configuration
-from common.competition import create_dynamic_network
+from common.competition import DYNAMIC_NETWORK_FILE, create_dynamic_network
 from common.constants import VERSION
 from uart.protocol import UARTProtocol
 from uart.bus import UARTBus
+from uart.protocol_bus import open_protocol_bus
 from uart.mock.bus import UARTBus as MockUARTBus
+from uart.mock.replay_bus import ReplayUARTBus
+from uart.firmware_log import FirmwareLogSink
+from uart.recorder import SessionRecorder
 from ufo.engine import Engine
+from ufo.fleet import Fleet, NetworkTemplate
 from web.server import WebServer
 
 
+def _parse_vehicle(value: str) -> tuple[str, str]:
+    """vehicle name and bus url, the name defaults to the device name"""
+    name, _, url = value.rpartition("=")
+    return name or Path(url).name, url
+
+
 def _get_args(logger: logging.Logger) -> Namespace:
     """Parse command line arguments."""
     parser = ArgumentParser(description="PREN project FS25 HSLU Team 2")
@@ -32,6 +46,44 @@ def _get_args(logger: logging.Logger) -> Namespace:
     parser.add_argument(
         "--baudrate", type=int, default=115200, help="UART bus baudrate"
     )
+    parser.add_argument(
+        "--fleet",
+        type=_parse_vehicle,
+        nargs="+",
+        default=None,
+        metavar="[NAME=]URL",
+        help="Drive several vehicles, one UART bus each (web api per vehicle)",
+    )
+    parser.add_argument(
+        "--protocol-bus",
+        action="store_true",
+        default=False,
+        help="Parse the UART stream incrementally (asyncio.Protocol)",
+    )
+    parser.add_argument(
+        "--record",
+        type=Path,
+        default=None,
+        help="Record the UART session to this file",
+    )
+    parser.add_argument(
+        "--replay",
+        type=Path,
+        default=None,
+        help="Replay a recorded UART session instead of using the bus",
+    )
+    parser.add_argument(
+        "--replay-speed",
+        type=float,
+        default=1.0,
+        help="Replay speed factor, 0 replays as fast as possible",
+    )
+    parser.add_argument(
+        "--firmware-log",
+        type=Path,
+        default=None,
+        help="Write the firmware log messages to this rotating file",
+    )
     parser.add_argument("--port", type=int, default=8080, help="Debug web server port")
     parser.add_argument(
         "--demo", action="store_true", default=False, help="Run the demo mode"
@@ -44,30 +96,72 @@ def _get_args(logger: logging.Logger) -> Namespace:
         help="Run manual mode (for testing, disables autonomy)",
     )
     args = parser.parse_args()
+    if args.record and (args.demo or args.replay):
+        parser.error("--record needs a UART bus, not --demo or --replay")
     logger.debug("args: %s", args)
     return args
 
 
-async def create_and_start_bus(args: Namespace, logger: logging.Logger) -> UARTProtocol:
+def _vehicle_path(path: Path, vehicle: str | None) -> Path:
+    """one file per vehicle in fleet mode"""
+    return path if vehicle is None else path.with_name(f"{vehicle}-{path.name}")
+
+
+async def create_and_start_bus(
+    args: Namespace,
+    logger: logging.Logger,
+    url: str | None = None,
+    vehicle: str | None = None,
+) -> UARTProtocol:
     """create bus"""
     bus: UARTProtocol
+    url = url or args.bus
     if args.demo:
         logger.info("demo mode")
         bus = MockUARTBus()
+    elif args.replay:
+        logger.info("replaying %s", args.replay)
+        bus = ReplayUARTBus(args.replay, speed=args.replay_speed or None)
     else:
-        reader, writer = await open_serial_connection(
-            url=args.bus, baudrate=args.baudrate
-        )
-        logger.debug("connected to %s with baudrate %d", args.bus, args.baudrate)
-        bus = UARTBus(reader, writer)
+        # only a real bus is recorded
+        recorder = None
+        if args.record:
+            recorder = SessionRecorder(_vehicle_path(args.record, vehicle))
+            atexit.register(recorder.close)
+        if args.protocol_bus:
+            bus = await open_protocol_bus(url, args.baudrate, recorder=recorder)
+        else:
+            reader, writer = await open_serial_connection(
+                url=url, baudrate=args.baudrate
+            )
+            bus = UARTBus(reader, writer, recorder=recorder)
+        logger.debug("connected to %s with baudrate %d", url, args.baudrate)
     await bus.start()
     return bus
 
 
-async def init_web(engine: Engine, args: Namespace, logger: logging.Logger) -> None:
+async def init_web(
+    engine: Engine,
+    args: Namespace,
+    logger: logging.Logger,
+    url: str | None = None,
+    vehicle: str | None = None,
+) -> None:
     """Main async function."""
-    uart = await create_and_start_bus(args, logger)
+    uart = await create_and_start_bus(args, logger, url, vehicle)
     engine.init(uart, args.manual)
+    if args.firmware_log:
+        engine.receiver.log_sink = FirmwareLogSink(
+            _vehicle_path(args.firmware_log, vehicle),
+            name="uart.firmware" if vehicle is None else f"uart.firmware.{vehicle}",
+        )
+
+
+async def init_fleet(fleet: Fleet, args: Namespace, logger: logging.Logger) -> None:
+    """connect every vehicle of the fleet to its bus"""
+    for vehicle, (_, url) in zip(fleet, args.fleet):
+        logger.info("vehicle %s on %s", vehicle.name, url)
+        await init_web(vehicle.engine, args, logger, url, vehicle.name)
 
 
 async def demo(engine: Engine, args: Namespace, logger: logging.Logger) -> None:
@@ -102,11 +196,16 @@ async def demo(engine: Engine, args: Namespace, logger: logging.Logger) -> None:
 
 
 def _on_startup(
-    engine: Engine, args: Namespace, logger: logging.Logger
+    engine: Engine, args: Namespace, logger: logging.Logger, fleet: Fleet | None
 ) -> Callable[[web.Application], Awaitable[None]]:  # type: ignore # noqa: F821 # pylint: disable=undefined-variable
     async def _impl(_: web.Application) -> None:  # type: ignore # noqa: F821 # pylint: disable=undefined-variable
         """Startup handler."""
 
+        if fleet is not None:
+            logger.info("fleet mode, %d vehicles", len(fleet))
+            await init_fleet(fleet, args, logger)
+            return
+
         if args.demo:
             logger.info("demo mode")
             await demo(engine, args, logger)
@@ -117,6 +216,13 @@ def _on_startup(
     return _impl
 
 
+def _network_file_stamp() -> float | None:
+    """rebuild the network template once the network file changed"""
+    if not os.path.exists(DYNAMIC_NETWORK_FILE):
+        return None
+    return os.path.getmtime(DYNAMIC_NETWORK_FILE)
+
+
 def main() -> None:
     """main"""
     logging.config.dictConfig(log_configuration())
@@ -127,9 +233,17 @@ def main() -> None:
 
     asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())  # type: ignore
 
-    engine = Engine(create_dynamic_network)
-    server = WebServer(engine)
-    server.on_startup.append(_on_startup(engine, args, logger))
+    fleet = None
+    if args.fleet:
+        fleet = Fleet(NetworkTemplate(create_dynamic_network, _network_file_stamp))
+        for name, _ in args.fleet:
+            fleet.add(name)
+        # the first vehicle also answers the unprefixed api
+        engine = next(iter(fleet)).engine
+    else:
+        engine = Engine(create_dynamic_network)
+    server = WebServer(engine, fleet)
+    server.on_startup.append(_on_startup(engine, args, logger, fleet))
     server.run(args.port)
 
     logger.info("[main] exit")
@@ -3,6 +3,8 @@
 
 __copyright__ = "Copyright (c) 2025 HSLU PREN Team 2, FS25. All rights reserved."
 
+from typing import Any, Callable
+
 from common.constants import CLEAR_OBSTACLE_PENALTY_WEIGHT
 from .node import Node
 
@@ -14,9 +16,22 @@ class Edge:
     obstructed: bool = False
     visited: bool = False
 
+    _observers: tuple[Callable[[], None], ...] = ()
+
     def __init__(self, *nodes: Node) -> None:
         self.nodes = nodes
 
+    def observe(self, observer: Callable[[], None]) -> None:
+        """Call ``observer`` whenever ``disabled`` or ``obstructed`` changes"""
+        self._observers = (*self._observers, observer)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        changed = name in ("disabled", "obstructed") and getattr(self, name) != value
+        super().__setattr__(name, value)
+        if changed:
+            for observer in self._observers:
+                observer()
+
     @property
     def distance(self) -> float:
         """Get the distance between the two nodes"""
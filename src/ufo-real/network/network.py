@@ -3,20 +3,79 @@
 
 __copyright__ = "Copyright (c) 2025 HSLU PREN Team 2, FS25. All rights reserved."
 
-from typing import Callable
+import itertools
+from typing import Any, Callable
 from .edge import Edge
 from .node import Node, NodeType, NodeLabel
 
 
-class Network:
-    """Network of nodes and edges"""
+class Network:  # pylint: disable=too-many-instance-attributes
+    """
+    Network of nodes and edges\n
+    The nodes, labels, node pairs and neighbours are indexed when an edge\n
+    is added, the lookups do not depend on the size of the network.\n
+    ``version`` grows whenever an edge is added or a node or edge is\n
+    disabled, enabled or obstructed, ``uid`` is unique per instance (copies\n
+    included): together they identify the state of the weights.
+    """
+
+    _uids = itertools.count()
 
     def __init__(self) -> None:
+        self._uid = next(self._uids)
+        self._version = 0
         self._edges: set[Edge] = set()
+        self._nodes: set[Node] = set()
+        self._by_label: dict[NodeLabel, Node] = {}
+        self._by_pair: dict[frozenset[Node], Edge] = {}
+        self._adjacency: dict[Node, list[tuple[Node, Edge]]] = {}
+        self._start: Node | None = None
+        self._end: set[Node] = set()
 
     def add_edge(self, edge: Edge) -> None:
         """Add an edge to the network"""
         self._edges.add(edge)
+        pair = frozenset(edge.nodes)
+        if pair in self._by_pair:
+            return
+        for node in edge.nodes:
+            self._add_node(node)
+        node1, node2 = edge.nodes
+        self._by_pair[pair] = edge
+        edge.observe(self._changed)
+        self._changed()
+        self._adjacency[node1].append((node2, edge))
+        self._adjacency[node2].append((node1, edge))
+
+    def _add_node(self, node: Node) -> None:
+        if node in self._nodes:
+            return
+        self._nodes.add(node)
+        self._by_label.setdefault(node.label, node)
+        self._adjacency[node] = []
+        node.observe(self._changed)
+        if node.node_type == NodeType.START and self._start is None:
+            self._start = node
+        elif node.node_type == NodeType.END:
+            self._end.add(node)
+
+    def _changed(self) -> None:
+        self._version += 1
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        # copies get their own uid, their state diverges from the original
+        self.__dict__.update(state)
+        self._uid = next(self._uids)
+
+    @property
+    def uid(self) -> int:
+        """Unique id of the network"""
+        return self._uid
+
+    @property
+    def version(self) -> int:
+        """Counter of the changes to the weights of the network"""
+        return self._version
 
     @property
     def edges(self) -> set[Edge]:
@@ -26,35 +85,38 @@ class Network:
     @property
     def nodes(self) -> set[Node]:
         """Get all nodes of the network"""
-        nodes: set[Node] = set()
-        for edge in self._edges:
-            nodes.add(edge.nodes[0])
-            nodes.add(edge.nodes[1])
-        return nodes
+        return self._nodes
 
     @property
     def start(self) -> Node:
         """Get the start node of the network"""
-        for node in self.nodes:
-            if node.node_type == NodeType.START:
-                return node
-        raise ValueError("Start node not found")
+        if self._start is None:
+            raise ValueError("Start node not found")
+        return self._start
 
     @property
     def end(self) -> set[Node]:
         """Get all end nodes of the network"""
-        return {node for node in self.nodes if node.node_type == NodeType.END}
+        return self._end
+
+    def neighbours(self, node: Node) -> list[tuple[Node, Edge]]:
+        """Get the neighbours of a node and the edges leading to them"""
+        return self._adjacency.get(node, [])
 
     def get_edge(self, node1: Node, node2: Node) -> Edge:
         """Get an edge between two nodes"""
-        for edge in self._edges:
-            if node1 in edge.nodes and node2 in edge.nodes:
-                return edge
-        raise ValueError("Edge not found")
+        try:
+            return self._by_pair[frozenset((node1, node2))]
+        except KeyError:
+            raise ValueError("Edge not found") from None
 
     def get_node_by_label(self, node: NodeLabel) -> Node:
         """Get a node by label"""
-        return next(n for n in self.nodes if n.label == node)
+        try:
+            return self._by_label[node]
+        except KeyError:
+            # same as the former scan with next()
+            raise StopIteration(node) from None
 
     def get_edge_by_label(self, node1: NodeLabel, node2: NodeLabel) -> Edge:
         """Get an edge between two nodes by label"""
@@ -63,7 +125,7 @@ class Network:
         )
 
     def __str__(self) -> str:
-        return f"Network({len(self._edges)} edges, {len(self.nodes)} nodes)"
+        return f"Network({len(self._edges)} edges, {len(self._nodes)} nodes)"
 
     def __repr__(self) -> str:
         return str(self)
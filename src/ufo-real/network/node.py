@@ -5,6 +5,7 @@ __copyright__ = "Copyright (c) 2025 HSLU PREN Team 2, FS25. All rights reserved.
 
 from dataclasses import dataclass
 from enum import StrEnum
+from typing import Any, Callable, cast
 
 
 class NodeType(StrEnum):
@@ -41,6 +42,20 @@ class Node:
     disabled: bool = False
     visited: bool = False
 
+    # not annotated, it is no field of the dataclass
+    _observers = cast(tuple[Callable[[], None], ...], ())
+
+    def observe(self, observer: Callable[[], None]) -> None:
+        """Call ``observer`` whenever ``disabled`` changes"""
+        self._observers = (*self._observers, observer)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        changed = name == "disabled" and getattr(self, name, value) != value
+        super().__setattr__(name, value)
+        if changed:
+            for observer in self._observers:
+                observer()
+
     def __str__(self) -> str:
         return f"Node({self.label})"
 
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+"""A* pathfinder module"""
+
+__copyright__ = "Copyright (c) 2025 HSLU PREN Team 2, FS25. All rights reserved."
+
+import heapq
+import itertools
+import math
+
+from common.constants import NODE_PENALTY_WEIGHT
+from network.node import Node
+from network.network import Network
+from .base_pathfinder import BasePathfinder
+
+
+class AStarPathfinder(BasePathfinder):
+    """
+    A* on the adjacency lists of the network, in pure Python\n
+    Same costs as DijkstraPathfinder: the edge weight plus the node penalty\n
+    for edges touching neither start nor end. The straight-line distance to\n
+    the end never exceeds the cost, the heuristic is admissible.
+    """
+
+    def find_path(  # pylint: disable=too-many-locals
+        self, network: Network, start: Node, end: Node
+    ) -> list[Node]:
+        self._validate(network, start, end)
+
+        start_end = (start, end)
+        distances = {start: 0.0}
+        previous: dict[Node, Node] = {}
+        closed: set[Node] = set()
+        counter = itertools.count()  # nodes do not compare
+        heap = [(self._heuristic(start, end), next(counter), start)]
+        while heap:
+            node = heapq.heappop(heap)[2]
+            if node in closed:
+                continue
+            if node == end:
+                break
+            closed.add(node)
+            for neighbour, edge in network.neighbours(node):
+                weight = edge.weight
+                if neighbour in closed or math.isinf(weight):
+                    continue
+                if node not in start_end and neighbour not in start_end:
+                    weight += NODE_PENALTY_WEIGHT
+                distance = distances[node] + weight
+                if distance < distances.get(neighbour, math.inf):
+                    distances[neighbour] = distance
+                    previous[neighbour] = node
+                    heapq.heappush(
+                        heap,
+                        (
+                            distance + self._heuristic(neighbour, end),
+                            next(counter),
+                            neighbour,
+                        ),
+                    )
+        else:
+            raise ValueError(f"No path to {end}")
+
+        path = self._walk_back(previous, start, end)
+        self._logger.debug("path to %s (%s): %s", end, distances[end], path)
+
+        return path
+
+    @staticmethod
+    def _walk_back(previous: dict[Node, Node], start: Node, end: Node) -> list[Node]:
+        path = [end]
+        while path[-1] != start:
+            path.append(previous[path[-1]])
+        path.reverse()
+        return path
+
+    @staticmethod
+    def _heuristic(node: Node, end: Node) -> float:
+        return math.hypot(node.x - end.x, node.y - end.y)
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""Memoizing pathfinder module"""
+
+__copyright__ = "Copyright (c) 2025 HSLU PREN Team 2, FS25. All rights reserved."
+
+import logging
+from collections import OrderedDict
+from collections.abc import Hashable
+from dataclasses import dataclass
+
+from network.node import Node
+from network.network import Network
+from .ipathfinder import IPathfinder
+
+
+@dataclass
+class PathCacheStatistics:
+    """Counters of the path cache"""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
+class CachedPathfinder(IPathfinder):
+    """
+    Remembers the last ``size`` paths of another pathfinder, keyed by the\n
+    network (uid and version), the pathfinder's ``cache_key``, start and\n
+    end: a replan without any change since the last plan returns the known\n
+    path.
+    """
+
+    def __init__(self, pathfinder: IPathfinder, size: int = 64) -> None:
+        self._pathfinder = pathfinder
+        self._size = size
+        self._paths: OrderedDict[tuple[int, int, Hashable, Node, Node], list[Node]] = (
+            OrderedDict()
+        )
+        self._statistics = PathCacheStatistics()
+        self._logger = logging.getLogger(self.__class__.__name__)
+
+    @property
+    def pathfinder(self) -> IPathfinder:
+        """The pathfinder asked on a miss"""
+        return self._pathfinder
+
+    @property
+    def statistics(self) -> PathCacheStatistics:
+        """Counters of the cache"""
+        return self._statistics
+
+    def cache_key(self) -> Hashable:
+        return self._pathfinder.cache_key()
+
+    def clear(self) -> None:
+        """Forget all paths"""
+        self._paths.clear()
+
+    def find_path(self, network: Network, start: Node, end: Node) -> list[Node]:
+        key = (network.uid, network.version, self._pathfinder.cache_key(), start, end)
+        path = self._paths.get(key)
+        if path is not None:
+            self._paths.move_to_end(key)
+            self._statistics.hits += 1
+            self._logger.debug("cached path to %s: %s", end, path)
+            return list(path)
+
+        self._statistics.misses += 1
+        path = self._pathfinder.find_path(network, start, end)
+        self._paths[key] = path
+        if len(self._paths) > self._size:
+            self._paths.popitem(last=False)
+            self._statistics.evictions += 1
+        return list(path)
@@ -0,0 +1,286 @@
+# -*- coding: utf-8 -*-
+"""Contingency pathfinder module"""
+
+__copyright__ = "Copyright (c) 2025 HSLU PREN Team 2, FS25. All rights reserved."
+
+import asyncio
+import heapq
+import itertools
+import math
+import time
+from collections.abc import Hashable
+from dataclasses import dataclass, field
+
+from common.constants import NODE_PENALTY_WEIGHT
+from network.edge import Edge
+from network.node import Node, NodeLabel
+from network.network import Network
+from .base_pathfinder import BasePathfinder
+from .ipathfinder import IPathfinder
+
+# a failed node or edge (the labels of its nodes), None = nothing failed
+type Failure = NodeLabel | frozenset[NodeLabel] | None
+# per node: cost to the target (with the node penalty on every edge) and next hop
+type Tree = dict[NodeLabel, tuple[float, NodeLabel | None]]
+
+
+def _pair(edge: Edge) -> frozenset[NodeLabel]:
+    return frozenset(node.label for node in edge.nodes)
+
+
+def _fingerprint(network: Network) -> frozenset[tuple[frozenset[NodeLabel], float]]:
+    return frozenset((_pair(edge), edge.distance) for edge in network.edges)
+
+
+@dataclass(frozen=True)
+class _Layout:
+    """what the table is built from, read on the loop, used on a thread"""
+
+    fingerprint: frozenset[tuple[frozenset[NodeLabel], float]]
+    nodes: list[NodeLabel]
+    targets: list[NodeLabel]
+    edges: list[tuple[NodeLabel, NodeLabel, float]]
+    disabled_nodes: frozenset[NodeLabel]
+    disabled_edges: frozenset[frozenset[NodeLabel]]
+    obstructed_edges: frozenset[frozenset[NodeLabel]]
+
+    @classmethod
+    def of(cls, network: Network) -> "_Layout":
+        """snapshot of the network"""
+        return cls(
+            _fingerprint(network),
+            [node.label for node in network.nodes],
+            [node.label for node in network.end],
+            [
+                (edge.nodes[0].label, edge.nodes[1].label, edge.weight)
+                for edge in network.edges
+            ],
+            frozenset(node.label for node in network.nodes if node.disabled),
+            frozenset(_pair(edge) for edge in network.edges if edge.disabled),
+            frozenset(_pair(edge) for edge in network.edges if edge.obstructed),
+        )
+
+
+@dataclass
+class ContingencyTable:
+    """Shortest paths to every target for every single failure"""
+
+    layout: _Layout
+    trees: dict[tuple[NodeLabel, Failure], Tree] = field(default_factory=dict)
+    build_seconds: float = 0.0
+
+    @property
+    def entries(self) -> int:
+        """number of stored (node, next hop) entries"""
+        return sum(len(tree) for tree in self.trees.values())
+
+
+@dataclass
+class ContingencyStatistics:
+    """Counters of the contingency pathfinder"""
+
+    hits: int = 0
+    fallbacks: int = 0  # live searches
+    builds: int = 0
+
+
+def _tree(
+    adjacency: dict[NodeLabel, list[tuple[NodeLabel, float]]],
+    target: NodeLabel,
+    failure: Failure,
+) -> Tree:
+    """Dijkstra from the target, the failed node or edge left out"""
+    failed_edge = failure if isinstance(failure, frozenset) else frozenset()
+    tree: Tree = {target: (0.0, None)}
+    counter = itertools.count()
+    heap = [(0.0, next(counter), target)]
+    done: set[NodeLabel] = set()
+    while heap:
+        cost, _, label = heapq.heappop(heap)
+        if label in done:
+            continue
+        done.add(label)
+        for neighbour, weight in adjacency[label]:
+            if neighbour == failure or (
+                label in failed_edge and neighbour in failed_edge
+            ):
+                continue
+            if cost + weight < tree.get(neighbour, (math.inf, None))[0]:
+                tree[neighbour] = (cost + weight, label)
+                heapq.heappush(heap, (cost + weight, next(counter), neighbour))
+    return tree
+
+
+def build_table(layout: _Layout) -> ContingencyTable:
+    """Build the table of a network snapshot, takes O(targets·(V+E)) searches"""
+    started = time.perf_counter()
+    adjacency: dict[NodeLabel, list[tuple[NodeLabel, float]]] = {
+        label: [] for label in layout.nodes
+    }
+    for label1, label2, weight in layout.edges:
+        if math.isinf(weight):
+            continue
+        adjacency[label1].append((label2, weight + NODE_PENALTY_WEIGHT))
+        adjacency[label2].append((label1, weight + NODE_PENALTY_WEIGHT))
+
+    failures: list[Failure] = [None]
+    failures += [label for label in layout.nodes if label not in layout.disabled_nodes]
+    failures += [
+        pair
+        for pair in (frozenset((label1, label2)) for label1, label2, _ in layout.edges)
+        if pair not in layout.disabled_edges
+    ]
+    table = ContingencyTable(layout)
+    for target in layout.targets:
+        for failure in failures:
+            if failure != target:
+                table.trees[target, failure] = _tree(adjacency, target, failure)
+    table.build_seconds = time.perf_counter() - started
+    return table
+
+
+class ContingencyPathfinder(BasePathfinder):  # pylint: disable=too-many-instance-attributes
+    """
+    Looks the path up in a table of the shortest paths to every target for\n
+    every single failed node or edge, built from the network in its state\n
+    at START. Once more than one element failed, an obstruction changed or\n
+    the table is not (yet) built for the network, the ``live`` pathfinder\n
+    searches instead, as well as when its costs depend on more than the\n
+    network (``cache_key``), the table does not know them.
+    """
+
+    def __init__(self, live: IPathfinder) -> None:
+        super().__init__()
+        self.live = live
+        self._table: ContingencyTable | None = None
+        self._building: asyncio.Task[None] | None = None
+        self._statistics = ContingencyStatistics()
+        # per network: uid -> layout matches the table
+        self._matches: tuple[int, bool] | None = None
+        # per network state: (uid, version) -> failures, None = unusable
+        self._failures: tuple[tuple[int, int], list[Failure] | None] | None = None
+
+    @property
+    def table(self) -> ContingencyTable | None:
+        """The table, None until built"""
+        return self._table
+
+    @property
+    def statistics(self) -> ContingencyStatistics:
+        """Counters of the pathfinder"""
+        return self._statistics
+
+    def build(self, network: Network) -> ContingencyTable:
+        """Build the table of the network in its current state"""
+        self._set_table(build_table(_Layout.of(network)))
+        assert self._table is not None
+        return self._table
+
+    def schedule(self, network: Network) -> None:
+        """Build the table in the background, unless already built for it"""
+        layout = _Layout.of(network)
+        if self._table is not None and self._table.layout == layout:
+            return
+        if self._building is not None and not self._building.done():
+            self._building.cancel()
+        self._building = asyncio.create_task(self._build_in_background(layout))
+
+    async def _build_in_background(self, layout: _Layout) -> None:
+        self._set_table(await asyncio.to_thread(build_table, layout))
+
+    def _set_table(self, table: ContingencyTable) -> None:
+        self._table = table
+        self._matches = None
+        self._failures = None
+        self._statistics.builds += 1
+        self._logger.info(
+            "Contingency table of %d paths built in %.1f ms",
+            len(table.trees),
+            table.build_seconds * 1e3,
+        )
+
+    def cache_key(self) -> Hashable:
+        return self.live.cache_key()
+
+    def find_path(self, network: Network, start: Node, end: Node) -> list[Node]:
+        self._validate(network, start, end)
+        path = None
+        if self.live.cache_key() is None:
+            path = self._look_up(network, start, end)
+        if path is None:
+            self._statistics.fallbacks += 1
+            return self.live.find_path(network, start, end)
+        self._statistics.hits += 1
+        self._logger.debug("contingency path to %s: %s", end, path)
+        return path
+
+    def _look_up(self, network: Network, start: Node, end: Node) -> list[Node] | None:
+        if start == end:
+            return [start]
+        if self._table is None or not self._matches_table(network, self._table):
+            return None
+        failures = self._current_failures(network, self._table.layout)
+        if failures is None or len(failures) > 1:
+            return None
+        tree = self._table.trees.get((end.label, failures[0] if failures else None))
+        if tree is None:
+            return None
+        return self._walk(network, tree, start, end)
+
+    @staticmethod
+    def _walk(
+        network: Network, tree: Tree, start: Node, end: Node
+    ) -> list[Node] | None:
+        # the first and the last edge carry no node penalty, pick the first
+        # hop by the real cost, the tree covers the remaining path
+        best_cost = math.inf
+        best_hop: Node | None = None
+        for neighbour, edge in network.neighbours(start):
+            weight = edge.weight
+            if math.isinf(weight) or neighbour.label not in tree:
+                continue
+            if neighbour == end:
+                cost = weight
+            else:
+                cost = weight + tree[neighbour.label][0] - NODE_PENALTY_WEIGHT
+            if cost < best_cost:
+                best_cost, best_hop = cost, neighbour
+        if best_hop is None:
+            return None
+
+        path = [start, best_hop]
+        hop = tree[best_hop.label][1]
+        while hop is not None:
+            path.append(network.get_node_by_label(hop))
+            hop = tree[hop][1]
+        return path
+
+    def _matches_table(self, network: Network, table: ContingencyTable) -> bool:
+        if self._matches is None or self._matches[0] != network.uid:
+            matches = _fingerprint(network) == table.layout.fingerprint
+            self._matches = (network.uid, matches)
+        return self._matches[1]
+
+    def _current_failures(
+        self, network: Network, layout: _Layout
+    ) -> list[Failure] | None:
+        """elements failed since the table was built, None if unusable"""
+        state = (network.uid, network.version)
+        if self._failures is not None and self._failures[0] == state:
+            return self._failures[1]
+
+        disabled_nodes = {node.label for node in network.nodes if node.disabled}
+        disabled_edges = {_pair(edge) for edge in network.edges if edge.disabled}
+        obstructed_edges = {_pair(edge) for edge in network.edges if edge.obstructed}
+        failures: list[Failure] | None = None
+        if (
+            obstructed_edges == layout.obstructed_edges
+            and layout.disabled_nodes <= disabled_nodes
+            and layout.disabled_edges <= disabled_edges
+        ):
+            failures = [
+                *(disabled_nodes - layout.disabled_nodes),
+                *(disabled_edges - layout.disabled_edges),
+            ]
+        self._failures = (state, failures)
+        return failures
@@ -16,14 +16,16 @@ class DijkstraPathfinder(BasePathfinder):
     """Pathfinder: Dijkstra+ Pro Max Ultra"""
 
     def _create_adjacency_matrix(
-        self, network: Network, start_end: tuple[Node, Node]
+        self,
+        network: Network,
+        index: dict[Node, int],
+        start_end: tuple[Node, Node],
     ) -> list[list[float]]:
-        nodes = list(network.nodes)
-        matrix = [[0.0 for _ in range(len(nodes))] for _ in range(len(nodes))]
+        matrix = [[0.0 for _ in range(len(index))] for _ in range(len(index))]
 
         for edge in network.edges:
-            i = nodes.index(edge.nodes[0])
-            j = nodes.index(edge.nodes[1])
+            i = index[edge.nodes[0]]
+            j = index[edge.nodes[1]]
 
             weight = edge.weight
 
@@ -39,10 +41,11 @@ class DijkstraPathfinder(BasePathfinder):
         self._validate(network, start, end)
 
         nodes = list(network.nodes)
-        istart = nodes.index(start)
-        iend = nodes.index(end)
+        index = {node: i for i, node in enumerate(nodes)}
+        istart = index[start]
+        iend = index[end]
 
-        adj_matrix = self._create_adjacency_matrix(network, (start, end))
+        adj_matrix = self._create_adjacency_matrix(network, index, (start, end))
         dist_matrix, predecessors = dijkstra(
             csr_array(adj_matrix), directed=False, return_predecessors=True
         )
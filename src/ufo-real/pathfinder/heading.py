@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+"""Heading-aware pathfinder module"""
+
+__copyright__ = "Copyright (c) 2025 HSLU PREN Team 2, FS25. All rights reserved."
+
+import heapq
+import itertools
+import math
+from collections.abc import Hashable, Sequence
+from dataclasses import dataclass
+from typing import Callable
+
+from common.constants import NODE_PENALTY_WEIGHT, SPEED_M_PER_S
+from common.helper import Math
+from network.node import Node
+from network.network import Network
+from .base_pathfinder import BasePathfinder
+
+# search state: the node and the node the vehicle came from (None = start)
+type _State = tuple[Node, Node | None]
+
+
+@dataclass(frozen=True)
+class TurnCostModel:
+    """
+    Seconds a turn on a node takes, including the ALIGNED handshake:\n
+    ``base + per_degree * |angle|``. The defaults hold until calibrated.
+    """
+
+    base: float = 0.5
+    per_degree: float = 0.005
+
+    def __call__(self, angle: float) -> float:
+        return self.base + self.per_degree * abs(angle)
+
+    @classmethod
+    def fit(cls, timings: Sequence[tuple[float, float]]) -> "TurnCostModel | None":
+        """
+        Least squares fit to measured (angle in degrees, seconds) turns,
+        None without any timing, only the base with a single angle
+        """
+        if not timings:
+            return None
+        angles = [abs(angle) for angle, _ in timings]
+        seconds = [second for _, second in timings]
+        mean_angle = sum(angles) / len(angles)
+        mean_seconds = sum(seconds) / len(seconds)
+        variance = sum((angle - mean_angle) ** 2 for angle in angles)
+        per_degree = cls.per_degree
+        if variance > 0:
+            covariance = sum(
+                (angle - mean_angle) * (second - mean_seconds)
+                for angle, second in zip(angles, seconds)
+            )
+            per_degree = max(0.0, covariance / variance)
+        return cls(max(0.0, mean_seconds - per_degree * mean_angle), per_degree)
+
+
+class HeadingAwarePathfinder(BasePathfinder):
+    """
+    Dijkstra over (node, incoming heading) states: besides the costs of\n
+    DijkstraPathfinder every node the vehicle leaves adds the time of the\n
+    turn towards the next node, as ``Ufo.turn_on_node`` would turn. The\n
+    turn model is fitted again whenever the samples of ``turn_timings`` change,\n
+    ``heading_provider`` tells the heading of the vehicle at the start.
+    """
+
+    def __init__(
+        self,
+        model: Callable[[float], float] | None = None,
+        *,
+        heading_provider: Callable[[], float | None] = lambda: None,
+        turn_timings: Callable[[], list[tuple[float, float]]] = list,
+    ) -> None:
+        super().__init__()
+        self.model = model or TurnCostModel()
+        self.heading_provider = heading_provider
+        self.turn_timings = turn_timings
+        self._timings_used: list[tuple[float, float]] = []
+
+    def cache_key(self) -> Hashable:
+        self._calibrate()
+        return (self.heading_provider(), self.model)
+
+    def _calibrate(self) -> None:
+        if not isinstance(self.model, TurnCostModel):
+            return  # a function given by the caller
+        # compare the samples, not their number: once the rolling windows
+        # of the round-trip tracker are full, new samples replace old ones
+        timings = self.turn_timings()
+        if timings == self._timings_used:
+            return
+        self._timings_used = list(timings)
+        model = TurnCostModel.fit(timings)
+        if model is not None and model != self.model:
+            self._logger.info("Turn cost model calibrated: %s", model)
+            self.model = model
+
+    def _turn_weight(
+        self, heading: float | None, on_node: Node, to_node: Node
+    ) -> float:
+        if heading is None:
+            return 0.0
+        new_angle = Math.calculate_angle_deg(on_node, to_node)
+        angle = new_angle - Math.optimise_for_next_angle(heading, new_angle)
+        return self.model(angle) * SPEED_M_PER_S
+
+    def find_path(  # pylint: disable=too-many-locals
+        self, network: Network, start: Node, end: Node
+    ) -> list[Node]:
+        self._validate(network, start, end)
+        self._calibrate()
+        if start == end:
+            return [start]
+
+        heading = self.heading_provider()
+        initial: _State = (start, None)
+        costs = {initial: 0.0}
+        previous: dict[_State, _State] = {}
+        counter = itertools.count()  # states do not compare
+        heap = [(0.0, next(counter), initial)]
+        while heap:
+            cost, _, state = heapq.heappop(heap)
+            if cost > costs[state]:
+                continue
+            node, came_from = state
+            if node == end:
+                break
+            node_heading = (
+                heading
+                if came_from is None
+                else Math.calculate_angle_deg(came_from, node)
+            )
+            for neighbour, edge in network.neighbours(node):
+                weight = edge.weight
+                if math.isinf(weight):
+                    continue
+                if node not in (start, end) and neighbour not in (start, end):
+                    weight += NODE_PENALTY_WEIGHT
+                weight += self._turn_weight(node_heading, node, neighbour)
+                successor = (neighbour, node)
+                if cost + weight < costs.get(successor, math.inf):
+                    costs[successor] = cost + weight
+                    previous[successor] = state
+                    heapq.heappush(heap, (cost + weight, next(counter), successor))
+        else:
+            raise ValueError(f"No path to {end}")
+
+        path = [state]
+        while path[-1] != initial:
+            path.append(previous[path[-1]])
+        node_path = [node for node, _ in reversed(path)]
+        self._logger.debug("path to %s (%.2f): %s", end, costs[state], node_path)
+
+        return node_path
@@ -4,6 +4,7 @@
 __copyright__ = "Copyright (c) 2025 HSLU PREN Team 2, FS25. All rights reserved."
 
 from abc import ABC, abstractmethod
+from collections.abc import Hashable
 
 from network.node import Node
 from network.network import Network
@@ -23,3 +24,12 @@ class IPathfinder(ABC):
         :param end: The end node to search for
         :return: The path from start to end
         """
+
+    def cache_key(self) -> Hashable:
+        """
+        State besides the network the paths depend on (e.g. a cost model),
+        paths are only reused while it stays the same
+
+        :return: None if the paths only depend on the network
+        """
+        return None
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+"""Pathfinder registry module"""
+
+__copyright__ = "Copyright (c) 2025 HSLU PREN Team 2, FS25. All rights reserved."
+
+from typing import Callable
+
+from .ipathfinder import IPathfinder
+
+
+def _a_star() -> IPathfinder:
+    from .a_star import AStarPathfinder  # pylint: disable=import-outside-toplevel
+
+    return AStarPathfinder()
+
+
+def _dijkstra() -> IPathfinder:
+    # scipy is only imported once a Dijkstra pathfinder is asked for
+    from .dijkstra import DijkstraPathfinder  # pylint: disable=import-outside-toplevel
+
+    return DijkstraPathfinder()
+
+
+def _heading() -> IPathfinder:
+    from .heading import HeadingAwarePathfinder  # pylint: disable=import-outside-toplevel
+
+    return HeadingAwarePathfinder()
+
+
+def _sparse_dijkstra() -> IPathfinder:
+    from .sparse_dijkstra import (  # pylint: disable=import-outside-toplevel
+        SparseDijkstraPathfinder,
+    )
+
+    return SparseDijkstraPathfinder()
+
+
+PATHFINDERS: dict[str, Callable[[], IPathfinder]] = {
+    "a_star": _a_star,
+    "dijkstra": _dijkstra,
+    "heading": _heading,
+    "sparse_dijkstra": _sparse_dijkstra,
+}
+
+
+def create_pathfinder(name: str) -> IPathfinder:
+    """Create the pathfinder registered as ``name``"""
+    if name not in PATHFINDERS:
+        raise ValueError(f"Unknown pathfinder: {name}")
+    return PATHFINDERS[name]()
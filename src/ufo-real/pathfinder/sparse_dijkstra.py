@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+"""Sparse single-source Dijkstra pathfinder module"""
+
+__copyright__ = "Copyright (c) 2025 HSLU PREN Team 2, FS25. All rights reserved."
+
+import weakref
+
+import numpy as np
+import numpy.typing as npt
+from scipy.sparse import csr_array  # type: ignore
+from scipy.sparse.csgraph import dijkstra  # type: ignore
+
+from common.constants import NODE_PENALTY_WEIGHT
+from network.edge import Edge
+from network.node import Node
+from network.network import Network
+from .base_pathfinder import BasePathfinder
+
+_NO_PREDECESSOR = -9999  # scipy's marker for unreachable nodes
+
+
+class _Structure:  # pylint: disable=too-few-public-methods,too-many-instance-attributes
+    """CSR layout of a network, built once per network"""
+
+    def __init__(self, network: Network) -> None:
+        self.nodes = list(network.nodes)
+        self.index = {node: i for i, node in enumerate(self.nodes)}
+        self.edges: list[Edge] = []
+        edge_index: dict[int, int] = {}
+        indptr = [0]
+        indices: list[int] = []
+        slots: list[int] = []  # data position -> edge
+        for node in self.nodes:
+            for neighbour, edge in network.neighbours(node):
+                if id(edge) not in edge_index:
+                    edge_index[id(edge)] = len(self.edges)
+                    self.edges.append(edge)
+                indices.append(self.index[neighbour])
+                slots.append(edge_index[id(edge)])
+            indptr.append(len(indices))
+        self.edge_index = edge_index
+        self.edge_count = len(network.edges)
+        self.version: int | None = None  # of the network when ``base`` was read
+        self.base = np.zeros(len(self.edges))
+        self.slots = np.array(slots, dtype=np.intp)
+        self.data = np.zeros(len(slots))
+        self.graph = csr_array(
+            (self.data, np.array(indices, dtype=np.int32), np.array(indptr)),
+            shape=(len(self.nodes), len(self.nodes)),
+        )
+        # csr_array may copy, patch the array it really uses
+        self.data = self.graph.data
+
+
+class SparseDijkstraPathfinder(BasePathfinder):
+    """
+    Dijkstra from the start node only, on a CSR graph cached between calls\n
+    The node order and the CSR layout are kept until the network (or its\n
+    number of edges) changes, a plan only patches the weights that changed\n
+    since the last one, the edges are only read again once the network\n
+    version changed. Finds the same paths as DijkstraPathfinder.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._network: weakref.ref[Network] | None = None
+        self._structure: _Structure | None = None
+
+    def _get_structure(self, network: Network) -> _Structure:
+        if (
+            self._structure is None
+            or self._network is None
+            or self._network() is not network
+            or self._structure.edge_count != len(network.edges)
+        ):
+            self._logger.debug("Building the CSR graph of %s", network)
+            self._structure = _Structure(network)
+            self._network = weakref.ref(network)
+        return self._structure
+
+    def _weights(
+        self, network: Network, structure: _Structure, start_end: tuple[Node, Node]
+    ) -> npt.NDArray[np.float64]:
+        if structure.version != network.version:
+            structure.base = np.fromiter(
+                (edge.weight for edge in structure.edges),
+                dtype=np.float64,
+                count=len(structure.edges),
+            )
+            structure.version = network.version
+        weights = structure.base + NODE_PENALTY_WEIGHT
+        # no penalty for the edges leaving the start or reaching the end
+        touching = {
+            structure.edge_index[id(edge)]
+            for node in start_end
+            for _, edge in network.neighbours(node)
+        }
+        weights[list(touching)] -= NODE_PENALTY_WEIGHT
+        return weights
+
+    def find_path(self, network: Network, start: Node, end: Node) -> list[Node]:
+        self._validate(network, start, end)
+
+        structure = self._get_structure(network)
+        data = self._weights(network, structure, (start, end))[structure.slots]
+        changed = np.flatnonzero(data != structure.data)
+        structure.data[changed] = data[changed]
+
+        istart = structure.index[start]
+        iend = structure.index[end]
+        distances, predecessors = dijkstra(
+            structure.graph,
+            directed=True,  # both directions are stored
+            indices=istart,
+            return_predecessors=True,
+        )
+        if predecessors[iend] == _NO_PREDECESSOR and iend != istart:
+            raise ValueError(f"No path to {end}")
+
+        path = [iend]
+        while path[-1] != istart:
+            path.append(int(predecessors[path[-1]]))
+
+        node_path = [structure.nodes[i] for i in reversed(path)]
+        self._logger.debug("path to %s (%s): %s", end, distances[iend], node_path)
+
+        return node_path
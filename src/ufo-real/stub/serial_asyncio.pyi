@@ -13,3 +13,14 @@ def open_serial_connection(url: Any, baudrate: Any) -> Awaitable[Any]:
     """
     _ = url, baudrate
     return Awaitable[None]  # type: ignore[return-value]
+
+def create_serial_connection(
+    loop: Any, protocol_factory: Any, *args: Any, **kwargs: Any
+) -> Awaitable[tuple[Any, Any]]:
+    """
+    This will only return ``None``, please double check your
+    imports if you see this message. It means you are using
+    a stub instead of the real thing.
+    """
+    _ = loop, protocol_factory, args, kwargs
+    return Awaitable[None]  # type: ignore[return-value]
@@ -4,9 +4,62 @@
 __copyright__ = "Copyright (c) 2025 HSLU PREN Team 2, FS25. All rights reserved."
 
 
+import itertools
 import logging
 import logging.config
+import random
+from typing import Callable, Iterator
+
+import pytest
 
 from common.application import log_configuration
+from common.competition import create_network
+from common.constants import NODE_PENALTY_WEIGHT
+from network.network import Network
+from network.node import Node
 
 logging.config.dictConfig(log_configuration())
+
+
+def _path_cost(network: Network, path: list[Node]) -> float:
+    start_end = (path[0], path[-1])
+    return sum(
+        network.get_edge(node1, node2).weight
+        + (0 if node1 in start_end or node2 in start_end else NODE_PENALTY_WEIGHT)
+        for node1, node2 in itertools.pairwise(path)
+    )
+
+
+def _fail_randomly(network: Network, rng: random.Random) -> Iterator[Network]:
+    edges = sorted(network.edges, key=str)
+    nodes = sorted(network.nodes, key=str)
+    for _ in range(50):
+        edge = rng.choice(edges)
+        if rng.random() < 0.5:
+            edge.obstructed = not edge.obstructed
+        else:
+            edge.disabled = not edge.disabled
+        node = rng.choice(nodes)
+        node.disabled = rng.random() < 0.2 and node not in network.end
+        yield network
+
+
+@pytest.fixture(name="network")
+def fixture_network() -> Network:
+    """the competition network"""
+    return create_network()
+
+
+@pytest.fixture(name="path_cost")
+def fixture_path_cost() -> Callable[[Network, list[Node]], float]:
+    """cost of a path like the pathfinders weigh it, no penalty at start and end"""
+    return _path_cost
+
+
+@pytest.fixture(name="failing_network")
+def fixture_failing_network(network: Network) -> Iterator[Network]:
+    """
+    the competition network after each of 50 random changes, edges and nodes
+    get disabled and obstructed in between
+    """
+    return _fail_randomly(network, random.Random(3))
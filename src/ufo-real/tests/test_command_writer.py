@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+"""uart command writer tests"""
+
+__copyright__ = "Copyright (c) 2025 HSLU PREN Team 2, FS25. All rights reserved."
+
+
+import asyncio
+
+import pytest
+
+from uart.command_writer import CommandWriter
+from uart.protocol import UARTCommand
+from uart.schema import encode_frame, get_codec
+
+
+class _Stream:
+    """records the writes and drains"""
+
+    def __init__(self) -> None:
+        self.writes: list[bytes] = []
+        self.drains = 0
+
+    def write(self, data: bytes) -> None:
+        """write"""
+        self.writes.append(data)
+
+    async def drain(self) -> None:
+        """drain"""
+        self.drains += 1
+
+
+def test_coalesce_and_priority() -> None:
+    """
+    Test that queued commands share one write and a stop jumps the queue
+    """
+    turn = get_codec(UARTCommand.TURN).pack(90, True)
+
+    async def _run() -> tuple[_Stream, CommandWriter]:
+        stream = _Stream()
+        writer = CommandWriter(stream.write, stream.drain)
+        await asyncio.gather(
+            writer.send(UARTCommand.TURN, turn),
+            writer.send(UARTCommand.FOLLOW_LINE),
+            writer.send(UARTCommand.SET_SPEED, b"\x00"),
+        )
+        writer.stop()
+        return stream, writer
+
+    stream, writer = asyncio.run(_run())
+
+    assert stream.writes == [
+        encode_frame(UARTCommand.SET_SPEED.value, b"\x00")
+        + encode_frame(UARTCommand.TURN.value, turn)
+        + encode_frame(UARTCommand.FOLLOW_LINE.value)
+    ]
+    assert stream.drains == 1
+    assert writer.statistics.sent == 3
+    assert writer.statistics.latency[UARTCommand.TURN].count == 1
+
+
+def test_collapse_speed() -> None:
+    """
+    Test that only the latest of the waiting speeds is sent
+    """
+
+    async def _run() -> tuple[_Stream, CommandWriter]:
+        stream = _Stream()
+        writer = CommandWriter(stream.write, stream.drain)
+        await asyncio.gather(
+            *(
+                writer.send(UARTCommand.SET_SPEED, bytes([speed]))
+                for speed in (10, 20, 30)
+            )
+        )
+        writer.stop()
+        return stream, writer
+
+    stream, writer = asyncio.run(_run())
+
+    assert stream.writes == [encode_frame(UARTCommand.SET_SPEED.value, bytes([30]))]
+    assert writer.statistics.collapsed == 2
+
+
+def test_stop_collapses_all_speeds() -> None:
+    """
+    Test that a stop replaces every speed already waiting, also when the
+    speeds are not collapsed among themselves
+    """
+
+    async def _run() -> tuple[_Stream, CommandWriter]:
+        stream = _Stream()
+        writer = CommandWriter(stream.write, stream.drain, collapse_speed=False)
+        await asyncio.gather(
+            *(
+                writer.send(UARTCommand.SET_SPEED, bytes([speed]))
+                for speed in (10, 20, 30, 0)
+            ),
+            writer.send(UARTCommand.FOLLOW_LINE),
+        )
+        writer.stop()
+        return stream, writer
+
+    stream, writer = asyncio.run(_run())
+
+    assert stream.writes == [
+        encode_frame(UARTCommand.SET_SPEED.value, b"\x00")
+        + encode_frame(UARTCommand.FOLLOW_LINE.value)
+    ]
+    assert writer.statistics.collapsed == 3
+    assert writer.statistics.sent == 2
+
+
+def test_write_failure() -> None:
+    """
+    Test that a failing write reaches the callers and the writer carries on
+    """
+    stream = _Stream()
+    failures = [ConnectionError("UART is not connected.")]
+
+    def _write(data: bytes) -> None:
+        if failures:
+            raise failures.pop()
+        stream.write(data)
+
+    async def _run() -> CommandWriter:
+        writer = CommandWriter(_write, stream.drain)
+        with pytest.raises(ConnectionError):
+            await writer.send(UARTCommand.FOLLOW_LINE)
+        await writer.send(UARTCommand.FOLLOW_LINE)
+        writer.stop()
+        return writer
+
+    writer = asyncio.run(_run())
+
+    assert writer.statistics.failed == 1
+    assert stream.writes == [encode_frame(UARTCommand.FOLLOW_LINE.value)]
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+"""contingency pathfinder tests"""
+
+__copyright__ = "Copyright (c) 2025 HSLU PREN Team 2, FS25. All rights reserved."
+
+import asyncio
+import copy
+import itertools
+from typing import Callable
+
+from common.competition import create_network
+from network.network import Network
+from network.node import Node, NodeLabel
+from pathfinder.a_star import AStarPathfinder
+from pathfinder.contingency import ContingencyPathfinder
+from pathfinder.dijkstra import DijkstraPathfinder
+
+
+def _check_all(
+    network: Network,
+    pathfinder: ContingencyPathfinder,
+    path_cost: Callable[[Network, list[Node]], float],
+) -> None:
+    dijkstra = DijkstraPathfinder()
+    for start, end in itertools.product(network.nodes, network.end):
+        if start.disabled:
+            continue
+        try:
+            expected = dijkstra.find_path(network, start, end)
+        except IndexError:  # no path
+            continue
+        path = pathfinder.find_path(network, start, end)
+        assert path[0] == start and path[-1] == end
+        assert all(network.get_edge(*pair) for pair in itertools.pairwise(path))
+        assert path_cost(network, path) == path_cost(network, expected)
+
+
+def test_single_failures(
+    network: Network, path_cost: Callable[[Network, list[Node]], float]
+) -> None:
+    """
+    Test the looked up paths against Dijkstra for every single failed node
+    and edge, from every node to every end
+    """
+    pathfinder = ContingencyPathfinder(AStarPathfinder())
+    pathfinder.build(network)
+
+    _check_all(copy.deepcopy(network), pathfinder, path_cost)
+    for label in NodeLabel:
+        if label in (NodeLabel.UNDEFINED, NodeLabel.START):
+            continue
+        failed = copy.deepcopy(network)
+        failed.get_node_by_label(label).disabled = True
+        _check_all(failed, pathfinder, path_cost)
+    for edge in network.edges:
+        failed = copy.deepcopy(network)
+        failed.get_edge(*edge.nodes).disabled = True
+        _check_all(failed, pathfinder, path_cost)
+
+    assert pathfinder.statistics.fallbacks == 0
+    assert pathfinder.statistics.hits > 0
+
+
+def test_fallback(network: Network) -> None:
+    """
+    Test that two failures, an obstruction or another layout search live
+    """
+    pathfinder = ContingencyPathfinder(AStarPathfinder())
+    b = network.get_node_by_label(NodeLabel.B)
+
+    pathfinder.find_path(network, network.start, b)
+    assert pathfinder.statistics.fallbacks == 1
+
+    pathfinder.build(network)
+    network.get_node_by_label(NodeLabel.X).disabled = True
+    network.get_node_by_label(NodeLabel.Z).disabled = True
+    path = pathfinder.find_path(network, network.start, b)
+    assert [node.label for node in path] == [
+        NodeLabel.START,
+        NodeLabel.W,
+        NodeLabel.A,
+        NodeLabel.B,
+    ]
+    assert pathfinder.statistics.fallbacks == 2
+
+    network.get_node_by_label(NodeLabel.Z).disabled = False
+    pathfinder.find_path(network, network.start, b)
+    assert pathfinder.statistics.hits == 1
+
+    network.get_edge_by_label(NodeLabel.X, NodeLabel.Y).obstructed = True
+    pathfinder.find_path(network, network.start, b)
+    assert pathfinder.statistics.fallbacks == 3
+
+    other = create_network()
+    other.get_node_by_label(NodeLabel.W).x += 1
+    pathfinder.find_path(other, other.start, other.get_node_by_label(NodeLabel.B))
+    assert pathfinder.statistics.fallbacks == 4
+
+
+def test_background_build() -> None:
+    """
+    Test that scheduling builds the table once per layout and state
+    """
+
+    async def _run() -> None:
+        pathfinder = ContingencyPathfinder(AStarPathfinder())
+        pathfinder.schedule(create_network())
+        for _ in range(100):
+            if pathfinder.table is not None:
+                break
+            await asyncio.sleep(0.01)
+        assert pathfinder.table is not None
+        assert pathfinder.table.entries > 0
+
+        pathfinder.schedule(create_network())
+        await asyncio.sleep(0.1)
+        assert pathfinder.statistics.builds == 1
+
+    asyncio.run(_run())
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+"""uart event dispatcher tests"""
+
+__copyright__ = "Copyright (c) 2025 HSLU PREN Team 2, FS25. All rights reserved."
+
+
+import asyncio
+
+from uart.dispatcher import CallT, DispatchOrder, EventDispatcher
+from uart.protocol import UARTEvent
+
+
+def test_slow_subscriber_does_not_block() -> None:
+    """
+    Test that a slow handler neither blocks dispatching nor other subscribers
+    """
+
+    async def _run() -> list[str]:
+        dispatcher = EventDispatcher(latency_budget=0.05)
+        calls: list[str] = []
+
+        async def _slow() -> None:
+            await asyncio.sleep(0.2)
+            calls.append("slow")
+
+        async def _fast() -> None:
+            calls.append("fast")
+
+        dispatcher.dispatch("slow", UARTEvent.NO_LINE_FOUND, _slow)
+        dispatcher.dispatch("fast", UARTEvent.NO_LINE_FOUND, _fast)
+        assert not calls  # nothing ran inside dispatch
+        await asyncio.sleep(0.3)
+        assert dispatcher.statistics["slow"].slow == 1
+        dispatcher.stop()
+        return calls
+
+    assert asyncio.run(_run()) == ["fast", "slow"]
+
+
+def test_sequential_order_and_overflow() -> None:
+    """
+    Test that a subscriber sees its events in order and a full queue drops the oldest
+    """
+
+    async def _run() -> tuple[list[int], int]:
+        dispatcher = EventDispatcher(order=DispatchOrder.SEQUENTIAL, max_queue=3)
+        seen: list[int] = []
+
+        def _call(value: int) -> CallT:
+            async def _impl() -> None:
+                await asyncio.sleep(0.01)
+                seen.append(value)
+
+            return _impl
+
+        for value in range(5):
+            dispatcher.dispatch("subscriber", UARTEvent.POINT_REACHED, _call(value))
+        await asyncio.sleep(0.2)
+        overflowed = dispatcher.statistics["subscriber"].overflowed
+        dispatcher.stop()
+        return seen, overflowed
+
+    seen, overflowed = asyncio.run(_run())
+
+    assert seen == [2, 3, 4]
+    assert overflowed == 2
+
+
+def test_concurrent_order() -> None:
+    """
+    Test that concurrent dispatch runs the handlers side by side
+    """
+
+    async def _run() -> float:
+        dispatcher = EventDispatcher(order=DispatchOrder.CONCURRENT)
+
+        async def _sleep() -> None:
+            await asyncio.sleep(0.1)
+
+        start = asyncio.get_running_loop().time()
+        for _ in range(5):
+            dispatcher.dispatch("subscriber", UARTEvent.LOG_MESSAGE, _sleep)
+        while dispatcher.queue_depth:
+            await asyncio.sleep(0.01)
+        return asyncio.get_running_loop().time() - start
+
+    assert asyncio.run(_run()) < 0.3
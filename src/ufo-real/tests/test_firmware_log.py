@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""firmware log sink tests"""
+
+__copyright__ = "Copyright (c) 2025 HSLU PREN Team 2, FS25. All rights reserved."
+
+
+import asyncio
+from pathlib import Path
+
+from uart.firmware_log import FirmwareLogLine, FirmwareLogSink
+from uart.mock.bus import UARTBus
+from uart.protocol import UARTEvent
+from uart.receiver import UARTReceiver
+from uart.schema import checksum
+
+
+def test_rate_limit_and_overflow(tmp_path: Path) -> None:
+    """
+    Test that a flood is queued raw, then rate limited and counted
+    """
+    path = tmp_path / "firmware.log"
+
+    async def _run() -> tuple[FirmwareLogSink, list[str]]:
+        sink = FirmwareLogSink(path, max_rate=10, burst=5, max_queue=50)
+        tailed: list[str] = []
+
+        async def _tail(line: FirmwareLogLine) -> None:
+            tailed.append(line.message)
+
+        sink.listeners.append(_tail)
+        for i in range(60):
+            sink.submit(f"line {i}\x00".encode())
+        assert sink.queue_depth == 50  # nothing decoded inline
+        await asyncio.sleep(0.05)
+        sink.stop()
+        return sink, tailed
+
+    sink, tailed = asyncio.run(_run())
+
+    assert sink.statistics.received == 60
+    assert sink.statistics.overflowed == 10
+    assert sink.statistics.written == len(tailed) == 5
+    assert sink.statistics.rate_limited == 45
+    assert tailed[0] == "line 0"
+    assert path.read_text(encoding="utf-8").count("DEBUG: line") == 5
+
+
+def test_receiver_hands_log_messages_to_the_sink() -> None:
+    """
+    Test that the receiver only queues the log messages
+    """
+
+    async def _run() -> list[str]:
+        bus = UARTBus()
+        receiver = UARTReceiver(bus)
+        receiver.log_sink = FirmwareLogSink()
+        # the mock bus takes everything between id and checksum as payload
+        payload = b"hello\x00"
+        await bus.mock_receive_message(
+            bytes([UARTEvent.LOG_MESSAGE.value])
+            + payload
+            + bytes([checksum(payload, UARTEvent.LOG_MESSAGE.value)])
+        )
+        assert receiver.log_sink.queue_depth == 1
+        await asyncio.sleep(0.01)
+        return [line.message for line in receiver.log_sink.recent]
+
+    assert asyncio.run(_run()) == ["hello"]
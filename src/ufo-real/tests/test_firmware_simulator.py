@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""uart firmware simulator tests"""
+
+__copyright__ = "Copyright (c) 2025 HSLU PREN Team 2, FS25. All rights reserved."
+
+
+import asyncio
+import os
+
+from serial_asyncio import open_serial_connection
+
+from uart.bus import UARTBus
+from uart.frame_parser import FrameParser
+from uart.mock.firmware_simulator import FirmwareSimulator, SimulatorConfig, open_pty
+from uart.protocol import UARTCommand, UARTEvent
+from uart.receiver import UARTReceiver
+from uart.schema import encode_frame
+from uart.sender import UARTSender
+
+
+def test_round_trip_over_pty() -> None:
+    """
+    Test that the production bus talks to the simulator over a pty
+    """
+
+    async def _run() -> list[tuple[UARTEvent, bytes]]:
+        master, slave, device = open_pty()
+        simulator = FirmwareSimulator(master, SimulatorConfig(delays={}, start_delay=0))
+        simulator.start()
+        reader, writer = await open_serial_connection(url=device, baudrate=115200)
+        bus = UARTBus(reader, writer)
+        await bus.start()
+        sender = UARTSender(bus)
+        receiver = UARTReceiver(bus)
+
+        received = [await receiver.wait_for(UARTEvent.START, 1.0)]
+        waiting = asyncio.create_task(receiver.wait_for(UARTEvent.ALIGNED, 1.0))
+        await sender.turn(90)
+        received.append(await waiting)
+        waiting = asyncio.create_task(receiver.wait_for(UARTEvent.LOG_MESSAGE, 1.0))
+        await sender.set_debug_logging(True)
+        received.append(await waiting)
+
+        assert simulator.statistics.commands == 2
+        simulator.stop()
+        bus.outbound.stop()
+        writer.close()
+        os.close(master)
+        os.close(slave)
+        return received
+
+    assert asyncio.run(_run()) == [
+        (UARTEvent.START, b"\x00"),
+        (UARTEvent.ALIGNED, b"\x00"),
+        (UARTEvent.LOG_MESSAGE, b"debug logging on"),
+    ]
+
+
+def test_bit_errors_and_garbage() -> None:
+    """
+    Test that garbage is skipped and bit errors break the checksum
+    """
+
+    async def _run() -> tuple[FrameParser, FirmwareSimulator]:
+        master, slave, device = open_pty()
+        config = SimulatorConfig(
+            baudrate=None, delays={}, start_delay=None, bit_error_rate=1.0, seed=1
+        )
+        simulator = FirmwareSimulator(master, config)
+        simulator.start()
+        reader, writer = await open_serial_connection(url=device, baudrate=115200)
+
+        writer.write(b"\xff" + encode_frame(UARTCommand.FOLLOW_LINE.value) * 10)
+        await writer.drain()
+        parser = FrameParser()
+        # flipped bits keep the size, 10 POINT_REACHED of 2 bytes each
+        parser.feed(await asyncio.wait_for(reader.readexactly(20), 1.0))
+
+        simulator.stop()
+        writer.close()
+        os.close(master)
+        os.close(slave)
+        return parser, simulator
+
+    parser, simulator = asyncio.run(_run())
+
+    assert simulator.statistics.rejected == 1
+    assert simulator.statistics.commands == 10
+    assert simulator.statistics.corrupted == 10
+    assert parser.statistics.frames < 10
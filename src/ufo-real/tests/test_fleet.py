@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""fleet tests"""
+
+__copyright__ = "Copyright (c) 2025 HSLU PREN Team 2, FS25. All rights reserved."
+
+
+import asyncio
+
+import pytest
+from aiohttp.test_utils import TestClient, TestServer
+
+from common.competition import create_network
+from common.constants import VERSION
+from network.network import Network
+from network.node import NodeLabel
+from ufo.fleet import Fleet, NetworkTemplate
+from web.server import WebServer
+
+
+def test_network_template() -> None:
+    """
+    Test that the template is built once, copied and rebuilt on a new stamp
+    """
+    built: list[int] = []
+    stamp = [0]
+
+    def _provider() -> Network:
+        built.append(1)
+        return create_network()
+
+    template = NetworkTemplate(_provider, lambda: stamp[0])
+    first, second = template(), template()
+    first.get_node_by_label(NodeLabel.X).disabled = True
+
+    assert len(built) == 1
+    assert not second.get_node_by_label(NodeLabel.X).disabled
+    assert not template().get_node_by_label(NodeLabel.X).disabled
+
+    stamp[0] = 1
+    template()
+    assert len(built) == 2
+
+
+def test_fleet_web_api() -> None:
+    """
+    Test that every vehicle gets its own engine and prefixed api
+    """
+    fleet = Fleet(NetworkTemplate(create_network))
+    fleet.add("rig1")
+    fleet.add("rig2")
+    with pytest.raises(ValueError):
+        fleet.add("rig1")
+    assert fleet["rig1"].engine is not fleet["rig2"].engine
+
+    async def _run() -> tuple[list[str], str]:
+        server = WebServer(fleet["rig1"].engine, fleet)
+        async with TestClient(TestServer(server.app)) as client:
+            vehicles = await (await client.get("/api/fleet")).json()
+            version = await (await client.get("/vehicles/rig2/api/version")).text()
+            return vehicles, version
+
+    vehicles, version = asyncio.run(_run())
+
+    assert vehicles == ["rig1", "rig2"]
+    assert version == VERSION
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""frame capture tests"""
+
+__copyright__ = "Copyright (c) 2025 HSLU PREN Team 2, FS25. All rights reserved."
+
+
+import asyncio
+import threading
+import time
+from typing import Optional
+
+import numpy as np
+
+from capture.frame_capture import Frame, FrameCapture, FrameRingBuffer
+from capture.source import (
+    FrameSource,
+    ImageFilesSource,
+    V4L2Source,
+    VideoFileSource,
+    create_frame_source,
+)
+
+
+def test_ring_buffer() -> None:
+    """
+    Test that the buffer keeps the newest frames and filters by timestamp
+    """
+    image = np.zeros((1, 1, 3), dtype=np.uint8)
+    buffer = FrameRingBuffer(2)
+    for timestamp in (1.0, 2.0, 3.0):
+        buffer.push(Frame(timestamp, image))
+
+    assert len(buffer) == 2
+    latest = buffer.latest()
+    assert latest is not None and latest.timestamp == 3.0
+    assert buffer.latest_after(2.5) is latest
+    assert buffer.latest_after(3.0) is None
+
+
+def test_frame_after_event() -> None:
+    """
+    Test that the capture hands out a frame taken after the given time
+    """
+
+    async def _run() -> tuple[float, Frame, Frame]:
+        capture = FrameCapture(ImageFilesSource("tests/images", fps=50))
+        capture.start()
+        try:
+            await capture.frame_after(time.monotonic(), timeout=5)  # warmed up
+            aligned_at = time.monotonic()
+            fresh = await capture.frame_after(aligned_at, timeout=1)
+            # a frame is already buffered, no waiting this time
+            buffered = await capture.frame_after(aligned_at, timeout=0)
+        finally:
+            capture.stop()
+        return aligned_at, fresh, buffered
+
+    aligned_at, fresh, buffered = asyncio.run(_run())
+
+    assert fresh.timestamp > aligned_at
+    assert buffered.timestamp > aligned_at
+    assert fresh.image.shape[2] == 3
+
+
+class _StalledSource(FrameSource):
+    """a camera whose read hangs, e.g. once unplugged"""
+
+    def __init__(self) -> None:
+        self.release = threading.Event()
+
+    def read(self) -> Optional[np.ndarray]:
+        self.release.wait(5)
+        return np.zeros((1, 1, 3), dtype=np.uint8)
+
+
+def test_stop_stalled_read() -> None:
+    """
+    Test that stopping does not hang on a stalled read and that the capture
+    is not started a second time while the stalled thread is still running
+    """
+    source = _StalledSource()
+    capture = FrameCapture(source)
+    capture.start()
+
+    started = time.monotonic()
+    capture.stop(timeout=0.05)
+    assert time.monotonic() - started < 1.0
+    assert capture.running
+    capture.start()
+    assert [t.name for t in threading.enumerate()].count("capture") == 1
+
+    source.release.set()
+    capture.stop()
+    assert not capture.running
+
+
+def test_create_frame_source() -> None:
+    """
+    Test that the source is picked from the spec
+    """
+    assert isinstance(create_frame_source("0"), V4L2Source)
+    assert isinstance(create_frame_source("/dev/video0"), V4L2Source)
+    assert isinstance(create_frame_source("tests/images"), ImageFilesSource)
+    assert isinstance(create_frame_source("run.mp4"), VideoFileSource)
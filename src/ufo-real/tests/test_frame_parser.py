@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""uart frame parser tests"""
+
+__copyright__ = "Copyright (c) 2025 HSLU PREN Team 2, FS25. All rights reserved."
+
+
+import asyncio
+
+from uart.frame_parser import FrameParser
+from uart.protocol import UARTEvent
+from uart.protocol_bus import UARTProtocolBus
+
+STREAM = (
+    b"\x10\x00\x10"  # START A
+    + b"\x11\x11"  # POINT_REACHED
+    + b"\x17\x02hi\x16"  # LOG_MESSAGE "hi"
+    + b"\x15\x01\x14"  # ALIGNED
+)
+EXPECTED = [
+    (UARTEvent.START, b"\x00"),
+    (UARTEvent.POINT_REACHED, b""),
+    (UARTEvent.LOG_MESSAGE, b"hi"),
+    (UARTEvent.ALIGNED, b"\x01"),
+]
+
+
+def test_byte_by_byte() -> None:
+    """
+    Test that frames split over many chunks are put back together
+    """
+    parser = FrameParser()
+    events = []
+    for byte in STREAM:
+        events += parser.feed(bytes([byte]))
+
+    assert events == EXPECTED
+    assert parser.pending == 0
+    assert parser.statistics.frames == 4
+
+
+def test_resynchronise() -> None:
+    """
+    Test that garbage and a broken checksum only cost the affected frame
+    """
+    parser = FrameParser()
+    corrupted = b"\xff\x42" + b"\x10\x00\x11" + STREAM
+
+    assert parser.feed(corrupted) == EXPECTED
+    assert parser.statistics.unknown_bytes >= 2
+    assert parser.statistics.checksum_errors >= 1
+
+
+def test_protocol_bus_dispatch() -> None:
+    """
+    Test that the protocol bus hands the events to the handlers in order
+    """
+
+    async def _run() -> list[tuple[UARTEvent, bytes]]:
+        received: list[tuple[UARTEvent, bytes]] = []
+        done = asyncio.Event()
+
+        async def _handler(event: UARTEvent, payload: bytes) -> None:
+            received.append((event, payload))
+            if len(received) == len(EXPECTED):
+                done.set()
+
+        bus = UARTProtocolBus()
+        bus.on_event.add(_handler)
+        await bus.start()
+        bus.data_received(STREAM[:5])
+        bus.data_received(STREAM[5:])
+        await asyncio.wait_for(done.wait(), 1)
+        return received
+
+    assert asyncio.run(_run()) == EXPECTED
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""frame preprocessor tests"""
+
+__copyright__ = "Copyright (c) 2025 HSLU PREN Team 2, FS25. All rights reserved."
+
+
+import numpy as np
+
+from components import Camera
+from utilities.frame_preprocessor import FramePreprocessor, PreprocessingConfig
+
+
+def test_horizon_position() -> None:
+    """
+    Test that the horizon matches an object very far away
+    """
+    camera = Camera((1280, 720), 300, 80, 70)
+
+    horizon = camera.compute_horizon_position()
+    _, far_away = camera.compute_image_position(0.0, 1e9)
+
+    assert 0 < horizon < 720
+    assert horizon == far_away
+    # looking further down pushes the horizon out of the image
+    assert Camera((1280, 720), 300, 60, 70).compute_horizon_position() < 0
+
+
+def test_floor_crop_maps_back() -> None:
+    """
+    Test that the crop starts at the horizon and boxes map back into the frame
+    """
+    camera = Camera((1280, 720), 300, 80, 70)
+    preprocessor = FramePreprocessor((640, 360), PreprocessingConfig(roi_margin=0))
+    frame = np.zeros((720, 1280, 3), dtype=np.uint8)
+
+    prepared = preprocessor.prepare(frame, camera)
+
+    assert prepared.frame.shape == (360, 640, 3)
+    assert prepared.offset == camera.compute_horizon_position() // 2
+    assert prepared.model_input.shape == (360 - prepared.offset, 640, 3)
+    boxes = np.array([[10, 0, 20, 5]])
+    assert prepared.to_frame_coordinates(boxes).tolist() == [
+        [10, prepared.offset, 20, prepared.offset + 5]
+    ]
+
+
+def test_reduced_decode() -> None:
+    """
+    Test that reduced decoding yields a fraction of the image size
+    """
+    full = FramePreprocessor((1280, 720)).read("tests/images/test_image1.jpg")
+    reduced = FramePreprocessor((1280, 720), PreprocessingConfig(jpeg_reduction=4))
+    with open("tests/images/test_image1.jpg", "rb") as file:
+        decoded = reduced.decode(file.read())
+
+    assert full is not None
+    assert decoded.shape[0] == full.shape[0] // 4
+    assert decoded.shape[1] == full.shape[1] // 4
@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+"""heading-aware pathfinder tests"""
+
+__copyright__ = "Copyright (c) 2025 HSLU PREN Team 2, FS25. All rights reserved."
+
+import itertools
+from typing import Callable, Iterator
+
+import pytest
+
+from common.competition import create_network
+from common.constants import NODE_PENALTY_WEIGHT
+from common.helper import Math
+from network.network import Network
+from network.node import Node, NodeLabel
+from pathfinder.a_star import AStarPathfinder
+from pathfinder.cached_pathfinder import CachedPathfinder
+from pathfinder.contingency import ContingencyPathfinder
+from pathfinder.heading import HeadingAwarePathfinder, TurnCostModel
+from uart.round_trip import RollingHistogram
+
+
+def _simple_paths(
+    network: Network, path: list[Node], end: Node
+) -> Iterator[list[Node]]:
+    if path[-1] == end:
+        yield path
+        return
+    for neighbour, _ in network.neighbours(path[-1]):
+        if neighbour not in path:
+            yield from _simple_paths(network, [*path, neighbour], end)
+
+
+def _facing(heading: float) -> Callable[[], float]:
+    return lambda: heading
+
+
+def _seconds(
+    network: Network, path: list[Node], heading: float, model: Callable[[float], float]
+) -> float:
+    """cost of driving the path like Ufo.turn_on_node turns"""
+    cost = 0.0
+    for node1, node2 in itertools.pairwise(path):
+        new_angle = Math.calculate_angle_deg(node1, node2)
+        cost += model(new_angle - Math.optimise_for_next_angle(heading, new_angle))
+        heading = new_angle
+        cost += network.get_edge(node1, node2).weight
+        if node1 not in (path[0], path[-1]) and node2 not in (path[0], path[-1]):
+            cost += NODE_PENALTY_WEIGHT
+    return cost
+
+
+def test_fit() -> None:
+    """
+    Test fitting the turn model to measured timings
+    """
+    timings = [(angle, 0.3 + 0.01 * abs(angle)) for angle in (-180, -90, 0, 45, 90)]
+
+    model = TurnCostModel.fit(timings)
+
+    assert model is not None
+    assert model.base == pytest.approx(0.3)
+    assert model.per_degree == pytest.approx(0.01)
+    assert TurnCostModel.fit([]) is None
+    single = TurnCostModel.fit([(90, 1.0), (-90, 1.2)])
+    assert single is not None
+    assert single(90) == pytest.approx(1.1)
+
+
+def test_fastest_simple_path() -> None:
+    """
+    Test against all simple paths, from every node to every end and heading
+    """
+    network = create_network()
+    model = TurnCostModel(0.5, 0.05)
+
+    for heading in (0.0, 90.0, 180.0, -90.0):
+        pathfinder = HeadingAwarePathfinder(model, heading_provider=_facing(heading))
+        for start, end in itertools.product(network.nodes, network.end):
+            if start == end:
+                continue
+            best = min(
+                _seconds(network, path, heading, model)
+                for path in _simple_paths(network, [start], end)
+            )
+            path = pathfinder.find_path(network, start, end)
+            assert _seconds(network, path, heading, model) == pytest.approx(best)
+
+
+def test_turns_avoided() -> None:
+    """
+    Test that expensive turns make the vehicle take a longer, straighter path
+    """
+    network = create_network()
+    c = network.get_node_by_label(NodeLabel.C)
+
+    shortest = AStarPathfinder().find_path(network, network.start, c)
+    free = HeadingAwarePathfinder(lambda _: 0.0, heading_provider=lambda: 90.0)
+    slow = HeadingAwarePathfinder(
+        TurnCostModel(0.5, 0.05), heading_provider=lambda: 90.0
+    )
+
+    assert free.find_path(network, network.start, c) == shortest
+    assert [node.label for node in slow.find_path(network, network.start, c)] == [
+        NodeLabel.START,
+        NodeLabel.X,
+        NodeLabel.Y,
+        NodeLabel.C,
+    ]
+
+
+def test_calibration_and_cache() -> None:
+    """
+    Test that new timings recalibrate the model and invalidate cached paths
+    """
+    network = create_network()
+    timings: list[tuple[float, float]] = []
+    heading = HeadingAwarePathfinder(turn_timings=lambda: timings)
+    pathfinder = CachedPathfinder(ContingencyPathfinder(heading))
+    c = network.get_node_by_label(NodeLabel.C)
+
+    pathfinder.find_path(network, network.start, c)
+    pathfinder.find_path(network, network.start, c)
+    assert pathfinder.statistics.misses == 1
+
+    timings += [(0, 0.5), (90, 5.0), (180, 9.5)]
+    pathfinder.find_path(network, network.start, c)
+    assert pathfinder.statistics.misses == 2
+    assert heading.model(90) == pytest.approx(5.0)
+
+
+def test_calibration_with_full_windows() -> None:
+    """
+    Test that the model follows new samples once the rolling windows are full
+    and their number no longer changes
+    """
+    windows = {0: RollingHistogram(window=4), 90: RollingHistogram(window=4)}
+    heading = HeadingAwarePathfinder(
+        turn_timings=lambda: [
+            (angle, seconds)
+            for angle, histogram in windows.items()
+            for seconds in histogram.samples
+        ]
+    )
+
+    for _ in range(4):
+        windows[0].add(0.5)
+        windows[90].add(1.4)
+    heading.cache_key()
+    assert heading.model(90) == pytest.approx(1.4)
+
+    for _ in range(6):  # past the window, the count stays at 8
+        windows[0].add(0.5)
+        windows[90].add(2.3)
+        heading.cache_key()
+    assert heading.model(90) == pytest.approx(2.3)
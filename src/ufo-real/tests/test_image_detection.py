@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+"""YOLO image detection tests"""
+
+__copyright__ = "Copyright (c) 2025 HSLU PREN Team 2, FS25. All rights reserved."
+
+
+from types import SimpleNamespace
+from typing import Any
+
+import cv2
+import numpy as np
+import pytest
+
+from components import Camera, Obstacle, Pylon, VisualNode
+from utilities.frame_preprocessor import PreprocessingConfig
+
+pytest.importorskip("ultralytics")  # the detection runs YOLO
+
+# pylint: disable=wrong-import-position
+from yolo_model_v11 import ImageDetection, ModelRegistry, yolo_model_v11
+
+# pylint: enable=wrong-import-position
+
+NAMES = {0: "nodes", 1: "obstacle", 2: "pylon"}
+
+
+class _Tensor:
+    """just enough of a torch tensor for the detection"""
+
+    def __init__(self, values: np.ndarray) -> None:
+        self._values = values
+
+    def cpu(self) -> "_Tensor":
+        """already on the cpu"""
+        return self
+
+    def numpy(self) -> np.ndarray:
+        """the values"""
+        return self._values
+
+
+class _FakeModel:
+    """answers every frame with the same boxes, records the frames"""
+
+    names = NAMES
+
+    def __init__(self, xyxy: np.ndarray, cls: np.ndarray, conf: np.ndarray) -> None:
+        self.boxes = SimpleNamespace(
+            xyxy=_Tensor(xyxy), cls=_Tensor(cls), conf=_Tensor(conf)
+        )
+        self.frames: list[np.ndarray] = []
+
+    def __call__(self, frame: np.ndarray, **_: Any) -> list[SimpleNamespace]:
+        self.frames.append(frame)
+        return [SimpleNamespace(boxes=self.boxes)]
+
+
+def _detection(
+    monkeypatch: pytest.MonkeyPatch, model: _FakeModel, resolution: str
+) -> ImageDetection:
+    monkeypatch.setattr(
+        yolo_model_v11, "MODEL_REGISTRY", ModelRegistry(lambda _: model)
+    )
+    return ImageDetection(
+        "model.pt",
+        Camera((1280, 720), 300, 60, 70),
+        0.3,
+        resolution,
+        PreprocessingConfig(floor_roi=False),
+    )
+
+
+def _per_box(
+    detection: ImageDetection, model: _FakeModel
+) -> tuple[list[VisualNode], list[Obstacle]]:
+    """the detections like the loop over every single box extracted them"""
+    nodes: list[VisualNode] = []
+    pylons: list[Pylon] = []
+    obstacles: list[Obstacle] = []
+    boxes = model.boxes
+    for d in range(len(boxes.cls.numpy())):
+        xmin, ymin, xmax, ymax = boxes.xyxy.numpy()[d].astype(int)
+        classname = NAMES[int(boxes.cls.numpy()[d])]
+        if boxes.conf.numpy()[d] > detection.thresh:
+            if classname == "nodes":
+                center = (int((xmin + xmax) / 2), int((ymin + ymax) / 2))
+                nodes.append(VisualNode.position_only(str(d), center))
+            elif classname == "pylon":
+                pylons.append(Pylon(xmin, ymin, xmax, ymax))
+            elif classname == "obstacle":
+                obstacles.append(Obstacle(xmin, ymin, xmax, ymax))
+    for p in pylons:
+        nodes.append(detection.camera.compute_hidden_node_image_position(p))
+    return nodes, obstacles
+
+
+def _positions(nodes: list[VisualNode]) -> list[tuple[str, tuple[int, int], int, int]]:
+    # pylons are numbered by a class wide counter, only their place counts
+    return [
+        ("P" if n.get_label.startswith("P") else n.get_label, n.get_coordinates)
+        + (n.get_width, n.get_height)
+        for n in nodes
+    ]
+
+
+def test_boxes_like_per_box_loop(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test that the batched extraction yields the coordinates, classes and
+    labels (the index of the box) of the per-box loop
+    """
+    rng = np.random.default_rng(5)
+    corners = rng.uniform(0, 600, size=(40, 2))
+    xyxy = np.hstack([corners, corners + rng.uniform(1, 120, size=(40, 2))])
+    model = _FakeModel(
+        xyxy.astype(np.float32),
+        rng.integers(0, 3, size=40).astype(np.float32),
+        rng.uniform(0, 1, size=40).astype(np.float32),
+    )
+    detection = _detection(monkeypatch, model, "1280x720")
+
+    nodes, obstacles, _ = detection.yolo_detect_by_frame(
+        np.zeros((720, 1280, 3), dtype=np.uint8)
+    )
+    expected_nodes, expected_obstacles = _per_box(detection, model)
+
+    assert _positions(nodes) == _positions(expected_nodes)
+    assert any(n.get_label.startswith("P") for n in nodes)
+    assert obstacles == expected_obstacles
+    assert len(obstacles) == len(expected_obstacles) > 0
+
+
+def test_frame_input(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test decoded and encoded frames of different sizes, the resize buffer is
+    reused until the frames need another shape
+    """
+    empty = np.zeros((0, 4), dtype=np.float32)
+    model = _FakeModel(empty, empty[:, 0], empty[:, 0])
+    detection = _detection(monkeypatch, model, "640x360")
+    small = np.full((180, 320, 3), (10, 20, 30), dtype=np.uint8)
+    _, encoded = cv2.imencode(  # pylint: disable=no-member
+        ".png", np.full((720, 1280, 3), (40, 50, 60), dtype=np.uint8)
+    )
+
+    _, _, first = detection.yolo_detect_by_frame(small)
+    first_colour = first[0, 0].tolist()
+    _, _, second = detection.yolo_detect_by_frame(encoded.tobytes())
+    _, _, third = detection.yolo_detect_by_frame(np.zeros((720, 1280), np.uint8))
+
+    assert first_colour == [10, 20, 30]
+    assert second is first  # same size, same buffer
+    assert second[0, 0].tolist() == [40, 50, 60]
+    assert third is not first  # no colour channels, a new buffer
+    assert third.shape == (360, 640)
+    assert [frame.shape for frame in model.frames[1:]] == [
+        (360, 640, 3),
+        (360, 640, 3),
+        (360, 640),
+    ]
+    with pytest.raises(ValueError):
+        detection.yolo_detect_by_frame(b"no image")
@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+"""image synthesizer tests"""
+
+__copyright__ = "Copyright (c) 2025 HSLU PREN Team 2, FS25. All rights reserved."
+
+
+import random
+
+from components import (
+    Camera,
+    Edge,
+    Graph,
+    RealNode,
+    RealNodeLabel,
+    RealNodeState,
+    Robot,
+    VisualNode,
+)
+from utilities.image_synthesizer import (
+    ImageSynthesizer,
+    _does_line_intersect_ellipse,  # pylint: disable=protected-access
+    compute_intersection_matrix,
+)
+
+
+def test_intersection_matrix_matches_per_pair() -> None:
+    """
+    Test that the batched intersection yields the same result as the per-pair test
+    """
+    rng = random.Random(7)
+    segments: list[tuple[int, int, int, int]] = []
+    while len(segments) < 60:
+        x1, y1 = rng.randint(0, 1280), rng.randint(0, 720)
+        x2, y2 = rng.randint(0, 1280), rng.randint(0, 720)
+        if (x1, y1) != (x2, y2):
+            segments.append((x1, y1, x2, y2))
+    obstacles = [
+        VisualNode(
+            f"O{i}",
+            (rng.randint(0, 1280), rng.randint(0, 720)),
+            rng.randint(1, 300),
+            rng.randint(0, 80),  # zero height is treated as one pixel
+        )
+        for i in range(25)
+    ]
+
+    matrix = compute_intersection_matrix(segments, obstacles)
+
+    assert matrix.shape == (len(segments), len(obstacles))
+    for i, (x1, y1, x2, y2) in enumerate(segments):
+        for j, obstacle in enumerate(obstacles):
+            assert matrix[i, j] == _does_line_intersect_ellipse(
+                (x1, y1), (x2, y2), obstacle
+            )
+
+
+def test_intersection_matrix_empty() -> None:
+    """
+    Test that no segments or no obstacles yield an empty result
+    """
+    obstacle = VisualNode("O1", (10, 10), 20, 10)
+
+    assert compute_intersection_matrix([], [obstacle]).shape == (0, 1)
+    assert not compute_intersection_matrix([(0, 0, 5, 5)], []).any()
+
+
+def _synthesizer(gate: float) -> ImageSynthesizer:
+    a = RealNode(RealNodeLabel.A, 2933, 900)
+    b = RealNode(RealNodeLabel.B, 1586, 250)
+    c = RealNode(RealNodeLabel.C, 487, 666)
+    graph = Graph([a, b, c], [Edge(a, b), Edge(b, c), Edge(a, c)])
+    return ImageSynthesizer(
+        Camera((1280, 720), 300, 60, 70),
+        Robot(2250, 3000, 270),
+        graph,
+        matching_gate=gate,
+    )
+
+
+def _detections(
+    synthesizer: ImageSynthesizer, shifted: dict[str, int]
+) -> list[VisualNode]:
+    """a detection per computed node, moved to the right by the given px"""
+    # pylint: disable-next=protected-access
+    computed = synthesizer._compute_image_nodes_from_graph()
+    detections: list[VisualNode] = []
+    for i, node in enumerate(computed):
+        x, y = node.get_coordinates
+        detections.append(
+            VisualNode.position_only(str(i), (x + shifted[node.get_label], y))
+        )
+    return detections
+
+
+def test_update_graph_gate_rejects_some() -> None:
+    """
+    Test that computed nodes without a detection within the gate get their
+    position estimated, also when the image holds more nodes than computed
+    """
+    synthesizer = _synthesizer(50.0)
+    detections = _detections(synthesizer, {"A": 5, "B": -3, "C": 900})
+    detections.append(VisualNode.position_only("3", (-2000, -2000)))
+
+    synthesizer.update_graph_by_objects(detections, [])
+
+    states = {n.get_label: n.state for n in synthesizer.graph.get_nodes}
+    assert states == {
+        "A": RealNodeState.FREE,
+        "B": RealNodeState.FREE,
+        "C": RealNodeState.UNKNOWN,  # estimated, not seen
+    }
+    # the edges to C are still rendered with its estimated position
+    assert all(e.get_status == "FREE" for e in synthesizer.graph.get_edges)
+
+
+def test_update_graph_gate_rejects_all() -> None:
+    """
+    Test that a matching without any pair estimates every node
+    """
+    synthesizer = _synthesizer(50.0)
+    detections = _detections(synthesizer, {"A": 900, "B": 900, "C": 900})
+
+    synthesizer.update_graph_by_objects(detections, [])
+
+    assert all(n.state == RealNodeState.UNKNOWN for n in synthesizer.graph.get_nodes)
+    assert all(e.get_status == "FREE" for e in synthesizer.graph.get_edges)
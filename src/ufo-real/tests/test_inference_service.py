@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+"""inference service tests"""
+
+__copyright__ = "Copyright (c) 2025 HSLU PREN Team 2, FS25. All rights reserved."
+
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from utilities.inference_service import InferenceDroppedError, InferenceService
+
+
+def _slow_double(value: int) -> int:
+    time.sleep(0.2)
+    return value * 2
+
+
+def test_event_loop_stays_responsive() -> None:
+    """
+    Test that the event loop keeps running while the detection blocks
+    """
+
+    async def _run() -> tuple[int, int]:
+        service = InferenceService(_slow_double)
+        ticks = 0
+
+        async def _tick() -> None:
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        ticker = asyncio.create_task(_tick())
+        result = await service.submit(21)
+        ticker.cancel()
+        service.stop()
+        return result, ticks
+
+    result, ticks = asyncio.run(_run())
+
+    assert result == 42
+    assert ticks >= 10
+
+
+def test_drop_oldest() -> None:
+    """
+    Test that a full queue drops the oldest waiting request
+    """
+    release = threading.Event()
+
+    def _blocking(value: int) -> int:
+        release.wait(1)
+        return value
+
+    async def _run() -> tuple[int | BaseException, ...]:
+        service = InferenceService(_blocking, max_queue=1)
+        running = asyncio.create_task(service.submit(1))
+        await asyncio.sleep(0.05)  # first request is now on the worker
+        waiting = asyncio.create_task(service.submit(2))
+        await asyncio.sleep(0)
+        newest = asyncio.create_task(service.submit(3))
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(running, waiting, newest, return_exceptions=True)
+        assert service.statistics.dropped == 1
+        service.stop()
+        return tuple(results)
+
+    first, second, third = asyncio.run(_run())
+
+    assert first == 1
+    assert isinstance(second, InferenceDroppedError)
+    assert third == 3
+
+
+def test_timeout() -> None:
+    """
+    Test that a request taking too long raises a TimeoutError
+    """
+
+    async def _run() -> None:
+        service = InferenceService(_slow_double, timeout=0.05)
+        with pytest.raises(TimeoutError):
+            await service.submit(1)
+        assert service.statistics.timed_out == 1
+        service.stop()
+
+    asyncio.run(_run())
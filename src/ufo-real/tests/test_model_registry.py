@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+"""model registry tests"""
+
+__copyright__ = "Copyright (c) 2025 HSLU PREN Team 2, FS25. All rights reserved."
+
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import numpy as np
+import pytest
+
+pytest.importorskip("ultralytics")  # the registry imports YOLO for its loader
+
+# pylint: disable-next=wrong-import-position
+from yolo_model_v11.model_registry import ModelRegistry
+
+
+class _FakeModel:
+    """records the frames it is called with"""
+
+    def __init__(self) -> None:
+        self.frames: list[np.ndarray] = []
+
+    def __call__(self, frame: np.ndarray, **_: Any) -> list[Any]:
+        self.frames.append(frame)
+        return []
+
+
+def test_loaded_once() -> None:
+    """
+    Test that all the callers share one load, also while it is in progress
+    """
+    model = _FakeModel()
+    loads: list[str] = []
+    release = threading.Event()
+
+    def _loader(path: str) -> _FakeModel:
+        loads.append(path)
+        release.wait(1.0)
+        return model
+
+    registry = ModelRegistry(loader=_loader)
+    registry.preload("model.pt")
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        waiting = [pool.submit(registry.get, "model.pt") for _ in range(4)]
+        time.sleep(0.05)
+        assert not registry.is_ready("model.pt")
+        release.set()
+        models = [future.result(timeout=1.0) for future in waiting]
+
+    assert all(m is model for m in models)
+    assert registry.get("model.pt") is model
+    assert registry.is_ready("model.pt")
+    assert loads == ["model.pt"]
+
+
+def test_warm_up_and_timings() -> None:
+    """
+    Test that the model is warmed up on a black frame of the resolution and
+    that both steps are timed
+    """
+    model = _FakeModel()
+
+    def _loader(_: str) -> _FakeModel:
+        time.sleep(0.02)
+        return model
+
+    registry = ModelRegistry(loader=_loader)
+    registry.get("warm.pt", (640, 360))
+    registry.get("cold.pt")
+
+    assert len(model.frames) == 1
+    assert model.frames[0].shape == (360, 640, 3)
+    assert model.frames[0].dtype == np.uint8
+    assert not model.frames[0].any()
+    warm = registry.timings["warm.pt"]
+    assert warm.load is not None and warm.load >= 0.02
+    assert warm.warm_up is not None
+    cold = registry.timings["cold.pt"]
+    assert cold.load is not None and cold.warm_up is None
+
+
+def test_warm_up_per_resolution() -> None:
+    """
+    Test that a caller with another input size gets the model warmed up at
+    its size, without loading it again
+    """
+    model = _FakeModel()
+    loads: list[str] = []
+
+    def _loader(path: str) -> _FakeModel:
+        loads.append(path)
+        return model
+
+    registry = ModelRegistry(loader=_loader)
+    registry.get("model.pt", (640, 360))
+    assert not registry.is_ready("model.pt", (1280, 720))
+    registry.get("model.pt", (1280, 720))
+    registry.get("model.pt", (640, 360))
+
+    assert loads == ["model.pt"]
+    assert [frame.shape for frame in model.frames] == [(360, 640, 3), (720, 1280, 3)]
+    assert registry.is_ready("model.pt", (1280, 720))
+
+
+def test_loader_failure() -> None:
+    """
+    Test that a failing load reaches every caller waiting for the model and
+    that the next call tries to load it again
+    """
+    model = _FakeModel()
+    failures = [OSError("missing.pt not found")]
+    release = threading.Event()
+
+    def _loader(_: str) -> _FakeModel:
+        release.wait(1.0)
+        if failures:
+            raise failures.pop()
+        return model
+
+    registry = ModelRegistry(loader=_loader)
+    future = registry.preload("missing.pt")
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        waiting = pool.submit(registry.get, "missing.pt")
+        time.sleep(0.05)
+        release.set()
+        with pytest.raises(OSError, match="missing.pt not found"):
+            waiting.result(timeout=1.0)
+    assert isinstance(future.exception(), OSError)
+    assert not registry.is_ready("missing.pt")
+
+    assert registry.get("missing.pt") is model
+    assert registry.is_ready("missing.pt")
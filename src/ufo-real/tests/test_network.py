@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""network index tests"""
+
+__copyright__ = "Copyright (c) 2025 HSLU PREN Team 2, FS25. All rights reserved."
+
+import copy
+
+import pytest
+
+from common.competition import create_network
+from network.edge import Edge
+from network.network import Network
+from network.node import Node, NodeLabel, NodeType
+
+
+def test_lookups() -> None:
+    """
+    Test the indexed lookups against the edges of the competition network
+    """
+    network = create_network()
+
+    nodes = {node for edge in network.edges for node in edge.nodes}
+    assert network.nodes == nodes
+    assert network.start.label == NodeLabel.START
+    assert {node.label for node in network.end} == {
+        NodeLabel.A,
+        NodeLabel.B,
+        NodeLabel.C,
+    }
+    for edge in network.edges:
+        node1, node2 = edge.nodes
+        assert network.get_edge(node1, node2) is edge
+        assert network.get_edge(*reversed(edge.nodes)) is edge
+        assert network.get_node_by_label(node1.label) is node1
+
+
+def test_neighbours() -> None:
+    """
+    Test the adjacency lists
+    """
+    network = create_network()
+    x = network.get_node_by_label(NodeLabel.X)
+
+    neighbours = {node.label for node, _ in network.neighbours(x)}
+
+    assert neighbours == {
+        NodeLabel.START,
+        NodeLabel.W,
+        NodeLabel.Y,
+        NodeLabel.Z,
+        NodeLabel.A,
+    }
+    for node, edge in network.neighbours(x):
+        assert network.get_edge(x, node) is edge
+
+
+def test_not_found() -> None:
+    """
+    Test the errors of missing nodes and edges
+    """
+    network = Network()
+    a = Node(0, 0, NodeLabel.A, NodeType.END)
+    b = Node(1, 0, NodeLabel.B, NodeType.END)
+    network.add_edge(Edge(a, b))
+
+    with pytest.raises(ValueError):
+        _ = network.start
+    with pytest.raises(ValueError):
+        network.get_edge(a, Node(0, 1, NodeLabel.C))
+    with pytest.raises(StopIteration):
+        network.get_node_by_label(NodeLabel.C)
+    assert not network.neighbours(Node(0, 1, NodeLabel.C))
+
+
+def test_duplicate_edge() -> None:
+    """
+    Test that adding an edge twice keeps the first one indexed
+    """
+    network = Network()
+    a = Node(0, 0, NodeLabel.A)
+    b = Node(1, 0, NodeLabel.B)
+    first = Edge(a, b)
+    network.add_edge(first)
+    network.add_edge(first)
+    network.add_edge(Edge(b, a))
+
+    assert network.get_edge(b, a) is first
+    assert len(network.neighbours(a)) == 1
+
+
+def test_copy() -> None:
+    """
+    Test that a copy has its own index
+    """
+    network = create_network()
+    copied = copy.deepcopy(network)
+
+    copied.get_node_by_label(NodeLabel.X).disabled = True
+
+    assert not network.get_node_by_label(NodeLabel.X).disabled
+    x = copied.get_node_by_label(NodeLabel.X)
+    assert all(
+        edge.nodes[0] is x or edge.nodes[1] is x for _, edge in copied.neighbours(x)
+    )
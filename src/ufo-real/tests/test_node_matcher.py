@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+"""node matcher tests"""
+
+__copyright__ = "Copyright (c) 2025 HSLU PREN Team 2, FS25. All rights reserved."
+
+
+import random
+
+from components import VisualNode
+from utilities.node_matcher import MatchingStrategy, find_best_matching
+
+
+def _random_nodes(labels: list[str], rng: random.Random) -> list[VisualNode]:
+    return [
+        VisualNode.position_only(label, (rng.randint(0, 1280), rng.randint(0, 720)))
+        for label in labels
+    ]
+
+
+def _total_cost(
+    matching: list[tuple[str, str]], image: list[VisualNode], calc: list[VisualNode]
+) -> float:
+    nodes = {n.get_label: n for n in image + calc}
+    return sum(nodes[a].get_distance(nodes[b]) ** 2 for a, b in matching if a and b)
+
+
+def test_assignment_equals_permutation() -> None:
+    """
+    Test that the assignment matcher finds a matching as good as the brute force
+    one for equal and different list sizes
+    """
+    rng = random.Random(42)
+    calc_labels = ["A", "B", "C", "X", "Y"]
+
+    for size in range(1, 7):
+        image = _random_nodes([str(i) for i in range(size)], rng)
+        calc = _random_nodes(calc_labels, rng)
+
+        brute = find_best_matching(image, calc, MatchingStrategy.PERMUTATION)
+        fast = find_best_matching(image, calc, MatchingStrategy.ASSIGNMENT)
+
+        assert (
+            abs(_total_cost(brute, image, calc) - _total_cost(fast, image, calc)) < 1e-6
+        )
+        assert brute == [(a, b) for a, b in brute if a in calc_labels or not a]
+        assert sorted(a + b for a, b in brute if not a or not b) == sorted(
+            a + b for a, b in fast if not a or not b
+        )
+        assert len(fast) == max(len(image), len(calc))
+
+
+def test_assignment_orientation() -> None:
+    """
+    Test that the computed label comes first whatever the lengths of the lists
+    """
+    image = [VisualNode.position_only("0", (10, 10))]
+    calc = [
+        VisualNode.position_only("A", (12, 10)),
+        VisualNode.position_only("B", (500, 500)),
+    ]
+
+    assert find_best_matching(image, calc) == [("A", "0"), ("B", "")]
+    assert find_best_matching(calc[:1], image) == [("0", "A")]
+    assert find_best_matching(image + calc[1:], calc[:1]) == [("A", "0"), ("", "B")]
+    for strategy in MatchingStrategy:
+        assert find_best_matching(image, calc, strategy) == [("A", "0"), ("B", "")]
+        assert find_best_matching(calc, image, strategy) == [("0", "A"), ("", "B")]
+
+
+def test_assignment_gate() -> None:
+    """
+    Test that nodes further apart than the gate stay unmatched
+    """
+    image = [
+        VisualNode.position_only("0", (10, 10)),
+        VisualNode.position_only("1", (900, 10)),
+    ]
+    calc = [
+        VisualNode.position_only("A", (12, 10)),
+        VisualNode.position_only("B", (10, 600)),
+    ]
+
+    matching = find_best_matching(image, calc, gate=50.0)
+
+    assert matching == [("A", "0"), ("B", ""), ("", "1")]
+    assert find_best_matching(image, calc, gate=1.0) == [
+        ("A", ""),
+        ("B", ""),
+        ("", "0"),
+        ("", "1"),
+    ]
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""OverSight tests"""
+
+__copyright__ = "Copyright (c) 2025 HSLU PREN Team 2, FS25. All rights reserved."
+
+
+import asyncio
+from typing import Any, Callable
+
+import pytest
+
+from common.competition import create_network
+from uart.mock.bus import UARTBus
+from uart.receiver import UARTReceiver
+from uart.sender import UARTSender
+from utilities.inference_service import InferenceDroppedError
+
+pytest.importorskip("ultralytics")  # OverSight runs YOLO
+
+# pylint: disable=wrong-import-position
+from algorithms.over_sight import OverSightAlgorithm
+from algorithms.road_sense import RoadSenseAlgorithm
+from yolo_model_v11 import ModelRegistry, yolo_model_v11
+
+# pylint: enable=wrong-import-position
+
+
+class _SlowSight(OverSightAlgorithm):
+    """image recognition that takes longer than the budget"""
+
+    IMAGE_RECOGNITION_BUDGET = 0.05
+
+    async def _on_sight(self, aligned_at: float) -> None:
+        await asyncio.sleep(1.0)
+
+
+class _DroppedSight(OverSightAlgorithm):
+    """image recognition whose frame got dropped by the inference worker"""
+
+    async def _on_sight(self, aligned_at: float) -> None:
+        raise InferenceDroppedError("frame dropped")
+
+
+def _no_model(_: str) -> Callable[..., list[Any]]:
+    return lambda *_, **__: []
+
+
+@pytest.fixture(name="aligned_calls")
+def fixture_aligned_calls(monkeypatch: pytest.MonkeyPatch) -> list[bool]:
+    """the holds RoadSense got to handle, no model is loaded for real"""
+    calls: list[bool] = []
+
+    async def _on_aligned(_: RoadSenseAlgorithm, hold: bool) -> None:
+        calls.append(hold)
+
+    monkeypatch.setattr(RoadSenseAlgorithm, "_on_aligned", _on_aligned)
+    monkeypatch.setattr(yolo_model_v11, "MODEL_REGISTRY", ModelRegistry(_no_model))
+    return calls
+
+
+def _aligned(algorithm_type: type[OverSightAlgorithm]) -> OverSightAlgorithm:
+    async def _run() -> OverSightAlgorithm:
+        bus = UARTBus()
+        algorithm = algorithm_type(create_network, UARTSender(bus), UARTReceiver(bus))
+        await algorithm._on_aligned(False)  # pylint: disable=protected-access
+        return algorithm
+
+    return asyncio.run(_run())
+
+
+@pytest.mark.parametrize("algorithm_type", [_SlowSight, _DroppedSight])
+def test_recognition_falls_back(
+    algorithm_type: type[OverSightAlgorithm], aligned_calls: list[bool]
+) -> None:
+    """
+    Test that a recognition over budget or a dropped frame still lets the
+    vehicle carry on like RoadSense and is recorded as timed out
+    """
+    algorithm = _aligned(algorithm_type)
+
+    assert aligned_calls == [False]
+    assert len(algorithm.recognition_latencies) == 1
+    latency = algorithm.recognition_latencies[0]
+    assert latency.timed_out
+    assert latency.node == create_network().start.label
+    assert latency.seconds < 0.5
+
+
+@pytest.mark.usefixtures("aligned_calls")
+def test_capture_stops() -> None:
+    """
+    Test that the default capture source can be read and that the capture is
+    stopped at the end of a run and once the algorithm is replaced
+    """
+
+    async def _run() -> None:
+        bus = UARTBus()
+        algorithm = OverSightAlgorithm(
+            create_network, UARTSender(bus), UARTReceiver(bus)
+        )
+        capture = algorithm._capture  # pylint: disable=protected-access
+        capture.start()
+        frame = await capture.frame_after(0.0, timeout=5)
+        assert frame.image.shape[2] == 3
+        algorithm.reset()
+        assert not capture.running
+
+        capture.start()
+        algorithm.stop()
+        assert not capture.running
+
+    assert OverSightAlgorithm._CAPTURE_SOURCE.is_file()  # pylint: disable=protected-access
+    asyncio.run(_run())
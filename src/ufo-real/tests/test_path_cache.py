@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+"""network version and path cache tests"""
+
+__copyright__ = "Copyright (c) 2025 HSLU PREN Team 2, FS25. All rights reserved."
+
+import copy
+
+from common.competition import create_network
+from network.network import Network
+from network.node import Node, NodeLabel
+from pathfinder.cached_pathfinder import CachedPathfinder
+from pathfinder.ipathfinder import IPathfinder
+from pathfinder.sparse_dijkstra import SparseDijkstraPathfinder
+
+
+class _CountingPathfinder(IPathfinder):
+    """counts the plans of the wrapped pathfinder"""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self._pathfinder = SparseDijkstraPathfinder()
+
+    def find_path(self, network: Network, start: Node, end: Node) -> list[Node]:
+        self.calls += 1
+        return self._pathfinder.find_path(network, start, end)
+
+
+def test_version() -> None:
+    """
+    Test that only changes of the weights bump the version
+    """
+    network = create_network()
+    x = network.get_node_by_label(NodeLabel.X)
+    edge = network.get_edge_by_label(NodeLabel.X, NodeLabel.Y)
+    version = network.version
+
+    x.visited = True
+    edge.visited = True
+    x.disabled = False
+    assert network.version == version
+
+    x.disabled = True
+    assert network.version == version + 1
+    edge.obstructed = True
+    assert network.version == version + 2
+    edge.disabled = True
+    assert network.version == version + 3
+    edge.disabled = True
+    assert network.version == version + 3
+
+
+def test_copy() -> None:
+    """
+    Test that a copy has its own uid and counts its own changes
+    """
+    network = create_network()
+    copied = copy.deepcopy(network)
+    version = network.version
+
+    copied.get_node_by_label(NodeLabel.X).disabled = True
+
+    assert copied.uid != network.uid
+    assert network.version == version
+    assert copied.version == version + 1
+
+
+def test_hits_and_misses() -> None:
+    """
+    Test that a path is planned again only after the network changed
+    """
+    network = create_network()
+    counting = _CountingPathfinder()
+    pathfinder = CachedPathfinder(counting)
+    b = network.get_node_by_label(NodeLabel.B)
+
+    first = pathfinder.find_path(network, network.start, b)
+    again = pathfinder.find_path(network, network.start, b)
+    assert again == first
+    assert counting.calls == 1
+
+    network.get_node_by_label(NodeLabel.X).disabled = True
+    path = pathfinder.find_path(network, network.start, b)
+    assert counting.calls == 2
+    assert path[1].label == NodeLabel.Z
+
+    other = copy.deepcopy(network)
+    path = pathfinder.find_path(
+        other, other.start, other.get_node_by_label(NodeLabel.B)
+    )
+    assert counting.calls == 3
+    assert path[0] is other.start
+    assert pathfinder.statistics.hits == 1
+    assert pathfinder.statistics.misses == 3
+
+
+def test_eviction() -> None:
+    """
+    Test that the least recently used path is evicted
+    """
+    network = create_network()
+    counting = _CountingPathfinder()
+    pathfinder = CachedPathfinder(counting, size=2)
+    a, b, c = (
+        network.get_node_by_label(label)
+        for label in (NodeLabel.A, NodeLabel.B, NodeLabel.C)
+    )
+
+    pathfinder.find_path(network, network.start, a)
+    pathfinder.find_path(network, network.start, b)
+    pathfinder.find_path(network, network.start, a)
+    pathfinder.find_path(network, network.start, c)  # evicts b
+    pathfinder.find_path(network, network.start, a)
+    assert counting.calls == 3
+
+    pathfinder.find_path(network, network.start, b)
+    assert counting.calls == 4
+    assert pathfinder.statistics.evictions == 2
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""tests shared by all the registered pathfinders"""
+
+__copyright__ = "Copyright (c) 2025 HSLU PREN Team 2, FS25. All rights reserved."
+
+import itertools
+from typing import Callable, Iterator
+
+import pytest
+
+from algorithms.base_algorithm import BaseAlgorithm
+from network.edge import Edge
+from network.network import Network
+from network.node import Node, NodeLabel, NodeType
+from pathfinder.a_star import AStarPathfinder
+from pathfinder.dijkstra import DijkstraPathfinder
+from pathfinder.registry import PATHFINDERS, create_pathfinder
+
+# the heading-aware pathfinder adds the turns to the costs, it has its own tests
+NAMES = sorted(name for name in PATHFINDERS if name != "heading")
+
+
+@pytest.mark.parametrize("name", [name for name in NAMES if name != "dijkstra"])
+def test_same_as_dijkstra(
+    name: str,
+    failing_network: Iterator[Network],
+    path_cost: Callable[[Network, list[Node]], float],
+) -> None:
+    """
+    Test against Dijkstra from every node to every end, while edges and nodes
+    get disabled and obstructed between the plans
+    """
+    pathfinder = create_pathfinder(name)
+    dijkstra = DijkstraPathfinder()
+
+    for network in failing_network:
+        nodes = sorted(network.nodes, key=str)
+        for start, end in itertools.product(nodes, network.end):
+            try:
+                expected = dijkstra.find_path(network, start, end)
+            except IndexError:  # no path
+                with pytest.raises(ValueError):
+                    pathfinder.find_path(network, start, end)
+                continue
+            path = pathfinder.find_path(network, start, end)
+            assert path[0] == start and path[-1] == end
+            assert path_cost(network, path) == pytest.approx(
+                path_cost(network, expected)
+            )
+
+
+@pytest.mark.parametrize("name", NAMES)
+@pytest.mark.parametrize(
+    ("disabled", "expected"),
+    [
+        ((), [NodeLabel.X, NodeLabel.Y]),
+        ((NodeLabel.X,), [NodeLabel.Z, NodeLabel.Y]),
+        ((NodeLabel.X, NodeLabel.Y), [NodeLabel.X, NodeLabel.A]),
+    ],
+    ids=["unmodified", "disabled_node", "disabled_edge"],
+)
+def test_start_to_b(
+    name: str,
+    network: Network,
+    disabled: tuple[NodeLabel, ...],
+    expected: list[NodeLabel],
+) -> None:
+    """
+    Test the path from the start to B with nothing, a node (one label) or an
+    edge (two labels) disabled
+    """
+    if len(disabled) == 1:
+        network.get_node_by_label(disabled[0]).disabled = True
+    elif len(disabled) == 2:
+        network.get_edge_by_label(*disabled).disabled = True
+    b = network.get_node_by_label(NodeLabel.B)
+
+    path = create_pathfinder(name).find_path(network, network.start, b)
+
+    assert [node.label for node in path] == [NodeLabel.START, *expected, NodeLabel.B]
+
+
+@pytest.mark.parametrize("name", NAMES)
+def test_detour(name: str) -> None:
+    """
+    Test that no shortcut is taken around a disabled edge, A* must not let
+    the heuristic cut it
+    """
+    network = Network()
+    start = Node(0, 0, NodeLabel.START, NodeType.START)
+    w = Node(0, 5, NodeLabel.W)
+    x = Node(5, 0, NodeLabel.X)
+    y = Node(10, 5, NodeLabel.Y)
+    a = Node(10, 0, NodeLabel.A, NodeType.END)
+    for node1, node2 in ((start, x), (x, a), (start, w), (w, y), (y, a)):
+        network.add_edge(Edge(node1, node2))
+    network.get_edge(x, a).disabled = True
+
+    path = create_pathfinder(name).find_path(network, start, a)
+
+    assert path == [start, w, y, a]
+
+
+def test_registry() -> None:
+    """
+    Test the registry and that the algorithms keep planning with Dijkstra
+    unless another pathfinder is asked for
+    """
+    assert isinstance(create_pathfinder("a_star"), AStarPathfinder)
+    assert {"a_star", "dijkstra", "sparse_dijkstra"} <= set(PATHFINDERS)
+    assert BaseAlgorithm.pathfinder_name == "dijkstra"
+    with pytest.raises(ValueError):
+        create_pathfinder("bogus")
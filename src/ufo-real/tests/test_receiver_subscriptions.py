@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+"""uart receiver subscription tests"""
+
+__copyright__ = "Copyright (c) 2025 HSLU PREN Team 2, FS25. All rights reserved."
+
+
+import asyncio
+
+import pytest
+
+from algorithms.road_sense import RoadSenseAlgorithm
+from common.competition import create_network
+from uart.mock.bus import UARTBus
+from uart.protocol import UARTEvent
+from uart.receiver import UARTReceiver
+from uart.schema import encode_frame, get_codec
+from ufo.engine import Engine
+
+_POINT_REACHED = encode_frame(UARTEvent.POINT_REACHED.value)
+
+
+def test_adapters_unsubscribe_and_once() -> None:
+    """
+    Test the call adapters, unsubscribing and one-shot handlers
+    """
+
+    async def _run() -> list[object]:
+        bus = UARTBus()
+        receiver = UARTReceiver(bus)
+        calls: list[object] = []
+
+        async def _none() -> None:
+            calls.append("none")
+
+        async def _event(event: UARTEvent) -> None:
+            calls.append(event)
+
+        async def _payload(event: UARTEvent, payload: bytes) -> None:
+            calls.append((event, payload))
+
+        async def _once() -> None:
+            calls.append("once")
+
+        receiver.on(UARTEvent.POINT_REACHED, _none)
+        receiver.on(UARTEvent.POINT_REACHED, _event)
+        subscription = receiver.on(UARTEvent.POINT_REACHED, _payload)
+        once = receiver.once(UARTEvent.POINT_REACHED, _once)
+
+        await bus.mock_receive_message(_POINT_REACHED)
+        await asyncio.sleep(0.01)
+        assert not once.active
+        subscription.unsubscribe()
+        subscription.unsubscribe()  # no error the second time
+        await bus.mock_receive_message(_POINT_REACHED)
+        await asyncio.sleep(0.01)
+        return calls
+
+    calls = asyncio.run(_run())
+
+    assert calls.count("none") == 2
+    assert calls.count(UARTEvent.POINT_REACHED) == 2
+    assert calls.count((UARTEvent.POINT_REACHED, b"")) == 1
+    assert calls.count("once") == 1
+
+
+def test_wait_for() -> None:
+    """
+    Test waiting for the next of several events, also from within a handler
+    """
+
+    async def _run() -> tuple[tuple[UARTEvent, bytes], list[bytes]]:
+        bus = UARTBus()
+        receiver = UARTReceiver(bus)
+        aligned: list[bytes] = []
+
+        async def _on_point_reached() -> None:
+            # does not block the handler's own queue
+            aligned.append((await receiver.wait_for(UARTEvent.ALIGNED, 1.0))[1])
+
+        receiver.on(UARTEvent.POINT_REACHED, _on_point_reached)
+        waiting = asyncio.create_task(
+            receiver.wait_for({UARTEvent.POINT_REACHED, UARTEvent.NO_LINE_FOUND})
+        )
+        await asyncio.sleep(0)
+        await bus.mock_receive_message(_POINT_REACHED)
+        await asyncio.sleep(0.01)
+        await bus.mock_receive_message(get_codec(UARTEvent.ALIGNED).frame(1))
+        await asyncio.sleep(0.01)
+
+        with pytest.raises(TimeoutError):
+            await receiver.wait_for(UARTEvent.START, 0.01)
+        return await waiting, aligned
+
+    received, aligned = asyncio.run(_run())
+
+    assert received == (UARTEvent.POINT_REACHED, b"")
+    assert aligned == [b"\x01"]
+
+
+class _Recording(RoadSenseAlgorithm):
+    """records which instance handled a point reached"""
+
+    handled: list["_Recording"] = []
+
+    async def _on_point_reached(self) -> None:
+        self.handled.append(self)
+
+
+def test_replaced_algorithm_unsubscribes() -> None:
+    """
+    Test that only the current algorithm of the engine still handles events
+    """
+
+    async def _run() -> tuple[list[object], list[_Recording], set[object]]:
+        bus = UARTBus()
+        engine = Engine(create_network)
+        engine.init(bus, manual=True)
+        algorithms: list[object] = []
+        for _ in range(3):
+            engine.change_algorithm(_Recording)
+            algorithms.append(engine.algorithm)
+
+        await bus.mock_receive_message(_POINT_REACHED)
+        await asyncio.sleep(0.01)
+        owners = {
+            subscription.owner
+            for event in UARTEvent
+            for subscription in engine.receiver.subscriptions(event)
+        }
+        return algorithms, _Recording.handled, owners
+
+    algorithms, handled, owners = asyncio.run(_run())
+
+    assert handled == [algorithms[-1]]
+    assert algorithms[-1] in owners
+    assert not owners & set(algorithms[:-1])
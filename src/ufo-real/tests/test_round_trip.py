@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""uart round-trip tracking tests"""
+
+__copyright__ = "Copyright (c) 2025 HSLU PREN Team 2, FS25. All rights reserved."
+
+
+import asyncio
+
+from uart.mock.bus import UARTBus
+from uart.protocol import UARTCommand, UARTEvent
+from uart.receiver import UARTReceiver
+from uart.round_trip import RollingHistogram, RoundTripTracker
+from uart.schema import encode_frame, get_codec
+from uart.sender import UARTSender
+
+
+def test_rolling_histogram() -> None:
+    """
+    Test the window, percentiles and buckets of the histogram
+    """
+    histogram = RollingHistogram(window=4)
+    for seconds in (9.0, 0.01, 0.2, 0.3, 0.4):
+        histogram.add(seconds)
+
+    assert len(histogram) == 4  # 9.0 fell out of the window
+    assert histogram.percentile(0.5) == 0.3
+    assert histogram.json()["max"] == 0.4
+    assert histogram.buckets()[:4] == [1, 0, 1, 2]
+
+
+def test_turn_answered_by_aligned() -> None:
+    """
+    Test that a turn is matched to ALIGNED per command, edge and angle
+    """
+
+    async def _run() -> RoundTripTracker:
+        bus = UARTBus()
+        sender = UARTSender(bus)
+        tracker = RoundTripTracker(
+            sender, UARTReceiver(bus), edge_provider=lambda: "A-B"
+        )
+
+        await sender.turn(92)
+        await sender.set_speed(50)  # no answer expected
+        assert tracker.pending == [UARTCommand.TURN]
+        await asyncio.sleep(0.02)
+        await bus.mock_receive_message(get_codec(UARTEvent.ALIGNED).frame(1))
+        await asyncio.sleep(0.01)
+        return tracker
+
+    tracker = asyncio.run(_run())
+
+    assert not tracker.pending
+    assert len(tracker.by_command["TURN"]) == 1
+    assert tracker.by_command["TURN"].percentile(0.5) >= 0.02
+    assert len(tracker.by_edge["A-B"]) == 1
+    assert len(tracker.by_angle[90]) == 1
+    assert "SET_SPEED" not in tracker.by_command
+
+
+def test_timeout_is_flagged() -> None:
+    """
+    Test that a command without an answer counts as timed out
+    """
+
+    async def _run() -> RoundTripTracker:
+        bus = UARTBus()
+        sender = UARTSender(bus)
+        tracker = RoundTripTracker(
+            sender, UARTReceiver(bus), timeouts={UARTCommand.FOLLOW_LINE: 0.01}
+        )
+        await sender.follow_line()
+        await asyncio.sleep(0.05)
+        # a late answer is no longer matched
+        await bus.mock_receive_message(encode_frame(UARTEvent.POINT_REACHED.value))
+        await asyncio.sleep(0.01)
+        return tracker
+
+    tracker = asyncio.run(_run())
+
+    assert tracker.by_command["FOLLOW_LINE"].timeouts == 1
+    assert len(tracker.by_command["FOLLOW_LINE"]) == 0
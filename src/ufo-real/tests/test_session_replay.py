@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+"""uart session recorder and replay tests"""
+
+__copyright__ = "Copyright (c) 2025 HSLU PREN Team 2, FS25. All rights reserved."
+
+
+import asyncio
+from pathlib import Path
+from typing import BinaryIO, cast
+
+import pytest
+
+from uart.bus import UARTBus
+from uart.mock.replay_bus import ReplayUARTBus
+from uart.protocol import UARTCommand, UARTEvent
+from uart.receiver import UARTReceiver
+from uart.recorder import INDEX_INTERVAL, Direction, SessionRecorder, read_recording
+from uart.schema import encode_frame, get_codec
+from uart.sender import UARTSender
+
+_POINT_REACHED = encode_frame(UARTEvent.POINT_REACHED.value)
+_ALIGNED = get_codec(UARTEvent.ALIGNED).frame(0)
+
+
+class _Writer:
+    """stream writer stand-in"""
+
+    def __init__(self) -> None:
+        self.data = b""
+
+    def write(self, data: bytes) -> None:
+        """write"""
+        self.data += data
+
+    async def drain(self) -> None:
+        """drain"""
+
+
+def _record_session(path: Path) -> None:
+    """a turn answered by ALIGNED, then following the line to the next point"""
+
+    async def _run() -> None:
+        recorder = SessionRecorder(path)
+        reader = asyncio.StreamReader()
+        bus = UARTBus(reader, _Writer(), recorder=recorder)  # type: ignore[arg-type]
+        await bus.start()
+        sender = UARTSender(bus)
+        await sender.turn(90)
+        reader.feed_data(_ALIGNED)
+        await asyncio.sleep(0.01)
+        await sender.follow_line()
+        reader.feed_data(_POINT_REACHED)
+        await asyncio.sleep(0.01)
+        bus.outbound.stop()
+        recorder.close()
+
+    asyncio.run(_run())
+
+
+def test_record_bus(tmp_path: Path) -> None:
+    """
+    Test that the bus records every inbound and outbound byte in order
+    """
+    path = tmp_path / "session.uart"
+    _record_session(path)
+
+    records = list(read_recording(path))
+
+    assert b"".join(r.data for r in records if r.direction == Direction.INBOUND) == (
+        _ALIGNED + _POINT_REACHED
+    )
+    assert b"".join(r.data for r in records if r.direction == Direction.OUTBOUND) == (
+        get_codec(UARTCommand.TURN).frame(90, True)
+        + encode_frame(UARTCommand.FOLLOW_LINE.value)
+    )
+    assert all(a.timestamp <= b.timestamp for a, b in zip(records, records[1:]))
+
+
+def test_index_seek(tmp_path: Path) -> None:
+    """
+    Test that reading from a point in time skips the earlier records
+    """
+    path = tmp_path / "session.uart"
+    recorder = SessionRecorder(path)
+    for _ in range(3 * INDEX_INTERVAL):
+        recorder.record(Direction.INBOUND, _POINT_REACHED)
+    middle = list(read_recording(path))  # flushed at the index entries
+    recorder.close()
+
+    start = middle[2 * INDEX_INTERVAL - 1].timestamp
+    records = list(read_recording(path, start))
+
+    assert records[0].timestamp >= start
+    assert len(records) <= INDEX_INTERVAL + 1
+    assert path.with_name("session.uart.idx").stat().st_size == 3 * 16
+
+
+@pytest.mark.parametrize("speed", [None, 4.0])
+def test_replay(tmp_path: Path, speed: float | None) -> None:
+    """
+    Test that a replay feeds the events and checks the commands sent
+    """
+    path = tmp_path / "session.uart"
+    _record_session(path)
+
+    async def _run(turn: int) -> ReplayUARTBus:
+        bus = ReplayUARTBus(path, speed=speed)
+        sender = UARTSender(bus)
+        receiver = UARTReceiver(bus)
+
+        async def _on_aligned() -> None:
+            await sender.follow_line()
+
+        receiver.on(UARTEvent.ALIGNED, _on_aligned)
+        await sender.turn(turn)
+        await bus.start()
+        await bus.wait_finished()
+        await asyncio.sleep(0.01)
+        bus.stop()
+        return bus
+
+    asyncio.run(_run(90)).assert_commands_match()
+
+    diverged = asyncio.run(_run(-90))
+    assert len(diverged.mismatches) == 1
+    with pytest.raises(AssertionError):
+        diverged.assert_commands_match()
+
+
+def test_recorder_open_failure(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test that the recording is closed again if its index can not be opened
+    """
+    opened: list[BinaryIO] = []
+
+    def _open(path: Path, mode: str) -> BinaryIO:
+        # pylint: disable-next=consider-using-with # closed by the recorder
+        file = cast(BinaryIO, open(path, mode))  # noqa: SIM115
+        opened.append(file)
+        return file
+
+    monkeypatch.setattr("uart.recorder.open", _open, raising=False)
+    (tmp_path / "session.ufo.idx").mkdir()  # the index can not be a file
+
+    with pytest.raises(IsADirectoryError):
+        SessionRecorder(tmp_path / "session.ufo")
+
+    assert len(opened) == 1
+    assert opened[0].closed
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""sparse dijkstra pathfinder tests"""
+
+__copyright__ = "Copyright (c) 2025 HSLU PREN Team 2, FS25. All rights reserved."
+
+import pytest
+
+from common.competition import create_network
+from network.edge import Edge
+from network.network import Network
+from network.node import Node, NodeLabel, NodeType
+from pathfinder.sparse_dijkstra import SparseDijkstraPathfinder
+
+
+def test_cache(network: Network) -> None:
+    """
+    Test that the CSR graph is kept for the same network and rebuilt for another
+    """
+    pathfinder = SparseDijkstraPathfinder()
+    b = network.get_node_by_label(NodeLabel.B)
+
+    pathfinder.find_path(network, network.start, b)
+    structure = pathfinder._structure  # pylint: disable=protected-access
+    network.get_node_by_label(NodeLabel.X).disabled = True
+    path = pathfinder.find_path(network, network.start, b)
+
+    assert pathfinder._structure is structure  # pylint: disable=protected-access
+    assert [node.label for node in path] == [
+        NodeLabel.START,
+        NodeLabel.Z,
+        NodeLabel.Y,
+        NodeLabel.B,
+    ]
+
+    other = create_network()
+    path = pathfinder.find_path(
+        other, other.start, other.get_node_by_label(NodeLabel.B)
+    )
+
+    assert pathfinder._structure is not structure  # pylint: disable=protected-access
+    assert [node.label for node in path] == [
+        NodeLabel.START,
+        NodeLabel.X,
+        NodeLabel.Y,
+        NodeLabel.B,
+    ]
+
+
+def test_rebuild_on_new_edge() -> None:
+    """
+    Test that the CSR graph is rebuilt once the network got another edge
+    """
+    network = Network()
+    start = Node(0, 0, NodeLabel.START, NodeType.START)
+    x = Node(5, 0, NodeLabel.X)
+    a = Node(10, 0, NodeLabel.A, NodeType.END)
+    network.add_edge(Edge(start, x))
+    pathfinder = SparseDijkstraPathfinder()
+
+    with pytest.raises(ValueError):
+        pathfinder.find_path(network, start, a)
+    structure = pathfinder._structure  # pylint: disable=protected-access
+
+    network.add_edge(Edge(x, a))
+    path = pathfinder.find_path(network, start, a)
+
+    assert pathfinder._structure is not structure  # pylint: disable=protected-access
+    assert path == [start, x, a]
+
+
+def test_unreachable(network: Network) -> None:
+    """
+    Test that an end cut off by disabled edges raises ValueError
+    """
+    b = network.get_node_by_label(NodeLabel.B)
+    for _, edge in network.neighbours(b):
+        edge.disabled = True
+
+    with pytest.raises(ValueError):
+        SparseDijkstraPathfinder().find_path(network, network.start, b)
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+"""uart protocol schema tests"""
+
+__copyright__ = "Copyright (c) 2025 HSLU PREN Team 2, FS25. All rights reserved."
+
+
+import random
+
+from uart.frame_parser import FrameParser
+from uart.protocol import UARTCommand, UARTEvent
+from uart.schema import Endianness, checksum, encode_frame, get_codec
+
+
+def test_specification_examples() -> None:
+    """
+    Test the example messages of the protocol specification
+    """
+    turn = get_codec(UARTCommand.TURN)
+
+    # the specification lists 0x5C, but the XOR of the bytes is 0x5A
+    assert turn.frame(90, True) == bytes([0x01, 0x5A, 0x00, 0x01, 0x5A])
+    assert get_codec(UARTEvent.START).frame(1) == bytes([0x10, 0x01, 0x11])
+    assert encode_frame(UARTCommand.FOLLOW_LINE.value) == bytes([0x02, 0x02])
+    assert turn.unpack(bytes([0x5A, 0x00, 0x01])) == (90, True)
+    assert get_codec(UARTCommand.TURN, Endianness.BIG).pack(90, True) == bytes(
+        [0x00, 0x5A, 0x01]
+    )
+
+
+def test_checksum_long_messages() -> None:
+    """
+    Test that the folded checksum matches the plain XOR for any size
+    """
+    rng = random.Random(3)
+    for size in (0, 1, 15, 16, 17, 63, 255):
+        data = bytes(rng.randrange(256) for _ in range(size))
+        expected = 0x17
+        for byte in data:
+            expected ^= byte
+
+        assert checksum(data, 0x17) == expected
+
+
+def test_log_message_round_trip() -> None:
+    """
+    Test that an encoded log message is parsed back
+    """
+    message = b"battery low, " * 10
+    frame = get_codec(UARTEvent.LOG_MESSAGE).frame(message)
+
+    assert FrameParser().feed(frame) == [(UARTEvent.LOG_MESSAGE, message)]
@@ -3,11 +3,16 @@
 
 __copyright__ = "Copyright (c) 2025 HSLU PREN Team 2, FS25. All rights reserved."
 
+from functools import partial
 from typing import Awaitable, Callable
 import asyncio
 import logging
 
+from .command_writer import CommandWriter
+from .dispatcher import EventDispatcher
 from .protocol import UARTEvent, UARTCommand, UARTProtocol
+from .recorder import Direction, SessionRecorder
+from .schema import EVENT_PAYLOAD_SIZES, checksum
 
 
 class UARTBus(UARTProtocol):
@@ -17,11 +22,17 @@ class UARTBus(UARTProtocol):
         self,
         reader: asyncio.StreamReader,
         writer: asyncio.StreamWriter,
+        *,
+        recorder: SessionRecorder | None = None,
     ) -> None:
         self._reader = reader
         self._writer = writer
+        self._recorder = recorder
         self._logger = logging.getLogger("uart.bus")
         self._event_handlers: set[Callable[[UARTEvent, bytes], Awaitable[None]]] = set()
+        self._dispatcher = EventDispatcher()
+        # the only one writing to the stream, callers never interleave
+        self._outbound = CommandWriter(self._write, writer.drain)
 
     async def start(self) -> None:
         """Start the UART protocol."""
@@ -32,54 +43,66 @@ class UARTBus(UARTProtocol):
         """Return the set of event handlers"""
         return self._event_handlers
 
+    @property
+    def dispatcher(self) -> EventDispatcher:
+        """Return the dispatcher handing the events to the handlers."""
+        return self._dispatcher
+
+    @property
+    def outbound(self) -> CommandWriter:
+        """Return the writer of the outbound commands."""
+        return self._outbound
+
     def calculate_checksum(self, data: bytes) -> int:
         """Compute the XOR checksum of the given data."""
-        checksum = 0
-        for byte in data:
-            checksum ^= byte
-        return checksum
+        return checksum(data)
 
     async def send_command(self, command: UARTCommand, payload: bytes = b"") -> None:
         """Send a command with an optional payload."""
-        message = bytes([command.value]) + payload
-        checksum = self.calculate_checksum(message)
-        self._writer.write(message + bytes([checksum]))
         self._logger.debug("Sending command: %s, payload: %s", command, payload)
-        await self._writer.drain()
+        await self._outbound.send(command, payload)
+
+    def _write(self, data: bytes) -> None:
+        if self._recorder is not None:
+            self._recorder.record(Direction.OUTBOUND, data)
+        self._writer.write(data)
+
+    async def _read(self, size: int) -> bytes:
+        data = await self._reader.readexactly(size)
+        if self._recorder is not None:
+            self._recorder.record(Direction.INBOUND, data)
+        return data
 
     async def _receive_event(self) -> None:
         """Receive and process an event message."""
-        data = await self._reader.readexactly(1)
+        data = await self._read(1)
         event_id = data[0]
 
-        if event_id not in UARTEvent:
+        if event_id not in EVENT_PAYLOAD_SIZES:
             self._logger.warning("Unknown event: %s", event_id)
             return None
 
         self._logger.debug("Received event: %s", event_id)
 
-        payload = b""
-        if event_id in (UARTEvent.START.value, UARTEvent.ALIGNED.value):
-            payload = await self._reader.readexactly(1)
-        if event_id == UARTEvent.LOG_MESSAGE.value:
-            payload_size = await self._reader.readexactly(1)
-            payload = await self._reader.readexactly(payload_size[0])
+        size = EVENT_PAYLOAD_SIZES[event_id]
+        if size is None:  # length prefixed
+            size = (await self._read(1))[0]
+        payload = await self._read(size) if size else b""
 
-        checksum = await self._reader.readexactly(1)
-        message = bytes([event_id]) + payload
+        received = await self._read(1)
 
-        if self.calculate_checksum(message) != checksum[0]:
+        if checksum(payload, event_id) != received[0]:
             self._logger.warning("Checksum mismatch! Ignoring message.")
             return None
 
         if event_id in UARTEvent:
             event = UARTEvent(event_id)
-            await self._fire_event(event, payload)
+            self._fire_event(event, payload)
 
-    async def _fire_event(self, event: UARTEvent, payload: bytes) -> None:
-        """Call all event handlers for the given event."""
+    def _fire_event(self, event: UARTEvent, payload: bytes) -> None:
+        """Queue the event for all event handlers, never waits for them."""
         for handler in self._event_handlers:
-            await handler(event, payload)
+            self._dispatcher.dispatch(handler, event, partial(handler, event, payload))
 
     async def _handle_events(self) -> None:
         """Continuously read and process incoming events."""
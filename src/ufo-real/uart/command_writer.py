@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+"""UART outbound command writer module."""
+
+__copyright__ = "Copyright (c) 2025 HSLU PREN Team 2, FS25. All rights reserved."
+
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable
+
+from .protocol import UARTCommand
+from .schema import encode_frame
+
+
+@dataclass
+class CommandLatency:
+    """Time from queueing a command until it was written and drained."""
+
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+    @property
+    def mean(self) -> float:
+        """Mean latency in seconds."""
+        return self.total / self.count if self.count else 0.0
+
+    def add(self, seconds: float) -> None:
+        """Add a measurement."""
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+
+@dataclass
+class WriterStatistics:
+    """Counters of the command writer."""
+
+    sent: int = 0
+    writes: int = 0  # coalesced writes, each one followed by one drain
+    collapsed: int = 0  # SET_SPEED commands replaced by a newer one
+    prioritised: int = 0
+    failed: int = 0
+    max_depth: int = 0
+    latency: dict[UARTCommand, CommandLatency] = field(default_factory=dict)
+
+
+@dataclass
+class _Outbound:
+    command: UARTCommand
+    frame: bytes
+    queued_at: float
+    futures: list[asyncio.Future[None]]
+
+
+class CommandWriter:  # pylint: disable=too-many-instance-attributes
+    """
+    Single writer of the outbound commands. Callers queue their command\n
+    and wait until it was written, one task writes everything that is\n
+    queued at once and drains only once per write.\n
+    Stopping (speed 0) and DESTINAITON_REACHED jump the queue. Optionally\n
+    the waiting SET_SPEEDs are replaced by a newer one, only the latest\n
+    speed is sent.
+    """
+
+    def __init__(
+        self,
+        write: Callable[[bytes], None],
+        drain: Callable[[], Awaitable[object]],
+        *,
+        collapse_speed: bool = True,
+    ) -> None:
+        self._write = write
+        self._drain = drain
+        self._collapse_speed = collapse_speed
+        self._priority: deque[_Outbound] = deque()
+        self._normal: deque[_Outbound] = deque()
+        self._wakeup = asyncio.Event()
+        self._worker: asyncio.Task[None] | None = None
+        self._statistics = WriterStatistics()
+        self._logger = logging.getLogger("uart.writer")
+
+    @property
+    def statistics(self) -> WriterStatistics:
+        """Counters of the writer."""
+        return self._statistics
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of commands waiting to be written."""
+        return len(self._priority) + len(self._normal)
+
+    async def send(self, command: UARTCommand, payload: bytes = b"") -> None:
+        """Queue a command, returns once it was written and drained."""
+        self._ensure_worker()
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        outbound = _Outbound(
+            command, encode_frame(command.value, payload), time.monotonic(), [future]
+        )
+
+        priority = _is_priority(command, payload)
+        # a stop always supersedes the speeds still waiting, they would
+        # otherwise be sent after it and start the vehicle again
+        if command == UARTCommand.SET_SPEED and (priority or self._collapse_speed):
+            self._collapse(outbound)
+        if priority:
+            self._statistics.prioritised += 1
+            self._priority.append(outbound)
+        else:
+            self._normal.append(outbound)
+
+        self._statistics.max_depth = max(self._statistics.max_depth, self.queue_depth)
+        self._wakeup.set()
+        await future
+
+    def stop(self) -> None:
+        """Stop the writer, the waiting commands are cancelled."""
+        if self._worker is not None:
+            self._worker.cancel()
+            self._worker = None
+        for outbound in (*self._priority, *self._normal):
+            for future in outbound.futures:
+                future.cancel()
+        self._priority.clear()
+        self._normal.clear()
+
+    def _collapse(self, outbound: _Outbound) -> None:
+        """drop all the waiting SET_SPEED, their callers wait for the new one"""
+        waiting = [o for o in self._normal if o.command == UARTCommand.SET_SPEED]
+        for superseded in waiting:
+            self._normal.remove(superseded)
+            outbound.futures.extend(superseded.futures)
+            outbound.queued_at = min(outbound.queued_at, superseded.queued_at)
+        self._statistics.collapsed += len(waiting)
+
+    def _ensure_worker(self) -> None:
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._work())
+
+    async def _work(self) -> None:
+        while True:
+            if not self._priority and not self._normal:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            batch = [*self._priority, *self._normal]
+            self._priority.clear()
+            self._normal.clear()
+
+            try:
+                self._write(b"".join(outbound.frame for outbound in batch))
+                await self._drain()
+            except OSError as e:  # ConnectionError, serial.SerialException
+                self._statistics.failed += len(batch)
+                self._logger.error("Writing %d commands failed: %s", len(batch), e)
+                for outbound in batch:
+                    for future in outbound.futures:
+                        if not future.done():
+                            future.set_exception(e)
+                continue
+
+            done = time.monotonic()
+            self._statistics.writes += 1
+            for outbound in batch:
+                self._statistics.sent += 1
+                self._statistics.latency.setdefault(
+                    outbound.command, CommandLatency()
+                ).add(done - outbound.queued_at)
+                for future in outbound.futures:
+                    if not future.done():
+                        future.set_result(None)
+
+
+def _is_priority(command: UARTCommand, payload: bytes) -> bool:
+    """stopping the vehicle never waits behind other commands"""
+    if command == UARTCommand.SET_SPEED:
+        return payload == b"\x00"
+    return command == UARTCommand.DESTINAITON_REACHED
@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+"""UART event dispatcher module."""
+
+__copyright__ = "Copyright (c) 2025 HSLU PREN Team 2, FS25. All rights reserved."
+
+import asyncio
+import logging
+import time
+from collections import deque
+from collections.abc import Hashable
+from dataclasses import dataclass
+from enum import Enum
+from typing import Awaitable, Callable
+
+from .protocol import UARTEvent
+
+CallT = Callable[[], Awaitable[None]]
+
+
+class DispatchOrder(Enum):
+    """In which order the events reach a subscriber."""
+
+    SEQUENTIAL = "sequential"  # one after another, in the order received
+    PER_EVENT = "per_event"  # in order per event type, types run side by side
+    CONCURRENT = "concurrent"  # all at once, no ordering at all
+
+
+@dataclass
+class SubscriberStatistics:
+    """Counters of one subscriber."""
+
+    delivered: int = 0
+    failed: int = 0
+    overflowed: int = 0  # dropped because the queue was full
+    slow: int = 0  # exceeded the latency budget
+    max_depth: int = 0
+    max_latency: float = 0.0  # seconds from dispatch to the end of the handler
+
+
+@dataclass
+class _Call:
+    event: UARTEvent
+    call: CallT
+    queued_at: float
+
+
+class _Lane:
+    """bounded queue of one subscriber (and event type), drained by a task"""
+
+    def __init__(self) -> None:
+        self.queue: deque[_Call] = deque()
+        self.wakeup = asyncio.Event()
+        self.worker: asyncio.Task[None] | None = None
+
+
+class EventDispatcher:
+    """
+    Hands the events to the subscribers without ever waiting for them.\n
+    Every subscriber gets a bounded queue drained by its own task, so a\n
+    slow handler only delays itself. Once a queue is full the oldest\n
+    waiting event is dropped and counted as overflowed.
+    """
+
+    def __init__(
+        self,
+        *,
+        order: DispatchOrder = DispatchOrder.SEQUENTIAL,
+        max_queue: int = 64,
+        latency_budget: float = 0.1,
+        name: str = "uart.dispatch",
+    ) -> None:
+        if max_queue < 1:
+            raise ValueError("The queue needs to hold at least one event.")
+        self._order = order
+        self._max_queue = max_queue
+        self._latency_budget = latency_budget
+        self._lanes: dict[Hashable, _Lane] = {}
+        self._running: dict[Hashable, set[asyncio.Task[None]]] = {}
+        self._statistics: dict[Hashable, SubscriberStatistics] = {}
+        self._logger = logging.getLogger(name)
+
+    @property
+    def statistics(self) -> dict[Hashable, SubscriberStatistics]:
+        """Counters per subscriber."""
+        return self._statistics
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of events waiting over all subscribers."""
+        return sum(len(lane.queue) for lane in self._lanes.values()) + sum(
+            len(tasks) for tasks in self._running.values()
+        )
+
+    def dispatch(self, subscriber: Hashable, event: UARTEvent, call: CallT) -> None:
+        """Queue ``call`` for ``subscriber``, returns immediately."""
+        statistics = self._statistics.setdefault(subscriber, SubscriberStatistics())
+        queued = _Call(event, call, time.monotonic())
+
+        if self._order == DispatchOrder.CONCURRENT:
+            running = self._running.setdefault(subscriber, set())
+            if len(running) >= self._max_queue:
+                self._overflow(subscriber, statistics, event)
+                return
+            task = asyncio.create_task(self._run(subscriber, statistics, queued))
+            running.add(task)
+            task.add_done_callback(running.discard)
+            statistics.max_depth = max(statistics.max_depth, len(running))
+            return
+
+        key = (
+            (subscriber, event)
+            if self._order == DispatchOrder.PER_EVENT
+            else subscriber
+        )
+        lane = self._lanes.get(key)
+        if lane is None:
+            lane = self._lanes[key] = _Lane()
+        if len(lane.queue) >= self._max_queue:
+            lane.queue.popleft()
+            self._overflow(subscriber, statistics, event)
+        lane.queue.append(queued)
+        statistics.max_depth = max(statistics.max_depth, len(lane.queue))
+        lane.wakeup.set()
+        if lane.worker is None or lane.worker.done():
+            lane.worker = asyncio.create_task(self._drain(subscriber, statistics, lane))
+
+    def stop(self) -> None:
+        """Cancel all the workers and drop the waiting events."""
+        for lane in self._lanes.values():
+            lane.queue.clear()
+            if lane.worker is not None:
+                lane.worker.cancel()
+        for tasks in self._running.values():
+            for task in tasks:
+                task.cancel()
+        self._lanes.clear()
+        self._running.clear()
+
+    def _overflow(
+        self, subscriber: Hashable, statistics: SubscriberStatistics, event: UARTEvent
+    ) -> None:
+        statistics.overflowed += 1
+        self._logger.warning(
+            "Queue of %s is full, dropped an event (%s)", _name(subscriber), event
+        )
+
+    async def _drain(
+        self, subscriber: Hashable, statistics: SubscriberStatistics, lane: _Lane
+    ) -> None:
+        while True:
+            if not lane.queue:
+                lane.wakeup.clear()
+                await lane.wakeup.wait()
+                continue
+            await self._run(subscriber, statistics, lane.queue.popleft())
+
+    async def _run(
+        self, subscriber: Hashable, statistics: SubscriberStatistics, queued: _Call
+    ) -> None:
+        started = time.monotonic()
+        try:
+            await queued.call()
+        except Exception as e:  # pylint: disable=broad-except
+            statistics.failed += 1
+            self._logger.error(
+                "Error in handler %s for event %s: %s",
+                _name(subscriber),
+                queued.event,
+                e,
+                exc_info=True,
+            )
+        else:
+            statistics.delivered += 1
+
+        finished = time.monotonic()
+        statistics.max_latency = max(
+            statistics.max_latency, finished - queued.queued_at
+        )
+        if finished - started > self._latency_budget:
+            statistics.slow += 1
+            self._logger.warning(
+                "Handler %s took %.3fs for %s (budget %.3fs)",
+                _name(subscriber),
+                finished - started,
+                queued.event,
+                self._latency_budget,
+            )
+
+
+def _name(subscriber: Hashable) -> str:
+    """readable name of a subscriber (a handler or the object owning handlers)"""
+    if isinstance(subscriber, str):
+        return subscriber
+    qualname = getattr(subscriber, "__qualname__", None)
+    if qualname is not None:
+        return str(qualname)
+    return subscriber.__class__.__name__
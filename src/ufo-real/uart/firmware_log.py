@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+"""Firmware log (``LOG_MESSAGE``) sink module."""
+
+__copyright__ = "Copyright (c) 2025 HSLU PREN Team 2, FS25. All rights reserved."
+
+import asyncio
+import datetime
+import logging
+import logging.handlers
+import queue
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Awaitable, Callable
+
+_MAX_BYTES = 1 << 20  # per log file
+_BACKUP_COUNT = 3  # rotated files kept
+
+
+@dataclass
+class FirmwareLogLine:
+    """One decoded line of the firmware log."""
+
+    message: str
+    timestamp: datetime.datetime = field(default_factory=datetime.datetime.now)
+
+    def json(self) -> dict[str, str]:
+        """json"""
+        return {"message": self.message, "timestamp": self.timestamp.isoformat()}
+
+
+@dataclass
+class FirmwareLogStatistics:
+    """Counters of the firmware log sink."""
+
+    received: int = 0
+    written: int = 0
+    overflowed: int = 0  # dropped because the queue was full
+    rate_limited: int = 0  # dropped because of too many lines per second
+    max_depth: int = 0
+
+
+class FirmwareLogSink:  # pylint: disable=too-many-instance-attributes
+    """
+    Takes the raw ``LOG_MESSAGE`` payloads off the receive path: they are\n
+    only queued there, decoding and writing happens in a background task.\n
+    At most ``max_rate`` lines per second (bursts up to ``burst``) are\n
+    written, the rest is dropped and counted. With a ``path`` the lines go\n
+    to a rotating file, written by a thread so the loop never waits for\n
+    the disk, otherwise to the logger ``name``.
+    """
+
+    def __init__(
+        self,
+        path: Path | str | None = None,
+        *,
+        max_rate: float = 200.0,
+        burst: int = 50,
+        max_queue: int = 1024,
+        name: str = "uart.firmware",
+    ) -> None:
+        self._max_rate = max_rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._refilled = time.monotonic()
+        self._pending: deque[bytes] = deque()
+        self._max_queue = max_queue
+        self._wakeup = asyncio.Event()
+        self._worker: asyncio.Task[None] | None = None
+        self._statistics = FirmwareLogStatistics()
+        self._recent: deque[FirmwareLogLine] = deque(maxlen=50)
+        self.listeners: list[Callable[[FirmwareLogLine], Awaitable[None]]] = []
+
+        self._logger = logging.getLogger(name)
+        self._listener: logging.handlers.QueueListener | None = None
+        self._queue_handler: logging.Handler | None = None
+        if path is not None:
+            file_handler = logging.handlers.RotatingFileHandler(
+                path, maxBytes=_MAX_BYTES, backupCount=_BACKUP_COUNT, encoding="utf-8"
+            )
+            file_handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+            records: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+            self._queue_handler = logging.handlers.QueueHandler(records)
+            self._logger.addHandler(self._queue_handler)
+            self._logger.setLevel(logging.DEBUG)
+            self._logger.propagate = False
+            self._listener = logging.handlers.QueueListener(records, file_handler)
+            self._listener.start()
+
+    @property
+    def statistics(self) -> FirmwareLogStatistics:
+        """Counters of the sink."""
+        return self._statistics
+
+    @property
+    def recent(self) -> deque[FirmwareLogLine]:
+        """The last lines written."""
+        return self._recent
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of payloads waiting to be decoded."""
+        return len(self._pending)
+
+    def submit(self, payload: bytes) -> None:
+        """Queue a raw payload, never blocks."""
+        self._statistics.received += 1
+        if len(self._pending) >= self._max_queue:
+            self._statistics.overflowed += 1
+            return
+        self._pending.append(payload)
+        self._statistics.max_depth = max(self._statistics.max_depth, len(self._pending))
+        self._ensure_worker()
+        self._wakeup.set()
+
+    def stop(self) -> None:
+        """Stop writing, the waiting payloads are dropped."""
+        if self._worker is not None:
+            self._worker.cancel()
+            self._worker = None
+        self._pending.clear()
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+        if self._queue_handler is not None:
+            self._logger.removeHandler(self._queue_handler)
+            self._logger.propagate = True
+            self._queue_handler = None
+
+    def _ensure_worker(self) -> None:
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._work())
+
+    def _take_token(self) -> bool:
+        now = time.monotonic()
+        self._tokens = min(
+            self._burst, self._tokens + (now - self._refilled) * self._max_rate
+        )
+        self._refilled = now
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+    async def _work(self) -> None:
+        dropped = 0
+        while True:
+            if not self._pending:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            payload = self._pending.popleft()
+            if not self._take_token():
+                self._statistics.rate_limited += 1
+                dropped += 1
+                continue
+            if dropped:
+                self._logger.debug("(%d lines dropped)", dropped)
+                dropped = 0
+
+            line = FirmwareLogLine(payload.decode("utf-8", "replace").strip("\x00"))
+            self._logger.debug("DEBUG: %s", line.message)
+            self._statistics.written += 1
+            self._recent.append(line)
+            for listener in self.listeners:
+                try:
+                    await listener(line)
+                except Exception as e:  # pylint: disable=broad-except
+                    self._logger.error("Firmware log listener failed: %s", e)
+            await asyncio.sleep(0)  # control events go first
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+"""Incremental UART frame parser."""
+
+__copyright__ = "Copyright (c) 2025 HSLU PREN Team 2, FS25. All rights reserved."
+
+import logging
+from dataclasses import dataclass
+
+from .protocol import UARTEvent
+from .schema import EVENT_PAYLOAD_SIZES, checksum
+
+# event and payload size per event id, looked up once per frame
+_LAYOUTS: dict[int, tuple[UARTEvent, int | None]] = {
+    event_id: (UARTEvent(event_id), size)
+    for event_id, size in EVENT_PAYLOAD_SIZES.items()
+}
+
+
+@dataclass
+class ParserStatistics:
+    """Counters of the frame parser."""
+
+    frames: int = 0
+    unknown_bytes: int = 0
+    checksum_errors: int = 0
+    dropped_bytes: int = 0
+
+
+class FrameParser:
+    """
+    Splits a byte stream into events. Bytes can be fed in chunks of any\n
+    size, incomplete frames are kept until the rest arrives. An unknown\n
+    event id or a checksum mismatch drops a single byte and parsing\n
+    resumes at the next one, so the stream resynchronises by itself.
+    """
+
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+        self._statistics = ParserStatistics()
+        self._logger = logging.getLogger("uart.parser")
+
+    @property
+    def statistics(self) -> ParserStatistics:
+        """Counters of the parser."""
+        return self._statistics
+
+    @property
+    def pending(self) -> int:
+        """Number of bytes waiting for the rest of their frame."""
+        return len(self._buffer)
+
+    def feed(self, data: bytes) -> list[tuple[UARTEvent, bytes]]:
+        """Add received bytes, returns all the events they completed."""
+        self._buffer += data
+        events: list[tuple[UARTEvent, bytes]] = []
+        view = memoryview(self._buffer)
+        try:
+            position = self._parse(view, events)
+        finally:
+            view.release()
+        # compact once per chunk instead of once per frame
+        del self._buffer[:position]
+        return events
+
+    def _parse(self, view: memoryview, events: list[tuple[UARTEvent, bytes]]) -> int:
+        """parse all the complete frames, returns the position of the first unparsed byte"""
+        position = 0
+        end = len(view)
+        while position < end:
+            event_id = view[position]
+            layout = _LAYOUTS.get(event_id)
+            if layout is None:
+                self._statistics.unknown_bytes += 1
+                self._statistics.dropped_bytes += 1
+                self._logger.warning("Unknown event: %s", event_id)
+                position += 1
+                continue
+
+            event, size = layout
+            start = position + 1
+            if size is None:  # length prefixed
+                if start >= end:
+                    break
+                size = view[start]
+                start += 1
+
+            checksum_at = start + size
+            if checksum_at >= end:  # incomplete, wait for more data
+                break
+
+            payload = bytes(view[start:checksum_at])
+            if checksum(payload, event_id) != view[checksum_at]:
+                self._statistics.checksum_errors += 1
+                self._statistics.dropped_bytes += 1
+                self._logger.warning("Checksum mismatch! Resynchronising.")
+                position += 1
+                continue
+
+            events.append((event, payload))
+            self._statistics.frames += 1
+            position = checksum_at + 1
+        return position
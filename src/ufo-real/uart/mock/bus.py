@@ -7,6 +7,7 @@ from typing import Awaitable, Callable
 import logging
 
 from ..protocol import UARTEvent, UARTCommand, UARTProtocol
+from ..schema import checksum, encode_frame
 
 
 class UARTBus(UARTProtocol):
@@ -29,16 +30,11 @@ class UARTBus(UARTProtocol):
 
     def calculate_checksum(self, data: bytes) -> int:
         """Compute the XOR checksum of the given data."""
-        checksum = 0
-        for byte in data:
-            checksum ^= byte
-        return checksum
+        return checksum(data)
 
     async def send_command(self, command: UARTCommand, payload: bytes = b"") -> None:
         """Send a command with an optional payload."""
-        message = bytes([command.value]) + payload
-        checksum = self.calculate_checksum(message)
-        data = message + bytes([checksum])
+        data = encode_frame(command.value, payload)
         self._logger.debug("Sending command: %s, payload: %s", command, payload)
         self._commands.append(data)
 
@@ -53,11 +49,9 @@ class UARTBus(UARTProtocol):
         self._logger.debug("Received event: %s", event_id)
 
         payload = data[1:-1]
-        checksum = data[-1]
+        received = data[-1]
 
-        message = bytes([event_id]) + payload
-
-        if self.calculate_checksum(message) != checksum:
+        if checksum(payload, event_id) != received:
             self._logger.warning("Checksum mismatch! Ignoring message.")
             return None
 
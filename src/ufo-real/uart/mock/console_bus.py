@@ -10,6 +10,7 @@ import logging
 import aioconsole  # type: ignore
 
 from ..protocol import UARTEvent, UARTCommand, UARTProtocol
+from ..schema import checksum, encode_frame
 
 
 class ConsoleUARTBus(UARTProtocol):
@@ -32,16 +33,11 @@ class ConsoleUARTBus(UARTProtocol):
 
     def calculate_checksum(self, data: bytes) -> int:
         """Compute the XOR checksum of the given data."""
-        checksum = 0
-        for byte in data:
-            checksum ^= byte
-        return checksum
+        return checksum(data)
 
     async def send_command(self, command: UARTCommand, payload: bytes = b"") -> None:
         """Send a command with an optional payload."""
-        message = bytes([command.value]) + payload
-        checksum = self.calculate_checksum(message)
-        data = message + bytes([checksum])
+        data = encode_frame(command.value, payload)
         self._logger.debug("Sending command: %s, payload: %s", command, payload)
         await aioconsole.aprint(data)
 
@@ -56,10 +52,8 @@ class ConsoleUARTBus(UARTProtocol):
         self._logger.debug("Received event: %s", event_id)
 
         payload = data[1:-1]
-        checksum = data[-1]
-        message = bytes([event_id]) + payload
-
-        if self.calculate_checksum(message) != checksum:
+        received = data[-1]
+        if checksum(payload, event_id) != received:
             self._logger.warning("Checksum mismatch! Ignoring message.")
             return None
 
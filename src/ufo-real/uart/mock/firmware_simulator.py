@@ -0,0 +1,257 @@
+# -*- coding: utf-8 -*-
+"""
+Firmware stand-in speaking the UART protocol on a pseudo-terminal.
+
+Run ``python -m uart.mock.firmware_simulator`` and connect the application
+to the printed device, e.g. ``python main.py --bus /dev/pts/5``.
+"""
+
+__copyright__ = "Copyright (c) 2025 HSLU PREN Team 2, FS25. All rights reserved."
+
+import asyncio
+import logging
+import os
+import random
+import termios
+import tty
+from argparse import ArgumentParser
+from collections.abc import Coroutine
+from dataclasses import dataclass, field
+from typing import Any
+
+from ..protocol import UARTCommand, UARTEvent
+from ..schema import checksum, encode_frame, get_codec
+
+_BITS_PER_BYTE = 10  # 8N1: start bit, 8 data bits, stop bit
+_MIN_SLEEP = 0.002  # seconds
+_COMMAND_IDS = frozenset(command.value for command in UARTCommand)
+
+
+@dataclass
+class SimulatorConfig:
+    """Timing and error behaviour of the simulated firmware."""
+
+    baudrate: int | None = 115200  # pacing of the sent bytes, None = unpaced
+    # seconds from a command until its answer
+    delays: dict[UARTCommand, float] = field(
+        default_factory=lambda: {
+            UARTCommand.TURN: 0.5,
+            UARTCommand.FOLLOW_LINE: 2.0,
+        }
+    )
+    jitter: float = 0.0  # up to this many seconds are added to every delay
+    bit_error_rate: float = 0.0  # probability of a flipped bit per sent byte
+    start_delay: float | None = 1.0  # seconds until START is sent, None = never
+    target: int = 0  # 0 = A, 1 = B, 2 = C
+    seed: int | None = None
+
+
+@dataclass
+class SimulatorStatistics:
+    """Counters of the simulator."""
+
+    commands: int = 0
+    events: int = 0
+    corrupted: int = 0  # events sent with a flipped bit
+    rejected: int = 0  # bytes dropped while looking for a valid command
+
+
+class FirmwareSimulator:  # pylint: disable=too-many-instance-attributes
+    """
+    Answers the commands like the firmware would: a turn with ALIGNED and\n
+    following the line with POINT_REACHED, after the configured delay.
+    """
+
+    def __init__(self, fd: int, config: SimulatorConfig | None = None) -> None:
+        self._fd = fd
+        self._config = config or SimulatorConfig()
+        self._random = random.Random(self._config.seed)
+        self._buffer = bytearray()
+        self._outbox: asyncio.Queue[bytes] = asyncio.Queue()
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._statistics = SimulatorStatistics()
+        self._logger = logging.getLogger("uart.simulator")
+
+    @property
+    def statistics(self) -> SimulatorStatistics:
+        """Counters of the simulator."""
+        return self._statistics
+
+    def start(self) -> None:
+        """Start answering, needs a running event loop."""
+        asyncio.get_running_loop().add_reader(self._fd, self._on_readable)
+        self._spawn(self._write_loop())
+        if self._config.start_delay is not None:
+            self.send_later(
+                get_codec(UARTEvent.START).frame(self._config.target),
+                self._config.start_delay,
+            )
+
+    def stop(self) -> None:
+        """Stop answering."""
+        asyncio.get_running_loop().remove_reader(self._fd)
+        for task in self._tasks:
+            task.cancel()
+
+    def send_later(self, frame: bytes, delay: float) -> None:
+        """Send an event after ``delay`` seconds (plus jitter)."""
+        delay += self._random.uniform(0, self._config.jitter)
+        self._spawn(self._send_after(frame, delay))
+
+    def _spawn(self, coroutine: Coroutine[Any, Any, None]) -> None:
+        task = asyncio.create_task(coroutine)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _send_after(self, frame: bytes, delay: float) -> None:
+        if delay > 0:
+            await asyncio.sleep(delay)
+        await self._outbox.put(frame)
+
+    async def _write_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        line_free = loop.time()
+        while True:
+            frame = self._corrupt(await self._outbox.get())
+            os.write(self._fd, frame)
+            self._statistics.events += 1
+            if not self._config.baudrate:
+                continue
+            # the line is busy until the frame was shifted out, sleeping
+            # only once ahead by more than the timer resolution
+            now = loop.time()
+            line_free = max(line_free, now) + (
+                len(frame) * _BITS_PER_BYTE / self._config.baudrate
+            )
+            if line_free - now > _MIN_SLEEP:
+                await asyncio.sleep(line_free - now)
+
+    def _corrupt(self, frame: bytes) -> bytes:
+        if not self._config.bit_error_rate:
+            return frame
+        data = bytes(
+            byte ^ (1 << self._random.randrange(8))
+            if self._random.random() < self._config.bit_error_rate
+            else byte
+            for byte in frame
+        )
+        if data != frame:
+            self._statistics.corrupted += 1
+        return data
+
+    def _on_readable(self) -> None:
+        try:
+            self._buffer += os.read(self._fd, 1024)
+        except OSError:  # the other side closed the terminal
+            return
+        while self._buffer:
+            command = self._next_command()
+            if command is None:
+                return
+            self._answer(*command)
+
+    def _next_command(self) -> tuple[UARTCommand, bytes] | None:
+        """the next valid command of the buffer, ``None`` if incomplete"""
+        while self._buffer:
+            command_id = self._buffer[0]
+            if command_id not in _COMMAND_IDS:
+                del self._buffer[0]
+                self._statistics.rejected += 1
+                continue
+            command = UARTCommand(command_id)
+            size = get_codec(command).payload_size or 0
+            if len(self._buffer) < size + 2:
+                return None
+            payload = bytes(self._buffer[1 : 1 + size])
+            if checksum(payload, command_id) != self._buffer[1 + size]:
+                del self._buffer[0]
+                self._statistics.rejected += 1
+                continue
+            del self._buffer[: size + 2]
+            return command, payload
+        return None
+
+    def _answer(self, command: UARTCommand, payload: bytes) -> None:
+        self._statistics.commands += 1
+        self._logger.debug("Received %s %s", command.name, payload.hex())
+        delay = self._config.delays.get(command, 0.0)
+        if command == UARTCommand.TURN:
+            self.send_later(get_codec(UARTEvent.ALIGNED).frame(0), delay)
+        elif command == UARTCommand.FOLLOW_LINE:
+            self.send_later(encode_frame(UARTEvent.POINT_REACHED.value), delay)
+        elif command == UARTCommand.SET_DEBUG_LOGGING:
+            (enabled,) = get_codec(command).unpack(payload)
+            message = b"debug logging " + (b"on" if enabled else b"off")
+            self.send_later(get_codec(UARTEvent.LOG_MESSAGE).frame(message), delay)
+
+
+def open_pty(baudrate: int | None = None) -> tuple[int, int, str]:
+    """Open a raw pseudo-terminal pair, returns both fds and the slave device."""
+    master, slave = os.openpty()
+    tty.setraw(master)
+    tty.setraw(slave)
+    if baudrate is not None:
+        attributes = termios.tcgetattr(slave)
+        speed = getattr(termios, f"B{baudrate}", None)
+        if speed is not None:
+            attributes[4] = attributes[5] = speed
+            termios.tcsetattr(slave, termios.TCSANOW, attributes)
+    # keep the slave open, else reading the master fails until it is reopened
+    return master, slave, os.ttyname(slave)
+
+
+def _parse_delay(value: str) -> tuple[UARTCommand, float]:
+    name, seconds = value.split("=")
+    return UARTCommand[name.upper()], float(seconds)
+
+
+async def _serve(config: SimulatorConfig) -> None:
+    master, slave, device = open_pty(config.baudrate)
+    simulator = FirmwareSimulator(master, config)
+    simulator.start()
+    print(device, flush=True)
+    try:
+        await asyncio.Event().wait()
+    finally:
+        simulator.stop()
+        os.close(master)
+        os.close(slave)
+
+
+def main() -> None:
+    """run the simulator until interrupted"""
+    parser = ArgumentParser(description="UART firmware simulator on a pty")
+    parser.add_argument("--baudrate", type=int, default=115200, help="0 = unpaced")
+    parser.add_argument(
+        "--delay",
+        type=_parse_delay,
+        action="append",
+        default=[],
+        help="answer delay per command, e.g. TURN=0.5 (repeatable)",
+    )
+    parser.add_argument("--jitter", type=float, default=0.0, help="seconds")
+    parser.add_argument("--bit-error-rate", type=float, default=0.0)
+    parser.add_argument("--start-delay", type=float, default=1.0, help="seconds")
+    parser.add_argument("--target", type=int, default=0, choices=(0, 1, 2))
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--debug", action="store_true")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.DEBUG if args.debug else logging.INFO)
+    config = SimulatorConfig(
+        baudrate=args.baudrate or None,
+        jitter=args.jitter,
+        bit_error_rate=args.bit_error_rate,
+        start_delay=args.start_delay,
+        target=args.target,
+        seed=args.seed,
+    )
+    config.delays.update(dict(args.delay))
+    try:
+        asyncio.run(_serve(config))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+"""UART bus replaying a recorded session."""
+
+__copyright__ = "Copyright (c) 2025 HSLU PREN Team 2, FS25. All rights reserved."
+
+from functools import partial
+from pathlib import Path
+from typing import Awaitable, Callable
+import asyncio
+import logging
+
+from ..dispatcher import EventDispatcher
+from ..frame_parser import FrameParser
+from ..protocol import UARTEvent, UARTCommand, UARTProtocol
+from ..recorder import Direction, read_recording
+from ..schema import checksum, encode_frame
+
+
+class ReplayUARTBus(UARTProtocol):  # pylint: disable=too-many-instance-attributes
+    """
+    Feeds the events of a recording to the handlers and checks that the\n
+    commands sent match the recorded ones.\n
+    ``speed`` scales the recorded timing (2.0 = twice as fast), ``None``\n
+    replays as fast as possible.
+    """
+
+    def __init__(
+        self,
+        path: Path | str,
+        *,
+        speed: float | None = 1.0,
+        start: float = 0.0,
+    ) -> None:
+        if speed is not None and speed <= 0:
+            raise ValueError("The replay speed needs to be positive.")
+        self._logger = logging.getLogger("uart.bus.replay")
+        self._event_handlers: set[Callable[[UARTEvent, bytes], Awaitable[None]]] = set()
+        self._dispatcher = EventDispatcher()
+        self._parser = FrameParser()
+        self._speed = speed
+        self._inbound: list[tuple[float, bytes]] = []
+        outbound = bytearray()
+        for record in read_recording(path, start):
+            if record.direction == Direction.INBOUND:
+                self._inbound.append((record.timestamp, record.data))
+            else:
+                outbound += record.data
+        self._expected = bytes(outbound)
+        self._position = 0
+        self._mismatches: list[str] = []
+        self._sent: list[bytes] = []
+        self._finished = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+    async def start(self) -> None:
+        """Start replaying the events."""
+        self._task = asyncio.create_task(self._replay())
+
+    @property
+    def on_event(self) -> set[Callable[[UARTEvent, bytes], Awaitable[None]]]:
+        """Return the set of event handlers"""
+        return self._event_handlers
+
+    @property
+    def dispatcher(self) -> EventDispatcher:
+        """Return the dispatcher handing the events to the handlers."""
+        return self._dispatcher
+
+    @property
+    def mock_sent_commands(self) -> list[bytes]:
+        """Return the list of sent commands."""
+        return self._sent
+
+    @property
+    def mismatches(self) -> list[str]:
+        """Commands differing from the recording."""
+        return self._mismatches
+
+    def calculate_checksum(self, data: bytes) -> int:
+        """Compute the XOR checksum of the given data."""
+        return checksum(data)
+
+    async def send_command(self, command: UARTCommand, payload: bytes = b"") -> None:
+        """Compare the command with the next recorded one."""
+        frame = encode_frame(command.value, payload)
+        self._sent.append(frame)
+        expected = self._expected[self._position : self._position + len(frame)]
+        if expected != frame:
+            message = (
+                f"command #{len(self._sent)} {command.name}: "
+                f"sent {frame.hex()}, recorded {expected.hex() or 'nothing'}"
+            )
+            self._logger.warning("Replay mismatch, %s", message)
+            self._mismatches.append(message)
+        self._position += len(frame)
+
+    async def wait_finished(self) -> None:
+        """Wait until all recorded events were fed."""
+        await self._finished.wait()
+
+    def assert_commands_match(self) -> None:
+        """Raise an ``AssertionError`` unless exactly the recorded commands were sent."""
+        problems = list(self._mismatches)
+        if self._position < len(self._expected):
+            problems.append(
+                f"{self._expected[self._position :].hex()} recorded but never sent"
+            )
+        if problems:
+            raise AssertionError("Replay mismatch:\n" + "\n".join(problems))
+
+    def stop(self) -> None:
+        """Stop the replay."""
+        if self._task is not None:
+            self._task.cancel()
+        self._dispatcher.stop()
+
+    async def _replay(self) -> None:
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        first = self._inbound[0][0] if self._inbound else 0.0
+        for timestamp, data in self._inbound:
+            if self._speed is not None:
+                delay = started + (timestamp - first) / self._speed - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            for event, payload in self._parser.feed(data):
+                for handler in self._event_handlers:
+                    self._dispatcher.dispatch(
+                        handler, event, partial(handler, event, payload)
+                    )
+            if self._speed is None:
+                await asyncio.sleep(0)  # let the handlers run in between
+        self._logger.info("Replayed %d chunks", len(self._inbound))
+        self._finished.set()
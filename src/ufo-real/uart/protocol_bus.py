@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+"""UART bus module built on ``asyncio.Protocol``."""
+
+__copyright__ = "Copyright (c) 2025 HSLU PREN Team 2, FS25. All rights reserved."
+
+from functools import partial
+from typing import Awaitable, Callable, Optional, cast
+import asyncio
+import logging
+
+from serial_asyncio import create_serial_connection
+
+from .command_writer import CommandWriter
+from .dispatcher import EventDispatcher
+from .frame_parser import FrameParser, ParserStatistics
+from .protocol import UARTEvent, UARTCommand, UARTProtocol
+from .recorder import Direction, SessionRecorder
+from .schema import checksum
+
+
+class UARTProtocolBus(UARTProtocol, asyncio.Protocol):  # pylint: disable=too-many-instance-attributes
+    """
+    Implementation of the UART protocol, parses the received bytes in the\n
+    ``data_received`` callback instead of awaiting every single field.\n
+    The events are handed to the handlers by the dispatcher, in order.
+    """
+
+    def __init__(self, *, recorder: SessionRecorder | None = None) -> None:
+        self._logger = logging.getLogger("uart.bus")
+        self._recorder = recorder
+        self._event_handlers: set[Callable[[UARTEvent, bytes], Awaitable[None]]] = set()
+        self._parser = FrameParser()
+        self._dispatcher = EventDispatcher()
+        self._transport: Optional[asyncio.WriteTransport] = None
+        self._connected = asyncio.Event()
+        self._can_write = asyncio.Event()
+        self._can_write.set()
+        # the only one writing to the transport, callers never interleave
+        self._outbound = CommandWriter(self._write, self._can_write.wait)
+
+    async def start(self) -> None:
+        """Start the UART protocol."""
+        # the events are dispatched as soon as they are parsed
+
+    async def wait_connected(self) -> None:
+        """Wait until the transport is connected."""
+        await self._connected.wait()
+
+    @property
+    def on_event(self) -> set[Callable[[UARTEvent, bytes], Awaitable[None]]]:
+        """Return the set of event handlers"""
+        return self._event_handlers
+
+    @property
+    def statistics(self) -> ParserStatistics:
+        """Return the counters of the frame parser."""
+        return self._parser.statistics
+
+    @property
+    def dispatcher(self) -> EventDispatcher:
+        """Return the dispatcher handing the events to the handlers."""
+        return self._dispatcher
+
+    @property
+    def outbound(self) -> CommandWriter:
+        """Return the writer of the outbound commands."""
+        return self._outbound
+
+    def calculate_checksum(self, data: bytes) -> int:
+        """Compute the XOR checksum of the given data."""
+        return checksum(data)
+
+    async def send_command(self, command: UARTCommand, payload: bytes = b"") -> None:
+        """Send a command with an optional payload."""
+        if self._transport is None:
+            raise ConnectionError("UART is not connected.")
+        self._logger.debug("Sending command: %s, payload: %s", command, payload)
+        await self._outbound.send(command, payload)
+
+    def _write(self, data: bytes) -> None:
+        if self._transport is None:
+            raise ConnectionError("UART is not connected.")
+        if self._recorder is not None:
+            self._recorder.record(Direction.OUTBOUND, data)
+        self._transport.write(data)
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        self._transport = cast(asyncio.WriteTransport, transport)
+        self._connected.set()
+        self._logger.debug("UART connected")
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        self._transport = None
+        self._connected.clear()
+        self._can_write.set()
+        self._logger.error("UART connection lost: %s", exc)
+
+    def pause_writing(self) -> None:
+        self._can_write.clear()
+
+    def resume_writing(self) -> None:
+        self._can_write.set()
+
+    def data_received(self, data: bytes) -> None:
+        if self._recorder is not None:
+            self._recorder.record(Direction.INBOUND, data)
+        for event in self._parser.feed(data):
+            self._logger.debug("Received event: %s", event[0])
+            self._fire_event(*event)
+
+    def _fire_event(self, event: UARTEvent, payload: bytes) -> None:
+        """Queue the event for all event handlers, never waits for them."""
+        for handler in self._event_handlers:
+            self._dispatcher.dispatch(handler, event, partial(handler, event, payload))
+
+
+async def open_protocol_bus(
+    url: str, baudrate: int, *, recorder: SessionRecorder | None = None
+) -> UARTProtocolBus:
+    """Open the serial port with a ``UARTProtocolBus`` attached to it."""
+    _, bus = await create_serial_connection(
+        asyncio.get_running_loop(),
+        partial(UARTProtocolBus, recorder=recorder),
+        url,
+        baudrate=baudrate,
+    )
+    bus = cast(UARTProtocolBus, bus)
+    # ``connection_made`` is only called once the port was opened
+    await bus.wait_connected()
+    return bus
@@ -3,11 +3,72 @@
 
 __copyright__ = "Copyright (c) 2025 HSLU PREN Team 2, FS25. All rights reserved."
 
+import asyncio
+import inspect
 import logging
+from collections.abc import Collection, Hashable
+from functools import partial
 from typing import Callable, Awaitable, overload, cast
 
+from .dispatcher import EventDispatcher
+from .firmware_log import FirmwareLogSink
 from .protocol import UARTEvent, UARTProtocol
 
+AdapterT = Callable[[UARTEvent, bytes], Awaitable[None]]
+
+
+class Subscription:
+    """Registered event handler, returned by ``UARTReceiver.on``."""
+
+    def __init__(
+        self,
+        receiver: "UARTReceiver",
+        event: UARTEvent,
+        handler: Callable[..., Awaitable[None]],
+        *,
+        once: bool = False,
+    ) -> None:
+        self._receiver = receiver
+        self.event = event
+        self.handler = handler
+        self.once = once
+        # the handlers of one object share a queue of the dispatcher
+        self.owner: Hashable = getattr(handler, "__self__", handler)
+        self.call = _adapt(handler)
+
+    @property
+    def active(self) -> bool:
+        """Whether the handler is still called."""
+        return self in self._receiver.subscriptions(self.event)
+
+    def unsubscribe(self) -> None:
+        """Stop calling the handler, does nothing if already unsubscribed."""
+        self._receiver.remove(self)
+
+
+def _adapt(handler: Callable[..., Awaitable[None]]) -> AdapterT:
+    """call adapter for the arguments the handler takes, decided only once"""
+    parameters = [
+        parameter
+        for parameter in inspect.signature(handler).parameters.values()
+        if parameter.kind
+        in (parameter.POSITIONAL_ONLY, parameter.POSITIONAL_OR_KEYWORD)
+        and parameter.default is parameter.empty
+    ]
+    if len(parameters) >= 2:
+        return cast(AdapterT, handler)
+    if len(parameters) == 1:
+
+        async def _event_only(event: UARTEvent, _: bytes) -> None:
+            await handler(event)
+
+        return _event_only
+
+    async def _no_arguments(_: UARTEvent, __: bytes) -> None:
+        await handler()
+
+    return _no_arguments
+
 
 class UARTReceiver:
     """Receive events from the vehicle."""
@@ -21,9 +82,18 @@ class UARTReceiver:
         self._uart = uart
         self._uart.on_event.add(self._on_event)
         self._logger = logging.getLogger("uart.recv")
-        self._event_handlers: dict[UARTEvent, list[UARTReceiver.AnyCallbackT]] = {
+        self._subscriptions: dict[UARTEvent, list[Subscription]] = {
             event: [] for event in UARTEvent
         }
+        self._waiters: dict[
+            UARTEvent, list[asyncio.Future[tuple[UARTEvent, bytes]]]
+        ] = {event: [] for event in UARTEvent}
+        # the handlers of one object (e.g. an algorithm) stay in order,
+        # but never wait for the handlers of another one
+        self._dispatcher = EventDispatcher(
+            latency_budget=0.5, name="uart.recv.dispatch"
+        )
+        self._log_sink = FirmwareLogSink()
 
     @property
     def bus(self) -> UARTProtocol:
@@ -37,49 +107,111 @@ class UARTReceiver:
         self._uart.on_event.add(self._on_event)
         self._logger.debug("UART bus set to: %s", bus)
 
+    @property
+    def dispatcher(self) -> EventDispatcher:
+        """Return the dispatcher handing the events to the handlers."""
+        return self._dispatcher
+
+    @property
+    def log_sink(self) -> FirmwareLogSink:
+        """Return the sink of the firmware log messages."""
+        return self._log_sink
+
+    @log_sink.setter
+    def log_sink(self, sink: FirmwareLogSink) -> None:
+        """Set the sink of the firmware log messages."""
+        self._log_sink.stop()
+        sink.listeners.extend(self._log_sink.listeners)
+        self._log_sink = sink
+
     @overload
-    def on(self, event: UARTEvent, handler: CallbackT) -> None:
+    def on(
+        self, event: UARTEvent, handler: CallbackT, *, once: bool = False
+    ) -> Subscription:
         """Register an event handler."""
 
     @overload
-    def on(self, event: UARTEvent, handler: EventCallbackT) -> None:
+    def on(
+        self, event: UARTEvent, handler: EventCallbackT, *, once: bool = False
+    ) -> Subscription:
         """Register an event handler."""
 
     @overload
-    def on(self, event: UARTEvent, handler: EventPayloadCallbackT) -> None:
+    def on(
+        self, event: UARTEvent, handler: EventPayloadCallbackT, *, once: bool = False
+    ) -> Subscription:
         """Register an event handler."""
 
-    def on(self, event: UARTEvent, handler: AnyCallbackT) -> None:
-        """Register an event handler."""
-        self._event_handlers[event].append(handler)
+    def on(
+        self, event: UARTEvent, handler: AnyCallbackT, *, once: bool = False
+    ) -> Subscription:
+        """Register an event handler, ``once`` removes it after the first call."""
+        return self._subscribe(event, handler, once)
+
+    def once(self, event: UARTEvent, handler: AnyCallbackT) -> Subscription:
+        """Register an event handler called only for the next event."""
+        return self._subscribe(event, handler, True)
+
+    def _subscribe(
+        self, event: UARTEvent, handler: AnyCallbackT, once: bool
+    ) -> Subscription:
+        subscription = Subscription(self, event, handler, once=once)
+        self._subscriptions[event].append(subscription)
+        return subscription
+
+    def remove(self, subscription: Subscription) -> None:
+        """Unregister an event handler."""
+        if subscription in self._subscriptions[subscription.event]:
+            self._subscriptions[subscription.event].remove(subscription)
+
+    def subscriptions(self, event: UARTEvent) -> list[Subscription]:
+        """Registered handlers of an event."""
+        return list(self._subscriptions[event])
+
+    async def wait_for(
+        self,
+        event: UARTEvent | Collection[UARTEvent],
+        timeout: float | None = None,
+    ) -> tuple[UARTEvent, bytes]:
+        """
+        Wait for the next of the given events, raises ``TimeoutError``.\n
+        Resolved before any handler runs, so a handler may wait for another\n
+        event without blocking its own queue.
+        """
+        events = [event] if isinstance(event, UARTEvent) else list(event)
+        future: asyncio.Future[tuple[UARTEvent, bytes]] = (
+            asyncio.get_running_loop().create_future()
+        )
+        for waited in events:
+            self._waiters[waited].append(future)
+        try:
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            for waited in events:
+                self._waiters[waited].remove(future)
 
     async def _on_event(self, event: UARTEvent, payload: bytes) -> None:
         """Handle incoming events."""
+        if event == UARTEvent.LOG_MESSAGE:
+            # decoded and written in the background, never inline
+            self._log_sink.submit(payload)
+            if not self._subscriptions[event] and not self._waiters[event]:
+                return  # up to hundreds per second, skip the generic path
         if event.value in UARTEvent:
             await self._on_generic_event(event, payload)
-        if event == UARTEvent.LOG_MESSAGE:
-            self._on_log_message(payload)
 
     async def _on_generic_event(self, event: UARTEvent, payload: bytes) -> None:
         """Handle generic events."""
         self._logger.debug("Received event: %s", event)
-        for handler in self._event_handlers[event]:
-            try:
-                if handler.__code__.co_argcount == 3:
-                    handler = cast(UARTReceiver.EventPayloadCallbackT, handler)
-                    await handler(event, payload)
-                elif handler.__code__.co_argcount == 2:
-                    handler = cast(UARTReceiver.EventCallbackT, handler)
-                    await handler(event)
-                else:
-                    handler = cast(UARTReceiver.CallbackT, handler)
-                    await handler()
-            except Exception as e:  # pylint: disable=broad-except
-                self._logger.error(
-                    "Error in handler for event %s: %s", event, e, exc_info=True
-                )
-
-    def _on_log_message(self, payload: bytes) -> None:
-        """Handle the log message event."""
-        message = payload.decode("utf-8").strip("\x00")
-        self._logger.debug("DEBUG: %s", message)
+        for future in self._waiters[event]:
+            if not future.done():
+                future.set_result((event, payload))
+
+        subscriptions = self._subscriptions[event]
+        for subscription in tuple(subscriptions):
+            if subscription.once:
+                subscriptions.remove(subscription)
+            # errors are logged by the dispatcher
+            self._dispatcher.dispatch(
+                subscription.owner, event, partial(subscription.call, event, payload)
+            )
@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+"""
+UART session recorder module.
+
+A recording is an append-only binary file, a header followed by one record
+per raw byte chunk: ``<timestamp: f64> <direction: u8> <size: u32> <data>``,
+the timestamp in seconds (monotonic) since the start of the recording.
+Every ``INDEX_INTERVAL``-th record is listed in a ``.idx`` sidecar
+(``<timestamp: f64> <offset: u64>``) to start reading at a point in time
+without scanning the whole file.
+"""
+
+__copyright__ = "Copyright (c) 2025 HSLU PREN Team 2, FS25. All rights reserved."
+
+import bisect
+import logging
+import struct
+import time
+from contextlib import ExitStack
+from dataclasses import dataclass
+from enum import IntEnum
+from pathlib import Path
+from typing import BinaryIO, Iterator
+
+MAGIC = b"UFOREC1\n"
+_HEADER = struct.Struct("<d")  # wall clock time of the start
+_RECORD = struct.Struct("<dBI")
+_INDEX = struct.Struct("<dQ")
+INDEX_INTERVAL = 64
+
+
+class Direction(IntEnum):
+    """Direction of a recorded chunk."""
+
+    INBOUND = 0  # events, vehicle -> us
+    OUTBOUND = 1  # commands, us -> vehicle
+
+
+@dataclass(frozen=True)
+class Record:
+    """One recorded chunk of bytes."""
+
+    timestamp: float
+    direction: Direction
+    data: bytes
+
+
+def index_path(path: Path) -> Path:
+    """Path of the index sidecar of a recording."""
+    return path.with_name(path.name + ".idx")
+
+
+class SessionRecorder:
+    """Appends the raw bytes going over the UART to a recording."""
+
+    def __init__(self, path: Path | str) -> None:
+        self._path = Path(path)
+        self._logger = logging.getLogger("uart.recorder")
+        # a failure to open the index closes the recording again
+        with ExitStack() as stack:
+            self._file: BinaryIO = stack.enter_context(open(self._path, "wb"))
+            self._index: BinaryIO = stack.enter_context(
+                open(index_path(self._path), "wb")
+            )
+            self._file.write(MAGIC + _HEADER.pack(time.time()))
+            stack.pop_all()  # both stay open until close()
+        self._offset = len(MAGIC) + _HEADER.size
+        self._records = 0
+        self._started = time.monotonic()
+        self._logger.info("Recording UART session to %s", self._path)
+
+    @property
+    def path(self) -> Path:
+        """Path of the recording."""
+        return self._path
+
+    @property
+    def records(self) -> int:
+        """Number of chunks recorded."""
+        return self._records
+
+    def record(self, direction: Direction, data: bytes) -> None:
+        """Append a chunk, timestamped now."""
+        if self._file.closed or not data:
+            return
+        timestamp = time.monotonic() - self._started
+        if self._records % INDEX_INTERVAL == 0:
+            self._index.write(_INDEX.pack(timestamp, self._offset))
+            self.flush()  # loses at most one interval if the process dies
+        self._file.write(_RECORD.pack(timestamp, direction, len(data)))
+        self._file.write(data)
+        self._offset += _RECORD.size + len(data)
+        self._records += 1
+
+    def flush(self) -> None:
+        """Write the buffered records to disk."""
+        self._file.flush()
+        self._index.flush()
+
+    def close(self) -> None:
+        """Close the recording."""
+        if not self._file.closed:
+            self._file.close()
+            self._index.close()
+            self._logger.info("Recorded %d chunks to %s", self._records, self._path)
+
+
+def read_recording(path: Path | str, start: float = 0.0) -> Iterator[Record]:
+    """Read the records of a recording, beginning with the first at ``start``."""
+    path = Path(path)
+    with open(path, "rb") as file:
+        if file.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not a UART recording.")
+        offset = len(MAGIC) + _HEADER.size
+        if start > 0:
+            offset = _seek_offset(path, start, offset)
+        file.seek(offset)
+
+        while header := file.read(_RECORD.size):
+            if len(header) < _RECORD.size:
+                return  # cut off while recording
+            timestamp, direction, size = _RECORD.unpack(header)
+            data = file.read(size)
+            if len(data) < size:
+                return
+            if timestamp >= start:
+                yield Record(timestamp, Direction(direction), data)
+
+
+def _seek_offset(path: Path, start: float, default: int) -> int:
+    """offset of the last indexed record before ``start``"""
+    index = index_path(path)
+    if not index.exists():
+        return default
+    data = index.read_bytes()
+    entries = list(_INDEX.iter_unpack(data[: len(data) - len(data) % _INDEX.size]))
+    position = bisect.bisect_right([timestamp for timestamp, _ in entries], start)
+    return int(entries[position - 1][1]) if position else default
@@ -0,0 +1,228 @@
+# -*- coding: utf-8 -*-
+"""UART command to event round-trip tracking module."""
+
+__copyright__ = "Copyright (c) 2025 HSLU PREN Team 2, FS25. All rights reserved."
+
+import asyncio
+import bisect
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable
+
+from .protocol import UARTCommand, UARTEvent
+from .receiver import UARTReceiver
+from .schema import get_codec
+from .sender import UARTSender
+
+# events answering a command, the first one to arrive ends the round trip
+EXPECTED_RESPONSES: dict[UARTCommand, frozenset[UARTEvent]] = {
+    UARTCommand.TURN: frozenset({UARTEvent.ALIGNED}),
+    UARTCommand.FOLLOW_LINE: frozenset(
+        {
+            UARTEvent.POINT_REACHED,
+            UARTEvent.NO_LINE_FOUND,
+            UARTEvent.NEXT_POINT_BLOCKED,
+        }
+    ),
+    UARTCommand.DESTINAITON_REACHED: frozenset({UARTEvent.START}),
+}
+
+# seconds until a missing response is flagged, None = wait forever
+RESPONSE_TIMEOUTS: dict[UARTCommand, float | None] = {
+    UARTCommand.TURN: 10.0,
+    UARTCommand.FOLLOW_LINE: 30.0,
+    UARTCommand.DESTINAITON_REACHED: None,  # the next START is up to a human
+}
+
+# upper bounds of the histogram buckets in seconds, the last one is open
+LATENCY_BUCKETS: tuple[float, ...] = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+ANGLE_STEP = 15  # degrees, turns are grouped by their angle rounded to it
+
+
+class RollingHistogram:
+    """Distribution of the most recent latencies."""
+
+    def __init__(self, window: int = 200) -> None:
+        self._samples: deque[float] = deque(maxlen=window)
+        self.timeouts = 0
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    @property
+    def samples(self) -> list[float]:
+        """The latencies in the window, oldest first."""
+        return list(self._samples)
+
+    def add(self, seconds: float) -> None:
+        """Add a latency, drops the oldest once the window is full."""
+        self._samples.append(seconds)
+
+    def percentile(self, fraction: float) -> float:
+        """Latency below which ``fraction`` of the samples are."""
+        if not self._samples:
+            return 0.0
+        ordered = sorted(self._samples)
+        return ordered[min(int(fraction * len(ordered)), len(ordered) - 1)]
+
+    def buckets(self) -> list[int]:
+        """Number of samples per bucket of ``LATENCY_BUCKETS`` (plus one open)."""
+        counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        for sample in self._samples:
+            counts[bisect.bisect_left(LATENCY_BUCKETS, sample)] += 1
+        return counts
+
+    def json(self) -> dict[str, float | int | list[int]]:
+        """json"""
+        return {
+            "count": len(self._samples),
+            "timeouts": self.timeouts,
+            "mean": sum(self._samples) / len(self._samples) if self._samples else 0.0,
+            "p50": self.percentile(0.5),
+            "p95": self.percentile(0.95),
+            "max": max(self._samples, default=0.0),
+            "buckets": self.buckets(),
+        }
+
+
+@dataclass
+class _Pending:
+    command: UARTCommand
+    sent_at: float
+    edge: str | None
+    angle: int | None
+    timeout: asyncio.TimerHandle | None = field(default=None, repr=False)
+
+
+class RoundTripTracker:  # pylint: disable=too-many-instance-attributes
+    """
+    Matches every command the sender sends to the event answering it\n
+    and keeps rolling histograms of the time in between, per command,\n
+    per edge and per turn angle. Commands without an answer in time are\n
+    flagged as timed out.
+    """
+
+    def __init__(
+        self,
+        sender: UARTSender,
+        receiver: UARTReceiver,
+        *,
+        edge_provider: Callable[[], str | None] = lambda: None,
+        timeouts: dict[UARTCommand, float | None] | None = None,
+        window: int = 200,
+    ) -> None:
+        self._edge_provider = edge_provider
+        self._timeouts = RESPONSE_TIMEOUTS if timeouts is None else timeouts
+        self._window = window
+        self._pending: dict[UARTCommand, _Pending] = {}
+        self.by_command: dict[str, RollingHistogram] = {}
+        self.by_edge: dict[str, RollingHistogram] = {}
+        self.by_angle: dict[int, RollingHistogram] = {}
+        self._logger = logging.getLogger("uart.roundtrip")
+
+        sender.observers.append(self._on_command)
+        for event in frozenset().union(*EXPECTED_RESPONSES.values()):
+            receiver.on(event, self._on_event)
+
+    @property
+    def edge_provider(self) -> Callable[[], str | None]:
+        """Tells on which edge the vehicle is, e.g. ``"A-B"``."""
+        return self._edge_provider
+
+    @edge_provider.setter
+    def edge_provider(self, provider: Callable[[], str | None]) -> None:
+        self._edge_provider = provider
+
+    @property
+    def pending(self) -> list[UARTCommand]:
+        """Commands still waiting for their answer."""
+        return list(self._pending)
+
+    def turn_timings(self) -> list[tuple[float, float]]:
+        """Measured TURN -> ALIGNED round trips as (angle in degrees, seconds)."""
+        return [
+            (angle, seconds)
+            for angle, histogram in self.by_angle.items()
+            for seconds in histogram.samples
+        ]
+
+    def json(self) -> dict[str, dict[str, dict[str, float | int | list[int]]]]:
+        """json"""
+        return {
+            "command": {k: v.json() for k, v in self.by_command.items()},
+            "edge": {k: v.json() for k, v in self.by_edge.items()},
+            "angle": {str(k): v.json() for k, v in self.by_angle.items()},
+        }
+
+    def _on_command(self, command: UARTCommand, payload: bytes) -> None:
+        if command not in EXPECTED_RESPONSES:
+            return
+
+        previous = self._pending.pop(command, None)
+        if previous is not None and previous.timeout is not None:
+            previous.timeout.cancel()
+
+        angle = None
+        if command == UARTCommand.TURN:
+            degrees, _ = get_codec(UARTCommand.TURN).unpack(payload)
+            angle = ANGLE_STEP * round(degrees / ANGLE_STEP)
+
+        pending = _Pending(command, time.monotonic(), self._edge_provider(), angle)
+        timeout = self._timeouts.get(command)
+        if timeout is not None:
+            pending.timeout = asyncio.get_running_loop().call_later(
+                timeout, self._on_timeout, pending
+            )
+        self._pending[command] = pending
+
+    async def _on_event(self, event: UARTEvent) -> None:
+        received_at = time.monotonic()
+        answered = [
+            pending
+            for pending in self._pending.values()
+            if event in EXPECTED_RESPONSES[pending.command]
+        ]
+        if not answered:
+            return
+
+        pending = min(answered, key=lambda x: x.sent_at)
+        del self._pending[pending.command]
+        if pending.timeout is not None:
+            pending.timeout.cancel()
+
+        latency = received_at - pending.sent_at
+        self._logger.debug(
+            "%s answered by %s after %.3fs", pending.command.name, event.name, latency
+        )
+        for histogram in self._histograms(pending):
+            histogram.add(latency)
+
+    def _on_timeout(self, pending: _Pending) -> None:
+        if self._pending.get(pending.command) is not pending:
+            return
+        del self._pending[pending.command]
+        self._logger.warning(
+            "%s got no answer within %ss (edge %s)",
+            pending.command.name,
+            self._timeouts.get(pending.command),
+            pending.edge,
+        )
+        for histogram in self._histograms(pending):
+            histogram.timeouts += 1
+
+    def _histograms(self, pending: _Pending) -> list[RollingHistogram]:
+        histograms = [self._histogram(self.by_command, pending.command.name)]
+        if pending.edge is not None:
+            histograms.append(self._histogram(self.by_edge, pending.edge))
+        if pending.angle is not None:
+            histograms.append(self._histogram(self.by_angle, pending.angle))
+        return histograms
+
+    def _histogram[K](
+        self, histograms: dict[K, RollingHistogram], key: K
+    ) -> RollingHistogram:
+        if key not in histograms:
+            histograms[key] = RollingHistogram(self._window)
+        return histograms[key]
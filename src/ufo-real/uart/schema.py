@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+"""UART protocol schema module."""
+
+__copyright__ = "Copyright (c) 2025 HSLU PREN Team 2, FS25. All rights reserved."
+
+import struct
+from dataclasses import dataclass
+from enum import StrEnum
+from functools import cache
+from typing import Any
+
+from .protocol import UARTCommand, UARTEvent
+
+
+class Endianness(StrEnum):
+    """Endianness of the data."""
+
+    LITTLE = "<"
+    BIG = ">"
+
+    def concat(self, fmt: str) -> str:
+        """Concatenate the endianness with the format string."""
+        return self.value + fmt
+
+
+@dataclass(frozen=True)
+class MessageSchema:
+    """Payload layout of a message, see ``docs/UART Protocol Specification.md``."""
+
+    fmt: str = ""  # struct format of the payload, without the byte order
+    length_prefixed: bool = False  # payload of variable size, preceded by its length
+
+
+COMMAND_SCHEMAS: dict[UARTCommand, MessageSchema] = {
+    UARTCommand.TURN: MessageSchema("h?"),  # angle (int16), snap (uint8)
+    UARTCommand.FOLLOW_LINE: MessageSchema(),
+    UARTCommand.DESTINAITON_REACHED: MessageSchema(),
+    UARTCommand.SET_DEBUG_LOGGING: MessageSchema("?"),  # enabled (uint8)
+    UARTCommand.SET_SPEED: MessageSchema("b"),  # speed (int8)
+}
+
+# the length byte of a length prefixed payload is not part of the checksum
+EVENT_SCHEMAS: dict[UARTEvent, MessageSchema] = {
+    UARTEvent.START: MessageSchema("B"),  # target (uint8)
+    UARTEvent.POINT_REACHED: MessageSchema(),
+    UARTEvent.NO_LINE_FOUND: MessageSchema(),
+    UARTEvent.NEXT_POINT_BLOCKED: MessageSchema(),
+    UARTEvent.OBSTACLE_DETECTED: MessageSchema(),
+    UARTEvent.ALIGNED: MessageSchema("B"),  # state (uint8)
+    UARTEvent.RETURNING: MessageSchema(),
+    UARTEvent.LOG_MESSAGE: MessageSchema(length_prefixed=True),  # message (string)
+}
+
+# payload size per event id, ``None`` means a length byte precedes the payload
+EVENT_PAYLOAD_SIZES: dict[int, int | None] = {
+    event.value: (None if schema.length_prefixed else struct.calcsize("<" + schema.fmt))
+    for event, schema in EVENT_SCHEMAS.items()
+}
+
+# below this size a plain loop beats folding the bytes as one integer
+_SHORT_MESSAGE = 16
+
+
+def checksum(data: bytes | bytearray | memoryview, initial: int = 0) -> int:
+    """XOR of all the bytes of ``data`` (and ``initial``)."""
+    size = len(data)
+    if size <= _SHORT_MESSAGE:
+        for byte in data:
+            initial ^= byte
+        return initial
+
+    # fold the halves onto each other until a single byte is left
+    value = int.from_bytes(data, "little")
+    while size > 1:
+        half = (size + 1) // 2
+        value = (value >> (8 * half)) ^ (value & ((1 << (8 * half)) - 1))
+        size = half
+    return value ^ initial
+
+
+_SCHEMAS: list[tuple[UARTCommand | UARTEvent, MessageSchema]] = [
+    *COMMAND_SCHEMAS.items(),
+    *EVENT_SCHEMAS.items(),
+]
+
+# frames without a payload never change, build them only once
+_EMPTY_FRAMES: dict[int, bytes] = {
+    message.value: bytes([message.value, message.value])
+    for message, schema in _SCHEMAS
+    if not schema.fmt and not schema.length_prefixed
+}
+
+_LENGTH_PREFIXED: frozenset[int] = frozenset(
+    message.value for message, schema in _SCHEMAS if schema.length_prefixed
+)
+
+
+def encode_frame(message_id: int, payload: bytes = b"") -> bytes:
+    """Frame a payload: identifier, (length,) payload and checksum."""
+    if message_id in _LENGTH_PREFIXED:
+        return b"%c%c%b%c" % (
+            message_id,
+            len(payload),
+            payload,
+            checksum(payload, message_id),
+        )
+    if not payload:
+        frame = _EMPTY_FRAMES.get(message_id)
+        if frame is not None:
+            return frame
+    return b"%c%b%c" % (message_id, payload, checksum(payload, message_id))
+
+
+class MessageCodec:
+    """Encoder and decoder of the payload of one message."""
+
+    def __init__(
+        self, message: UARTCommand | UARTEvent, endianness: Endianness
+    ) -> None:
+        schema = (
+            COMMAND_SCHEMAS[message]
+            if isinstance(message, UARTCommand)
+            else EVENT_SCHEMAS[message]
+        )
+        self.message = message
+        self.length_prefixed = schema.length_prefixed
+        self._struct = struct.Struct(endianness.concat(schema.fmt))
+
+    @property
+    def payload_size(self) -> int | None:
+        """Size of the payload, ``None`` if it is length prefixed."""
+        return None if self.length_prefixed else self._struct.size
+
+    def pack(self, *values: Any) -> bytes:
+        """Encode the payload."""
+        if self.length_prefixed:
+            (data,) = values
+            return bytes(data)
+        return self._struct.pack(*values)
+
+    def unpack(self, payload: bytes | memoryview) -> tuple[Any, ...]:
+        """Decode the payload."""
+        if self.length_prefixed:
+            return (bytes(payload),)
+        return self._struct.unpack(payload)
+
+    def frame(self, *values: Any) -> bytes:
+        """Encode the payload and frame it."""
+        return encode_frame(self.message.value, self.pack(*values))
+
+
+@cache
+def get_codec(
+    message: UARTCommand | UARTEvent, endianness: Endianness = Endianness.LITTLE
+) -> MessageCodec:
+    """The codec of a message, compiled once per byte order."""
+    return MessageCodec(message, endianness)
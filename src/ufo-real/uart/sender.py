@@ -3,21 +3,10 @@
 
 __copyright__ = "Copyright (c) 2025 HSLU PREN Team 2, FS25. All rights reserved."
 
-import struct
-from enum import StrEnum
+from typing import Callable
 
 from .protocol import UARTCommand, UARTProtocol
-
-
-class Endianness(StrEnum):
-    """Endianness of the data."""
-
-    LITTLE = "<"
-    BIG = ">"
-
-    def concat(self, fmt: str) -> str:
-        """Concatenate the endianness with the format string."""
-        return self.value + fmt
+from .schema import Endianness, get_codec
 
 
 class UARTSender:
@@ -31,6 +20,12 @@ class UARTSender:
     ) -> None:
         self._uart = sender
         self._endianness = endianness
+        # compiled once, looked up per command
+        self._turn = get_codec(UARTCommand.TURN, endianness)
+        self._debug_logging = get_codec(UARTCommand.SET_DEBUG_LOGGING, endianness)
+        self._speed = get_codec(UARTCommand.SET_SPEED, endianness)
+        # called with every command once it was sent, e.g. to time the answer
+        self.observers: list[Callable[[UARTCommand, bytes], None]] = []
 
     @property
     def bus(self) -> UARTProtocol:
@@ -42,35 +37,31 @@ class UARTSender:
         """Set the UART bus."""
         self._uart = bus
 
+    async def _send(self, command: UARTCommand, payload: bytes = b"") -> None:
+        await self._uart.send_command(command, payload)
+        for observer in self.observers:
+            observer(command, payload)
+
     async def turn(self, angle: int, *, snap: bool = True) -> None:
         """Send a turn command."""
-        payload = struct.pack(
-            # short int, bool
-            self._endianness.concat("h?"),
-            angle,
-            snap,
-        )
-        await self._uart.send_command(UARTCommand.TURN, payload)
+        payload = self._turn.pack(angle, snap)
+        await self._send(UARTCommand.TURN, payload)
 
     async def follow_line(self) -> None:
         """Send a follow line command."""
-        await self._uart.send_command(UARTCommand.FOLLOW_LINE)
+        await self._send(UARTCommand.FOLLOW_LINE)
 
     async def set_debug_logging(self, enabled: bool) -> None:
         """Enable or disable debug logging."""
-        await self._uart.send_command(
-            UARTCommand.SET_DEBUG_LOGGING, bytes([int(enabled)])
+        await self._send(
+            UARTCommand.SET_DEBUG_LOGGING, self._debug_logging.pack(enabled)
         )
 
     async def set_speed(self, speed: int) -> None:
         """Set the speed of the vehicle."""
-        payload = struct.pack(
-            # signed char
-            self._endianness.concat("b"),
-            speed,
-        )
-        await self._uart.send_command(UARTCommand.SET_SPEED, payload)
+        payload = self._speed.pack(speed)
+        await self._send(UARTCommand.SET_SPEED, payload)
 
     async def destination_reached(self) -> None:
         """signalise that the destination was reached"""
-        await self._uart.send_command(UARTCommand.DESTINAITON_REACHED)
+        await self._send(UARTCommand.DESTINAITON_REACHED)
@@ -10,6 +10,7 @@ from algorithms.road_sense import RoadSenseAlgorithm
 from uart.protocol import UARTProtocol
 from uart.sender import UARTSender
 from uart.receiver import UARTReceiver
+from uart.round_trip import RoundTripTracker
 from uart.mock.log_bus import LogUARTBus
 from network.network import Network, NetworkProvider
 
@@ -26,6 +27,9 @@ class Engine:
         self._sender = UARTSender(LogUARTBus())
         self._receiver = UARTReceiver(LogUARTBus())
         self._algorithm: BaseAlgorithm | None = None
+        self._round_trips = RoundTripTracker(
+            self._sender, self._receiver, edge_provider=self._current_edge
+        )
 
     def init(
         self,
@@ -44,6 +48,7 @@ class Engine:
         """change algorithm"""
         if self._algorithm is not None:
             self._logger.info("Stopping current algorithm")
+            self._algorithm.stop()
             del self._algorithm
         if to_type is None:
             self._logger.info("No algorithm specified, manual control enabled")
@@ -53,7 +58,17 @@ class Engine:
         self._algorithm = self._create_algorithm(to_type)
 
     def _create_algorithm[T: type[BaseAlgorithm]](self, of_type: T) -> BaseAlgorithm:
-        return of_type(self._network_provider, self.sender, self.receiver)
+        algorithm = of_type(self._network_provider, self.sender, self.receiver)
+        algorithm.turn_timings = self._round_trips.turn_timings
+        return algorithm
+
+    def _current_edge(self) -> str | None:
+        return self._algorithm.current_edge if self._algorithm is not None else None
+
+    @property
+    def round_trips(self) -> RoundTripTracker:
+        """latency between the commands and the events answering them"""
+        return self._round_trips
 
     @property
     def algorithm(self) -> BaseAlgorithm | None:
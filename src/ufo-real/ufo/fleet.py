@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""UFO Fleet, several vehicles driven from one process"""
+
+__copyright__ = "Copyright (c) 2025 HSLU PREN Team 2, FS25. All rights reserved."
+
+import copy
+import logging
+from dataclasses import dataclass
+from typing import Callable, Iterator
+
+from network.network import Network, NetworkProvider
+from ufo.engine import Engine
+
+
+class NetworkTemplate:
+    """
+    Builds the network only once and hands out copies of it, the vehicles\n
+    disable edges and nodes on their own copy. The template is rebuilt\n
+    once ``stamp`` changes (e.g. the modification time of the network file).
+    """
+
+    def __init__(
+        self,
+        provider: NetworkProvider,
+        stamp: Callable[[], object] = lambda: None,
+    ) -> None:
+        self._provider = provider
+        self._stamp = stamp
+        self._template: Network | None = None
+        self._template_stamp: object = None
+
+    def __call__(self) -> Network:
+        stamp = self._stamp()
+        if self._template is None or stamp != self._template_stamp:
+            self._template = self._provider()
+            self._template_stamp = stamp
+        return copy.deepcopy(self._template)
+
+
+@dataclass
+class Vehicle:
+    """one vehicle of the fleet"""
+
+    name: str
+    engine: Engine
+
+    @property
+    def prefix(self) -> str:
+        """web api prefix of the vehicle"""
+        return f"/vehicles/{self.name}"
+
+
+class Fleet:
+    """
+    Engines sharing one event loop, one network template and the models\n
+    (the model registry is process-wide).
+    """
+
+    def __init__(self, network_template: NetworkTemplate) -> None:
+        self._network_template = network_template
+        self._vehicles: dict[str, Vehicle] = {}
+        self._logger = logging.getLogger("fleet")
+
+    def add(self, name: str) -> Vehicle:
+        """add a vehicle, its engine still needs to be initialised with a bus"""
+        if name in self._vehicles:
+            raise ValueError(f"Vehicle {name} already exists")
+        vehicle = Vehicle(name, Engine(self._network_template))
+        self._vehicles[name] = vehicle
+        self._logger.info("Vehicle %s added", name)
+        return vehicle
+
+    def __getitem__(self, name: str) -> Vehicle:
+        return self._vehicles[name]
+
+    def __iter__(self) -> Iterator[Vehicle]:
+        return iter(self._vehicles.values())
+
+    def __len__(self) -> int:
+        return len(self._vehicles)
+
+    @property
+    def names(self) -> list[str]:
+        """names of the vehicles"""
+        return list(self._vehicles)
@@ -5,7 +5,7 @@ __copyright__ = "Copyright (c) 2025 HSLU PREN Team 2, FS25. All rights reserved.
 
 from abc import ABC
 from uart.protocol import UARTEvent
-from uart.receiver import UARTReceiver
+from uart.receiver import Subscription, UARTReceiver
 from network.network import Network
 from network.node import Node, NodeLabel
 
@@ -21,13 +21,24 @@ class BaseUfoListener(ABC):
         self._network = network
         self._receiver = receiver
 
-        self._receiver.on(UARTEvent.START, self._on_event)
-        self._receiver.on(UARTEvent.ALIGNED, self._on_event)
-        self._receiver.on(UARTEvent.POINT_REACHED, self._on_point_reached)
-        self._receiver.on(UARTEvent.NO_LINE_FOUND, self._on_no_line_found)
-        self._receiver.on(UARTEvent.NEXT_POINT_BLOCKED, self._on_next_point_blocked)
-        self._receiver.on(UARTEvent.OBSTACLE_DETECTED, self._on_obstacle_detected)
-        self._receiver.on(UARTEvent.RETURNING, self._on_returning)
+        # kept to unsubscribe once the listener is replaced
+        self._subscriptions: list[Subscription] = [
+            self._receiver.on(UARTEvent.START, self._on_event),
+            self._receiver.on(UARTEvent.ALIGNED, self._on_event),
+            self._receiver.on(UARTEvent.POINT_REACHED, self._on_point_reached),
+            self._receiver.on(UARTEvent.NO_LINE_FOUND, self._on_no_line_found),
+            self._receiver.on(
+                UARTEvent.NEXT_POINT_BLOCKED, self._on_next_point_blocked
+            ),
+            self._receiver.on(UARTEvent.OBSTACLE_DETECTED, self._on_obstacle_detected),
+            self._receiver.on(UARTEvent.RETURNING, self._on_returning),
+        ]
+
+    def _unsubscribe(self) -> None:
+        """stop receiving events, the handlers are never called again"""
+        for subscription in self._subscriptions:
+            subscription.unsubscribe()
+        self._subscriptions.clear()
 
     async def _on_start(self, target: Node) -> None:
         pass
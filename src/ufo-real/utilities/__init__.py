@@ -5,8 +5,19 @@ __copyright__ = "Copyright (c) 2025 HSLU PREN Team 2, FS25. All rights reserved.
 
 # simplifies access to these classes
 # from .ImagePredictor import ImagePredictor
+from .frame_preprocessor import FramePreprocessor, PreprocessingConfig
 from .image_synthesizer import ImageSynthesizer
-from .node_matcher import find_best_matching
+from .inference_service import InferenceDroppedError, InferenceService
+from .node_matcher import MatchingStrategy, find_best_matching
 from .overlay_generator import OverlayGenerator
 
-__all__ = ["ImageSynthesizer", "find_best_matching", "OverlayGenerator"]
+__all__ = [
+    "FramePreprocessor",
+    "PreprocessingConfig",
+    "ImageSynthesizer",
+    "InferenceDroppedError",
+    "InferenceService",
+    "MatchingStrategy",
+    "find_best_matching",
+    "OverlayGenerator",
+]
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+"""
+Frame Preprocessor Module:
+Prepares the camera frames for the model. The frames are decoded at a
+reduced size, resized into a reused buffer and cropped to the part of the
+image that shows the floor, so the model only sees the pixels that matter.
+"""
+
+__copyright__ = "Copyright (c) 2025 HSLU PREN Team 2, FS25. All rights reserved."
+
+from dataclasses import dataclass
+from typing import Optional
+
+import cv2
+import numpy as np
+
+from components import Camera
+
+# cv2 decodes JPEGs at a fraction of the size straight from the DCT,
+# without ever building the full resolution image
+_REDUCED_DECODE_FLAGS = {
+    1: cv2.IMREAD_COLOR,  # pylint: disable=no-member
+    2: cv2.IMREAD_REDUCED_COLOR_2,  # pylint: disable=no-member
+    4: cv2.IMREAD_REDUCED_COLOR_4,  # pylint: disable=no-member
+    8: cv2.IMREAD_REDUCED_COLOR_8,  # pylint: disable=no-member
+}
+
+
+@dataclass
+class PreprocessingConfig:
+    """how the frames are prepared before they are passed to the model"""
+
+    input_size: Optional[int] = None  # px, model input size, None = model default
+    floor_roi: bool = True  # crop away everything above the floor
+    roi_margin: int = 16  # px kept above the horizon
+    max_floor_distance: Optional[float] = None  # mm, floor further away is cropped
+    jpeg_reduction: int = 1  # 1, 2, 4 or 8, decode the images at 1/n of the size
+
+    def __post_init__(self) -> None:
+        if self.jpeg_reduction not in _REDUCED_DECODE_FLAGS:
+            raise ValueError(
+                f"JPEG reduction must be one of {list(_REDUCED_DECODE_FLAGS)}."
+            )
+        if self.input_size is not None and (
+            self.input_size <= 0 or self.input_size % 32 != 0
+        ):
+            raise ValueError("The model input size must be a multiple of 32.")
+
+
+@dataclass
+class PreparedFrame:
+    """a frame ready for the model and how to get back to full frame pixels"""
+
+    frame: cv2.typing.MatLike  # the whole frame in the target resolution
+    model_input: cv2.typing.MatLike  # view of the rows the model gets to see
+    offset: int  # px, first row of the model input within the frame
+
+    def to_frame_coordinates(self, xyxy: np.ndarray) -> np.ndarray:
+        """map boxes (``N x 4``, xmin ymin xmax ymax) of the model input into the frame"""
+        shift = np.array([0, self.offset, 0, self.offset], dtype=xyxy.dtype)
+        shifted: np.ndarray = xyxy + shift
+        return shifted
+
+
+class FramePreprocessor:
+    """decodes, resizes and crops the frames for one resolution"""
+
+    def __init__(
+        self, resolution: tuple[int, int], config: Optional[PreprocessingConfig] = None
+    ) -> None:
+        self.resolution = resolution
+        self.config = config or PreprocessingConfig()
+
+        # reused by every call, the frames are resized into it
+        self._frame_buffer: Optional[np.ndarray] = None
+
+    def read(self, path: str) -> Optional[cv2.typing.MatLike]:
+        """read an image file, ``None`` if it can not be read"""
+        return cv2.imread(  # pylint: disable=no-member
+            path, _REDUCED_DECODE_FLAGS[self.config.jpeg_reduction]
+        )
+
+    def decode(self, buffer: bytes | bytearray | memoryview) -> cv2.typing.MatLike:
+        """decode an encoded image buffer (e.g. the JPEG bytes of a camera)"""
+        decoded = cv2.imdecode(  # pylint: disable=no-member
+            np.frombuffer(buffer, dtype=np.uint8),
+            _REDUCED_DECODE_FLAGS[self.config.jpeg_reduction],
+        )
+        if decoded is None:
+            raise ValueError("Image buffer could not be decoded.")
+        return decoded
+
+    def prepare(self, frame: cv2.typing.MatLike, camera: Camera) -> PreparedFrame:
+        """resize the frame to the resolution and crop it to the floor"""
+        frame = self._fit_to_resolution(frame)
+        offset = self.floor_offset(camera)
+        return PreparedFrame(frame, frame[offset:], offset)
+
+    def floor_offset(self, camera: Camera) -> int:
+        """
+        First row of the frame that can show the floor, taken from the\n
+        horizon (or the farthest floor wanted) of the ``camera``.
+        """
+        if not self.config.floor_roi:
+            return 0
+
+        if self.config.max_floor_distance is None:
+            top = camera.compute_horizon_position()
+        else:
+            _, top = camera.compute_image_position(
+                0.0, float(self.config.max_floor_distance)
+            )
+
+        height = self.resolution[1]
+        # the camera may describe a different resolution than the one used here
+        top = int(top * height / camera.get_height) - self.config.roi_margin
+        # always leave at least one row for the model
+        return min(max(top, 0), height - 1)
+
+    def _fit_to_resolution(self, frame: cv2.typing.MatLike) -> cv2.typing.MatLike:
+        """resize the frame into the reused buffer unless it already fits"""
+        width, height = self.resolution
+        if frame.shape[1] == width and frame.shape[0] == height:
+            return frame
+
+        shape = (height, width, *frame.shape[2:])
+        if (
+            self._frame_buffer is None
+            or self._frame_buffer.shape != shape
+            or self._frame_buffer.dtype != frame.dtype
+        ):
+            self._frame_buffer = np.empty(shape, dtype=frame.dtype)
+
+        return cv2.resize(  # pylint: disable=no-member
+            frame, self.resolution, dst=self._frame_buffer
+        )
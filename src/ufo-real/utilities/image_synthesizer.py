@@ -6,9 +6,11 @@ __copyright__ = "Copyright (c) 2025 HSLU PREN Team 2, FS25. All rights reserved.
 from typing import TypeVar
 from math import sqrt
 
-from components import Camera, Graph, Obstacle, RealNode, Robot, VisualNode
+import numpy as np
 
-from .node_matcher import find_best_matching
+from components import Camera, Edge, Graph, Obstacle, RealNode, Robot, VisualNode
+
+from .node_matcher import MatchingStrategy, find_best_matching
 
 # enabling polymorphism
 T = TypeVar("T")
@@ -17,10 +19,19 @@ T = TypeVar("T")
 class ImageSynthesizer:
     """Class to synthesize information from the images taken by the robot"""
 
-    def __init__(self, camera: Camera, robot: Robot, graph: Graph) -> None:
+    def __init__(
+        self,
+        camera: Camera,
+        robot: Robot,
+        graph: Graph,
+        matching_strategy: MatchingStrategy = MatchingStrategy.ASSIGNMENT,
+        matching_gate: float | None = None,
+    ) -> None:
         self.camera = camera
         self.robot = robot
         self.graph = graph
+        self.matching_strategy = matching_strategy
+        self.matching_gate = matching_gate  # px, further apart stays unmatched
 
     def update_graph_by_objects(
         self,
@@ -36,7 +47,10 @@ class ImageSynthesizer:
         # compare the mesured locations of nodes with the one the
         # #system computed and find the best matching
         node_matching: list[tuple[str, str]] = find_best_matching(
-            detected_nodes, computed_nodes
+            detected_nodes,
+            computed_nodes,
+            self.matching_strategy,
+            self.matching_gate,
         )
         # sorts all the nodes to match the order of the matching
         # detected_nodes -> verified_nodes
@@ -126,25 +140,41 @@ class ImageSynthesizer:
 
         return obstacles_images
 
-    def render_edges(
+    def render_edges(  # pylint: disable=too-many-locals
         self, nodes: list[VisualNode], obstacles: list[VisualNode], pylons: list[str]
     ) -> None:
         """render what the edges should look like in the image"""
 
+        # index once instead of searching the lists for every edge
+        nodes_by_label: dict[str, VisualNode] = {}
+        for node in nodes:
+            nodes_by_label.setdefault(node.get_label, node)
+        pylon_labels = set(pylons)
+
+        visible_edges: list[Edge] = []
+        segments: list[tuple[int, int, int, int]] = []
+
         for e in self.graph.get_edges:
             n, m = e.get_nodes
             label1 = n.get_label
             label2 = m.get_label
-            if label1 in nodes and label2 in nodes:
-                x_1, y_1 = _find_node_by_str(nodes, label1).get_coordinates
-                x_2, y_2 = _find_node_by_str(nodes, label2).get_coordinates
-
-                if label1 in pylons or label2 in pylons:
+            if label1 in nodes_by_label and label2 in nodes_by_label:
+                if label1 in pylon_labels or label2 in pylon_labels:
                     e.is_missing()
-                elif _does_line_cross_any_obstacle((x_1, y_1), (x_2, y_2), obstacles):
-                    e.is_blocked()
                 else:
-                    e.is_available()
+                    x_1, y_1 = nodes_by_label[label1].get_coordinates
+                    x_2, y_2 = nodes_by_label[label2].get_coordinates
+                    visible_edges.append(e)
+                    segments.append((x_1, y_1, x_2, y_2))
+
+        # test all the edges against all the obstacles at once
+        crossings = compute_intersection_matrix(segments, obstacles).any(axis=1)
+
+        for e, crosses in zip(visible_edges, crossings):
+            if crosses:
+                e.is_blocked()
+            else:
+                e.is_available()
 
 
 def calculate_average_offset(
@@ -180,6 +210,49 @@ def calculate_average_offset(
     return (avg_div_x, avg_div_y)
 
 
+def compute_intersection_matrix(  # pylint: disable=too-many-locals # same as scalar version
+    segments: list[tuple[int, int, int, int]], obstacles: list[VisualNode]
+) -> np.ndarray:
+    """
+    Computes for every line segment ``(x1, y1, x2, y2)`` whether it crosses\n
+    the groundplate ellipse of each of the ``obstacles`` all at once.\n
+    Vectorized version of ``_does_line_intersect_ellipse``, yields the same\n
+    results for every pair (degenerate pairs the scalar version can not\n
+    compute, like zero width or zero length, count as not intersecting).\n
+    - return = (``ndarray[bool]``) matrix of shape (segments, obstacles)\n
+    """
+    if not segments or not obstacles:
+        return np.zeros((len(segments), len(obstacles)), dtype=bool)
+
+    lines = np.asarray(segments, dtype=float)
+    x1 = lines[:, 0:1]
+    y1 = lines[:, 1:2]
+    dx = lines[:, 2:3] - x1
+    dy = lines[:, 3:4] - y1
+
+    ellipses = np.array(
+        [(*o.get_coordinates, *o.get_dimensions) for o in obstacles], dtype=float
+    )
+    x3 = ellipses[np.newaxis, :, 0]
+    y3 = ellipses[np.newaxis, :, 1]
+    rx2 = (ellipses[np.newaxis, :, 2] / 2) ** 2
+    h = ellipses[np.newaxis, :, 3]
+    ry2 = (np.where(h == 0, 1.0, h) / 2) ** 2
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        a = (dx**2) / rx2 + (dy**2) / ry2
+        b = 2 * ((x1 - x3) * dx / rx2 + (y1 - y3) * dy / ry2)
+        c = ((x1 - x3) ** 2) / rx2 + ((y1 - y3) ** 2) / ry2 - 1
+
+        discriminant = b**2 - 4 * a * c
+        sqrt_disc = np.sqrt(np.where(discriminant < 0, np.nan, discriminant))
+        t1 = (-b - sqrt_disc) / (2 * a)
+        t2 = (-b + sqrt_disc) / (2 * a)
+
+    # comparisons with nan are false, so no solution means no intersection
+    return np.asarray(((0 <= t1) & (t1 <= 1)) | ((0 <= t2) & (t2 <= 1)))
+
+
 def _does_line_intersect_ellipse(  # pylint: disable=too-many-locals # impossible to read otherwise
     point_a: tuple[int, int], point_b: tuple[int, int], obstacle: VisualNode
 ) -> bool:
@@ -256,21 +329,22 @@ def _sort_matching_and_nodes_(
     computed_nodes: list[VisualNode] = []
     measured_nodes: list[VisualNode] = []
 
-    # flip elements in tupel such that the computed labels come first
-    if match[0][0].isalpha() and match[0][1].isdigit():
-        matching = match
-    elif match[0][0].isdigit() and match[0][1].isalpha():
-        matching = [(b, a) for (a, b) in match]
-    else:
-        raise ValueError("Render Fail. Could not assign origin of nodes.")
+    # find_best_matching already puts the computed labels first, an empty
+    # matching or one without any pair (gate rejected all) stays as it is
+    matching = match
 
-    # check whiche list contains whiche type of node
-    if nodes1[0].get_label.isalpha() and nodes2[0].get_label.isdigit():
-        computed_nodes = nodes1
-        measured_nodes = nodes2
-    elif nodes1[0].get_label.isdigit() and nodes2[0].get_label.isalpha():
+    # check whiche list contains whiche type of node, an empty list
+    # takes the role the other one leaves
+    if (not nodes1 or nodes1[0].get_label.isdigit()) and (
+        not nodes2 or nodes2[0].get_label.isalpha()
+    ):
         computed_nodes = nodes2
         measured_nodes = nodes1
+    elif (not nodes1 or nodes1[0].get_label.isalpha()) and (
+        not nodes2 or nodes2[0].get_label.isdigit()
+    ):
+        computed_nodes = nodes1
+        measured_nodes = nodes2
     else:
         raise ValueError("Render Fail. Could not assign origin of nodes.")
 
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+"""
+Inference Service Module:
+Runs the blocking image recognition on a worker instead of the event loop,
+so the UART bus and the web server keep answering while a frame is processed.
+"""
+
+__copyright__ = "Copyright (c) 2025 HSLU PREN Team 2, FS25. All rights reserved."
+
+import asyncio
+import logging
+from collections import deque
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable
+
+
+class InferenceDroppedError(Exception):
+    """the request got replaced by a newer one before it was processed"""
+
+
+@dataclass
+class InferenceStatistics:
+    """counters of the inference service"""
+
+    submitted: int = 0
+    completed: int = 0
+    failed: int = 0
+    dropped: int = 0
+    timed_out: int = 0
+
+
+@dataclass
+class _InferenceRequest[S, R]:
+    source: S
+    future: asyncio.Future[R] = field(repr=False)
+
+
+class InferenceService[S, R]:  # pylint: disable=too-many-instance-attributes
+    """
+    Awaitable facade around a blocking ``detect`` function.\n
+    Requests wait in a bounded queue, once it is full the oldest waiting\n
+    request is dropped (a newer frame is always more useful than an old one).\n
+    The requests are processed one after another on the ``executor``,\n
+    a single worker thread by default.
+    """
+
+    def __init__(
+        self,
+        detect: Callable[[S], R],
+        *,
+        max_queue: int = 1,
+        timeout: float | None = None,
+        executor: Executor | None = None,
+    ) -> None:
+        if max_queue < 1:
+            raise ValueError("The queue needs to hold at least one request.")
+
+        self._detect = detect
+        self._max_queue = max_queue
+        self._timeout = timeout
+        self._executor = executor or ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="inference"
+        )
+        self._queue: deque[_InferenceRequest[S, R]] = deque()
+        self._wakeup = asyncio.Event()
+        self._worker: asyncio.Task[None] | None = None
+        self._statistics = InferenceStatistics()
+        self._logger = logging.getLogger("utilities.inference")
+
+    @property
+    def statistics(self) -> InferenceStatistics:
+        """counters of the service"""
+        return self._statistics
+
+    @property
+    def queue_depth(self) -> int:
+        """number of requests waiting to be processed"""
+        return len(self._queue)
+
+    async def submit(self, source: S, timeout: float | None = None) -> R:
+        """
+        Queue ``source`` for detection and wait for the result.\n
+        Raises ``InferenceDroppedError`` if a newer request replaced this\n
+        one and ``TimeoutError`` if it took longer than ``timeout`` seconds\n
+        (defaults to the timeout of the service).
+        """
+        self._ensure_worker()
+        self._statistics.submitted += 1
+
+        if len(self._queue) >= self._max_queue:
+            oldest = self._queue.popleft()
+            if not oldest.future.done():
+                oldest.future.set_exception(InferenceDroppedError())
+            self._statistics.dropped += 1
+            self._logger.debug("Inference queue full, dropped the oldest request")
+
+        future: asyncio.Future[R] = asyncio.get_running_loop().create_future()
+        self._queue.append(_InferenceRequest(source, future))
+        self._wakeup.set()
+
+        timeout = self._timeout if timeout is None else timeout
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except TimeoutError:
+            self._statistics.timed_out += 1
+            self._logger.warning("Inference timed out after %ss", timeout)
+            raise
+
+    def stop(self) -> None:
+        """stop the worker and drop all the waiting requests"""
+        if self._worker is not None:
+            self._worker.cancel()
+            self._worker = None
+        while self._queue:
+            self._queue.popleft().future.cancel()
+
+    def _ensure_worker(self) -> None:
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._work())
+
+    async def _work(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            if not self._queue:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            request = self._queue.popleft()
+            if request.future.done():  # timed out or cancelled while waiting
+                continue
+
+            try:
+                result = await loop.run_in_executor(
+                    self._executor, self._detect, request.source
+                )
+            except Exception as e:  # pylint: disable=broad-except
+                self._statistics.failed += 1
+                if not request.future.done():
+                    request.future.set_exception(e)
+                continue
+
+            self._statistics.completed += 1
+            if not request.future.done():
+                request.future.set_result(result)
@@ -8,48 +8,127 @@ Expands upon the base class of Nodes.\n
 
 __copyright__ = "Copyright (c) 2025 HSLU PREN Team 2, FS25. All rights reserved."
 
-
-# TODO: # pylint: disable=fixme
-# Expand this class into a strategy pattern in order to
-# test different matching strategies in order to improve results.
-
 import itertools
+from enum import Enum
+
+import numpy as np
+from scipy.optimize import linear_sum_assignment  # type: ignore
 
 from components import VisualNode
 
 
+class MatchingStrategy(Enum):
+    """available strategies to match the detected and computed nodes"""
+
+    PERMUTATION = "permutation"  # brute force, O(N!*C(N,k)), kept for comparison
+    ASSIGNMENT = "assignment"  # rectangular assignment problem, O(N^3)
+
+
 # Pubicliy accessable function that clients can use to find a matching. Gives access
 # to all the other functions and simplifys access by hiding all the conditional
 # statemates and adaptations. On its own only checks whether the two given lists as
 # parameters have the same length and decides which recursive method needs to be
 # invoked. Returns the best matching regardless with the nodes that could not be
-# asigned as an empty tuple.
-# - image   = (list[VisualNodes]) list of nodes extracted from the image
-# - calc    = (list[VisualNodes]) list of nodes that were calculated
-# - returns = (list[(str,str)]) list of tuples that create the minimal Matching
+# asigned as an empty tuple. Every tuple holds the computed label first and the
+# one from the image second, whatever the lengths of the lists.
+# - image    = (list[VisualNodes]) list of nodes extracted from the image
+# - calc     = (list[VisualNodes]) list of nodes that were calculated
+# - strategy = (MatchingStrategy) which algorithm should be used
+# - gate     = (float) max distance in px of a pair, only used by ASSIGNMENT
+# - returns  = (list[(str,str)]) list of tuples that create the minimal Matching
 def find_best_matching(
-    image: list[VisualNode], calc: list[VisualNode]
+    image: list[VisualNode],
+    calc: list[VisualNode],
+    strategy: MatchingStrategy = MatchingStrategy.ASSIGNMENT,
+    gate: float | None = None,
 ) -> list[tuple[str, str]]:
     """give it two list of VisualNodes, lean back and enjoy so magic happening"""
     result: list[tuple[str, str]] = []
 
-    if len(image) != len(calc):
-        result = _create_subset_for_matching(image, calc)
+    if strategy == MatchingStrategy.ASSIGNMENT:
+        result = _calculate_assignment_matching(image, calc, gate)
+    elif len(image) != len(calc):
+        result = _orient_matching(_create_subset_for_matching(image, calc), calc)
     else:
         _, result = _calculate_best_matching(tuple(image), calc)
+        result = _orient_matching(result, calc)
 
     return result
 
 
+# Private function that flips the tuples of the permutation search, which puts
+# the longer list first, such that the computed label comes first. A node from
+# the image without a match ends up as ("", label).
+# - matching = (list[(str,str)]) tuples of the permutation search
+# - calc     = (list[VisualNodes]) list of nodes that were calculated
+# - returns  = (list[(str,str)]) tuples of (computed label, image label)
+def _orient_matching(
+    matching: list[tuple[str, str]], calc: list[VisualNode]
+) -> list[tuple[str, str]]:
+    computed = {node.get_label for node in calc}
+    return [(a, b) if a in computed else (b, a) for a, b in matching]
+
+
+# Private function that solves the matching as a rectangular linear assignment
+# problem on the matrix of squared distances (same cost as the permutation
+# search) in O(N^3). Pairs further apart than ``gate`` are never matched so
+# far-off detections stay unmatched. Matched pairs come first, followed by all
+# the nodes that could not get a match as tuples with an empty string.
+# - image   = (list[VisualNodes]) list of nodes extracted from the image
+# - calc    = (list[VisualNodes]) list of nodes that were calculated
+# - gate    = (float) max distance in px between two matched nodes
+# - returns = (list[(str,str)]) list of tuples that create the minimal Matching
+def _calculate_assignment_matching(
+    image: list[VisualNode], calc: list[VisualNode], gate: float | None
+) -> list[tuple[str, str]]:
+    result: list[tuple[str, str]] = []
+    matched: set[str] = set()
+
+    if calc and image:
+        cost = _calculate_cost_matrix(calc, image)
+        gated = np.zeros(cost.shape, dtype=bool)
+        if gate is not None:
+            # pairs outside the gate cost more than all the valid ones together,
+            # so the solver first maximises the number of valid pairs
+            gated = cost > gate**2
+            cost[gated] = gate**2 * (min(cost.shape) + 1) + 1
+
+        rows, cols = linear_sum_assignment(cost)
+        for i, j in zip(rows, cols):
+            if gated[i, j]:
+                continue
+            result.append((calc[i].get_label, image[j].get_label))
+            matched.add(calc[i].get_label)
+            matched.add(image[j].get_label)
+
+    # add all nodes that could not get a match, on their side of the tuple
+    result += [(n.get_label, "") for n in calc if n.get_label not in matched]
+    result += [("", n.get_label) for n in image if n.get_label not in matched]
+
+    return result
+
+
+# Calculates the squared distance between every pair of nodes of both arrays
+# - first   = Array of VisualNodes (rows)
+# - second  = Array of VisualNodes (columns)
+# - returns = (ndarray) matrix of the squared distances
+def _calculate_cost_matrix(
+    first: list[VisualNode], second: list[VisualNode]
+) -> np.ndarray:
+    first_pos = np.array([n.get_coordinates for n in first], dtype=float)
+    second_pos = np.array([n.get_coordinates for n in second], dtype=float)
+    diff = first_pos[:, np.newaxis, :] - second_pos[np.newaxis, :, :]
+    return np.asarray(np.sum(diff**2, axis=2))
+
+
 # Private function that does all the heavy lifting. Generates all possible
 # permutations between the two sets and returns the minimal matching. Does
 # however need the lists to be of equal length. Because of that it might be
 # necessary use the method repeatedly. For that case it can return in addition
 # to the matching the corresponding distance so the caller can compare results
 # of different sublists.
-# TODO: # pylint: disable=fixme
-# Exceptionally slow since this part alone takes O(N!).
-# Alternatives desperately needed.
+# Exceptionally slow since this part alone takes O(N!), only used by the
+# PERMUTATION strategy in order to compare it with the ASSIGNMENT strategy.
 # - image    = (list[VisualNodes]) list of nodes extracted from the image
 # - calc     = (list[VisualNodes]) list of nodes that were calculated
 # - needEval = (bool) caller can say if they want the distance as well
@@ -77,9 +156,8 @@ def _calculate_best_matching(
 
 # Private function that is needed in cases the list do not have the same length.
 # Generates subsets on all the possible subsets and recursively checks them all.
-# TODO: # pylint: disable=fixme
-# exceptionally slow since it makes the algorithm O(N!*N!) Alternatives
-# desperately needed.
+# Exceptionally slow since it makes the algorithm O(N!*N!), only used by the
+# PERMUTATION strategy.
 # - image   = (list[VisualNodes]) list of nodes extracted from the image
 # - calc    = (list[VisualNodes]) list of nodes that were calculated
 # - returns = (list[str,str]) list of tuples that create the minimal Matching
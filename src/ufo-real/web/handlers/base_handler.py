@@ -17,8 +17,9 @@ from ufo.engine import Engine
 class BaseHandler(ABC):
     """base handler"""
 
-    def __init__(self, engine: Engine) -> None:
+    def __init__(self, engine: Engine, prefix: str = "") -> None:
         self._engine = engine
+        self._prefix = prefix  # e.g. "/vehicles/rig1" in fleet mode
         self._logger = logging.getLogger("server")
 
     @abstractmethod
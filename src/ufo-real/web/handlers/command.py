@@ -13,13 +13,13 @@ class CommandHandler(BaseHandler):
     """handles commands"""
 
     def add_routes(self, app: web.Application) -> None:
-        app.router.add_post("/api/command/speed", self._set_speed)
-        app.router.add_post("/api/command/logging", self._set_logging)
+        app.router.add_post(self._prefix + "/api/command/speed", self._set_speed)
+        app.router.add_post(self._prefix + "/api/command/logging", self._set_logging)
         app.router.add_post(
-            "/api/command/destination-reached", self._destination_reached
+            self._prefix + "/api/command/destination-reached", self._destination_reached
         )
-        app.router.add_post("/api/command/follow", self._follow_line)
-        app.router.add_post("/api/command/turn", self._turn)
+        app.router.add_post(self._prefix + "/api/command/follow", self._follow_line)
+        app.router.add_post(self._prefix + "/api/command/turn", self._turn)
 
     async def _set_speed(self, request: web.Request) -> web.Response:
         body = await self._get_json_body(
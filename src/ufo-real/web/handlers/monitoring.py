@@ -8,6 +8,7 @@ import json
 import aiohttp
 from aiohttp import web
 
+from uart.firmware_log import FirmwareLogLine
 from ufo.engine import Engine
 from ufo.logger import UfoLogger, UfoLogMessage
 from .base_handler import BaseHandler
@@ -16,15 +17,18 @@ from .base_handler import BaseHandler
 class MonitoringHandler(BaseHandler):
     """monitoring handler"""
 
-    def __init__(self, engine: Engine) -> None:
-        BaseHandler.__init__(self, engine)
+    def __init__(self, engine: Engine, prefix: str = "") -> None:
+        BaseHandler.__init__(self, engine, prefix)
 
         self._ufo_logger = UfoLogger(engine.create_network(), engine.receiver)
         self._ufo_logger.listeners.append(self._on_message)
         self._listeners: list[web.WebSocketResponse] = []
+        # clients tailing the firmware log, opted in with "firmware:on"
+        self._firmware_listeners: set[web.WebSocketResponse] = set()
+        engine.receiver.log_sink.listeners.append(self._on_firmware_log)
 
     def add_routes(self, app: web.Application) -> None:
-        app.router.add_get("/api/monitoring", self._on_subscribe)
+        app.router.add_get(self._prefix + "/api/monitoring", self._on_subscribe)
 
     async def _on_message(self, message: UfoLogMessage) -> None:
         new_listeners: list[web.WebSocketResponse] = []
@@ -38,6 +42,16 @@ class MonitoringHandler(BaseHandler):
                 self._logger.debug("Client disconnected")
         self._listeners = new_listeners
 
+    async def _on_firmware_log(self, line: FirmwareLogLine) -> None:
+        for listener in list(self._firmware_listeners):
+            try:
+                await listener.send_str(
+                    json.dumps({"type": "firmware", "data": line.json()})
+                )
+            except aiohttp.ClientConnectionResetError:
+                self._logger.debug("Client disconnected")
+                self._firmware_listeners.discard(listener)
+
     async def _on_subscribe(self, request: web.Request) -> web.WebSocketResponse:
         ws = web.WebSocketResponse()
         await ws.prepare(request)
@@ -50,5 +64,14 @@ class MonitoringHandler(BaseHandler):
             if msg.type == aiohttp.WSMsgType.TEXT:
                 if msg.data == "close":
                     await ws.close()
+                elif msg.data == "firmware:on":
+                    for line in self._engine.receiver.log_sink.recent:
+                        await ws.send_str(
+                            json.dumps({"type": "firmware", "data": line.json()})
+                        )
+                    self._firmware_listeners.add(ws)
+                elif msg.data == "firmware:off":
+                    self._firmware_listeners.discard(ws)
+        self._firmware_listeners.discard(ws)
 
         return ws
@@ -12,6 +12,10 @@ from common.constants import VERSION
 from common.competition import update_dynamic_network, create_dynamic_network
 from network.node import NodeLabel
 from algorithms import ALGORITHMS
+from pathfinder.registry import PATHFINDERS
+from uart.bus import UARTBus
+from uart.protocol_bus import UARTProtocolBus
+from uart.round_trip import LATENCY_BUCKETS
 from .base_handler import BaseHandler
 
 
@@ -19,13 +23,20 @@ class SystemHandler(BaseHandler):
     """system handler"""
 
     def add_routes(self, app: web.Application) -> None:
-        app.router.add_get("/api/version", self._version)
-        app.router.add_get("/api/system/algorithm", self._algorithm)
-        app.router.add_put("/api/system/algorithm", self._set_algorithm)
-        app.router.add_get("/api/system/algorithms", self._algorithms)
-        app.router.add_post("/api/system/algorithm/reset", self._reset)
-        app.router.add_get("/api/system/network", self._get_network)
-        app.router.add_put("/api/system/network", self._set_network)
+        prefix = self._prefix
+        app.router.add_get(prefix + "/api/version", self._version)
+        app.router.add_get(prefix + "/api/system/algorithm", self._algorithm)
+        app.router.add_put(prefix + "/api/system/algorithm", self._set_algorithm)
+        app.router.add_get(prefix + "/api/system/algorithms", self._algorithms)
+        app.router.add_post(prefix + "/api/system/algorithm/reset", self._reset)
+        app.router.add_get(prefix + "/api/system/pathfinder", self._pathfinder)
+        app.router.add_put(prefix + "/api/system/pathfinder", self._set_pathfinder)
+        app.router.add_get(prefix + "/api/system/pathfinders", self._pathfinders)
+        app.router.add_get(prefix + "/api/system/network", self._get_network)
+        app.router.add_put(prefix + "/api/system/network", self._set_network)
+        app.router.add_get(prefix + "/api/system/uart", self._uart)
+        app.router.add_get(prefix + "/api/system/round-trips", self._round_trips)
+        app.router.add_get(prefix + "/api/system/firmware-log", self._firmware_log)
 
     async def _version(self, _: web.Request) -> web.Response:
         return web.Response(text=VERSION)
@@ -53,6 +64,24 @@ class SystemHandler(BaseHandler):
     async def _algorithms(self, _: web.Request) -> web.Response:
         return web.json_response(list(ALGORITHMS.keys()))
 
+    async def _pathfinder(self, _: web.Request) -> web.Response:
+        if self._engine.algorithm is None:
+            return web.HTTPNoContent()
+        return web.Response(text=self._engine.algorithm.pathfinder_name)
+
+    async def _set_pathfinder(self, request: web.Request) -> web.Response:
+        name = request.query.get("name")
+        if name not in PATHFINDERS:
+            return web.HTTPBadRequest(text=f"Unknown pathfinder: {name}")
+        if self._engine.algorithm is None:
+            return web.HTTPConflict(text="No algorithm running")
+
+        self._engine.algorithm.use_pathfinder(name)
+        return web.Response(text=name)
+
+    async def _pathfinders(self, _: web.Request) -> web.Response:
+        return web.json_response(list(PATHFINDERS))
+
     async def _reset(self, _: web.Request) -> web.Response:
         """Reset the system"""
         self._engine.reset()
@@ -72,10 +101,56 @@ class SystemHandler(BaseHandler):
                 "y": Float().coerce(),
             }
         )
-        schema = Object({x.value: location_schema
-                         for x in NodeLabel
-                         if x != NodeLabel.UNDEFINED})
+        schema = Object(
+            {x.value: location_schema for x in NodeLabel if x != NodeLabel.UNDEFINED}
+        )
 
         data = await self._get_json_body(request, schema)
         update_dynamic_network(data)
         return web.Response()
+
+    async def _uart(self, _: web.Request) -> web.Response:
+        """Outbound queue depth and send latency per command"""
+        bus = self._engine.sender.bus
+        if not isinstance(bus, (UARTBus, UARTProtocolBus)):
+            return web.HTTPNoContent()
+
+        statistics = bus.outbound.statistics
+        return web.json_response(
+            {
+                "queue_depth": bus.outbound.queue_depth,
+                "max_depth": statistics.max_depth,
+                "sent": statistics.sent,
+                "writes": statistics.writes,
+                "collapsed": statistics.collapsed,
+                "prioritised": statistics.prioritised,
+                "failed": statistics.failed,
+                "latency": {
+                    command.name: {
+                        "count": latency.count,
+                        "mean": latency.mean,
+                        "max": latency.max,
+                    }
+                    for command, latency in statistics.latency.items()
+                },
+            }
+        )
+
+    async def _round_trips(self, _: web.Request) -> web.Response:
+        """Command to event latency per command, edge and turn angle"""
+        return web.json_response(
+            {
+                "bucket_bounds": list(LATENCY_BUCKETS),
+                "pending": [
+                    command.name for command in self._engine.round_trips.pending
+                ],
+                **self._engine.round_trips.json(),
+            }
+        )
+
+    async def _firmware_log(self, _: web.Request) -> web.Response:
+        """Counters of the firmware log sink"""
+        sink = self._engine.receiver.log_sink
+        return web.json_response(
+            {"queue_depth": sink.queue_depth, **dataclasses.asdict(sink.statistics)}
+        )
@@ -10,6 +10,7 @@ from aiosignal import Signal
 from aiohttp import web
 
 from ufo.engine import Engine
+from ufo.fleet import Fleet
 from .handlers.base_handler import BaseHandler
 from .handlers.command import CommandHandler
 from .handlers.monitoring import MonitoringHandler
@@ -22,20 +23,39 @@ class WebServer:
 
     AppSignalT = Signal[Callable[["web.Application"], Awaitable[None]]]
 
-    def __init__(self, engine: Engine) -> None:
+    def __init__(self, engine: Engine, fleet: Fleet | None = None) -> None:
         self._app = web.Application()
         self._logger = logging.getLogger("web")
+        self._fleet = fleet
 
         self._handlers: list[BaseHandler] = [
             CommandHandler(engine),
             MonitoringHandler(engine),
             SystemHandler(engine),
-            UiHandler(engine),
         ]
+        # every vehicle of the fleet under its own prefix
+        for vehicle in fleet or ():
+            self._handlers += [
+                CommandHandler(vehicle.engine, vehicle.prefix),
+                MonitoringHandler(vehicle.engine, vehicle.prefix),
+                SystemHandler(vehicle.engine, vehicle.prefix),
+            ]
+        self._app.router.add_get("/api/fleet", self._vehicles)
+        # catches all the remaining paths, needs to be the last one
+        self._handlers.append(UiHandler(engine))
 
         for handler in self._handlers:
             handler.add_routes(self._app)
 
+    async def _vehicles(self, _: web.Request) -> web.Response:
+        """names of the vehicles, empty unless in fleet mode"""
+        return web.json_response(self._fleet.names if self._fleet else [])
+
+    @property
+    def app(self) -> web.Application:
+        """app"""
+        return self._app
+
     @property
     def on_startup(self) -> AppSignalT:
         """on_startup"""
@@ -4,6 +4,7 @@
 __copyright__ = "Copyright (c) 2025 HSLU PREN Team 2, FS25. All rights reserved."
 
 # simplifies access to these classes
+from .model_registry import MODEL_REGISTRY, ModelRegistry, ModelTimings
 from .yolo_model_v11 import ImageDetection
 
-__all__ = ["ImageDetection"]
+__all__ = ["ImageDetection", "MODEL_REGISTRY", "ModelRegistry", "ModelTimings"]
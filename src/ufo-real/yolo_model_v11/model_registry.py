@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+"""
+Model Registry Module:
+Loads every YOLO model only once per process (in the background if wanted)
+and warms it up with a dummy frame, so the first real inference does not
+pay for reading the weights or the lazy initialisation of the model.
+"""
+
+__copyright__ = "Copyright (c) 2025 HSLU PREN Team 2, FS25. All rights reserved."
+
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+import numpy as np
+from ultralytics import YOLO  # type: ignore # pylint: disable=import-error
+
+
+@dataclass
+class ModelTimings:
+    """how long it took to get a model ready, in seconds"""
+
+    load: Optional[float] = None
+    warm_up: Optional[float] = None
+
+
+def _load_yolo(model_path: str) -> YOLO:
+    return YOLO(model_path, task="detect")
+
+
+_Key = tuple[str, Optional[tuple[int, int]]]
+
+
+class ModelRegistry:
+    """Process-wide cache of the loaded models, shared by all the callers."""
+
+    def __init__(self, loader: Callable[[str], YOLO] = _load_yolo) -> None:
+        self._loader = loader
+        self._lock = threading.Lock()
+        # one entry per warm-up resolution, all of them share the loaded model
+        self._models: dict[_Key, Future[YOLO]] = {}
+        self._loaded: dict[str, YOLO] = {}  # only used by the loader thread
+        self._timings: dict[str, ModelTimings] = {}
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="model-loader"
+        )
+        self._logger = logging.getLogger("yolo.registry")
+
+    def preload(
+        self, model_path: str, resolution: Optional[tuple[int, int]] = None
+    ) -> Future[YOLO]:
+        """
+        Start loading (and warming up with a frame of ``resolution``) the\n
+        model in the background, returns immediately. Does nothing if the\n
+        model is already loaded or loading for that resolution. A failed\n
+        load is tried again by the next call.
+        """
+        key = (model_path, resolution)
+        with self._lock:
+            submitted = key not in self._models
+            if submitted:
+                self._timings.setdefault(model_path, ModelTimings())
+                self._models[key] = self._executor.submit(
+                    self._load, model_path, resolution
+                )
+            future = self._models[key]
+        if submitted:
+            # outside the lock, the callback runs at once if already done
+            future.add_done_callback(lambda done: self._forget_failed(key, done))
+        return future
+
+    def get(
+        self, model_path: str, resolution: Optional[tuple[int, int]] = None
+    ) -> YOLO:
+        """get the shared model, waits for it if it is still loading"""
+        return self.preload(model_path, resolution).result()
+
+    def is_ready(
+        self, model_path: str, resolution: Optional[tuple[int, int]] = None
+    ) -> bool:
+        """whether the model is loaded and warmed up for ``resolution``"""
+        with self._lock:
+            future = self._models.get((model_path, resolution))
+        return future is not None and future.done() and future.exception() is None
+
+    @property
+    def timings(self) -> dict[str, ModelTimings]:
+        """load and (latest) warm-up timings of all the models"""
+        with self._lock:
+            return dict(self._timings)
+
+    def _forget_failed(self, key: _Key, future: Future[YOLO]) -> None:
+        if future.cancelled() or future.exception() is not None:
+            with self._lock:
+                if self._models.get(key) is future:
+                    del self._models[key]
+
+    def _load(self, model_path: str, resolution: Optional[tuple[int, int]]) -> YOLO:
+        timings = self._timings[model_path]
+
+        model = self._loaded.get(model_path)
+        if model is None:
+            start = time.perf_counter()
+            model = self._loader(model_path)
+            timings.load = time.perf_counter() - start
+            self._loaded[model_path] = model
+
+        if resolution is not None:
+            width, height = resolution
+            start = time.perf_counter()
+            model(np.zeros((height, width, 3), dtype=np.uint8), verbose=False)
+            timings.warm_up = time.perf_counter() - start
+
+        self._logger.info(
+            "Model %s ready (load: %.2fs, warm-up at %s: %s)",
+            model_path,
+            timings.load,
+            resolution,
+            "skipped" if resolution is None else f"{timings.warm_up:.2f}s",
+        )
+        return model
+
+
+MODEL_REGISTRY = ModelRegistry()
@@ -6,12 +6,20 @@ Imagerecognition aint pretty...
 
 import os
 import sys
-from typing import Optional
+from typing import Optional, cast
 
 import cv2
+import numpy as np
 from ultralytics import YOLO  # type: ignore # pylint: disable=import-error
 from components import Camera, Obstacle, Pylon, VisualNode
 from basic import Colour as co
+from utilities.frame_preprocessor import (
+    FramePreprocessor,
+    PreparedFrame,
+    PreprocessingConfig,
+)
+
+from .model_registry import MODEL_REGISTRY
 
 
 class ImageDetection:
@@ -24,8 +32,6 @@ class ImageDetection:
     camera: Camera
     thresh: float
     resolution: tuple[int, int]
-    model: YOLO
-    labels: dict[int, str]
 
     bbox_colors = [
         co.bgr("DUSTY_STEEL_BLUE"),
@@ -46,6 +52,7 @@ class ImageDetection:
         camera: Camera,
         thresh: float,
         resolution: Optional[str] = None,
+        preprocessing: Optional[PreprocessingConfig] = None,
     ) -> None:
         self.model_path = model_path
         self.camera = camera
@@ -62,11 +69,24 @@ class ImageDetection:
         # Check if model file exists and is valid
         if not os.path.exists(model_path):
             model_path = "yolo_model_v11\\my_model.pt"  # default in case of misspelling
+        self.model_path = model_path
+
+        # Start loading the model into memory (takes time) in the background,
+        # it is shared with every other detection using the same model
+        MODEL_REGISTRY.preload(self.model_path, self.resolution)
+
+        # decodes, resizes and crops the frames before the model sees them
+        self.preprocessor = FramePreprocessor(self.resolution, preprocessing)
 
+    @property
+    def model(self) -> YOLO:
+        """the shared model, waits for it if it is still loading"""
+        return MODEL_REGISTRY.get(self.model_path, self.resolution)
 
-        # Load the model into memory (takes time) and get label-map
-        self.model = YOLO(model_path, task="detect")
-        self.labels = self.model.names
+    @property
+    def labels(self) -> dict[int, str]:
+        """label-map of the model"""
+        return cast(dict[int, str], self.model.names)
 
     def __str__(self) -> str:
         return (
@@ -78,7 +98,7 @@ class ImageDetection:
             + f"- Labels:\t{self.labels}\n"
         )
 
-    def yolo_detect_by_image( # pylint: disable=too-many-locals
+    def yolo_detect_by_image(
         self,
         pic_path: str,
     ) -> tuple[list[VisualNode], list[Obstacle], cv2.typing.MatLike]:
@@ -94,55 +114,79 @@ class ImageDetection:
             print("Given path is not a file.")
             sys.exit(0)
 
-        frame = cv2.imread(pic_path)  # pylint: disable=no-member
-        frame = cv2.resize(frame, self.resolution) # pylint: disable=no-member
+        frame = self.preprocessor.read(pic_path)
+        if frame is None:
+            print(f"File {pic_path} could not be read.")
+            sys.exit(0)
 
-        # Run inference on frame
-        results = self.model(frame, verbose=False)
+        return self._detect(self.preprocessor.prepare(frame, self.camera))
 
-        # Extract results
-        detections = results[0].boxes
+    def yolo_detect_by_frame(
+        self,
+        frame: cv2.typing.MatLike | bytes | bytearray | memoryview,
+    ) -> tuple[list[VisualNode], list[Obstacle], cv2.typing.MatLike]:
+        """
+        Let the system recognize all the objects in a frame that is already\n
+        in memory, either decoded (``ndarray``) or an encoded image buffer\n
+        (e.g. the JPEG bytes of a camera), without a round trip to the disk.\n
+        The returned frame is a buffer that is reused by the next call.
+        """
+        if isinstance(frame, (bytes, bytearray, memoryview)):
+            frame = self.preprocessor.decode(frame)
+
+        return self._detect(self.preprocessor.prepare(frame, self.camera))
+
+    def _detect(  # pylint: disable=too-many-locals
+        self, prepared: PreparedFrame
+    ) -> tuple[list[VisualNode], list[Obstacle], cv2.typing.MatLike]:
+        """run the model on the floor region of a prepared frame"""
+        # Run inference on the cropped frame only
+        config = self.preprocessor.config
+        if config.input_size is None:
+            results = self.model(prepared.model_input, verbose=False)
+        else:
+            results = self.model(
+                prepared.model_input, imgsz=config.input_size, verbose=False
+            )
+
+        # Extract results, all the boxes are converted to NumPy arrays at once
+        # (one device sync per attribute instead of several per box) and
+        # mapped back from the crop into full frame pixels
+        boxes = results[0].boxes
+        xyxy = prepared.to_frame_coordinates(boxes.xyxy.cpu().numpy().astype(int))
+        classes = boxes.cls.cpu().numpy().astype(int)
+        confidences = boxes.conf.cpu().numpy()
+
+        # only keep the boxes whose confidence threshold is high enough
+        confident = confidences > self.thresh
+        class_ids = {name: idx for idx, name in self.labels.items()}
 
         # SELF ADDED Node-List
         nodes: list[VisualNode] = []
         pylons: list[Pylon] = []
         obstacles: list[Obstacle] = []
 
-        # Go through each detection and get bbox coords, confidence, and class
-        for d in detections:
-            # Get bounding box coordinates
-            # Ultralytics returns results in Tensor format, which have to be
-            # converted to a regular Python array
-            xyxy_tensor = detections[
-                d
-            ].xyxy.cpu()  # Detections in Tensor format in CPU memory
-            xyxy = xyxy_tensor.numpy().squeeze()  # Convert tensors to Numpy array
-            xmin, ymin, xmax, ymax = xyxy.astype(
-                int
-            )  # Extract individual coordinates and convert to int
-
-            # Get bounding box class ID, name and confidence
-            classidx = int(detections[d].cls.item())
-            classname = self.labels[classidx]
-            conf = detections[d].conf.item()
-
-            # Draw box if confidence threshold is high enough
-            if conf > self.thresh:
-                # SELF ADDED CODE
-                if classname == "nodes":
-                    center_width = int((xmin + xmax) / 2)
-                    center_height = int((ymin + ymax) / 2)
-                    nodes.append(
-                        VisualNode.position_only(str(d), (center_width, center_height))
-                    )
-                elif classname == "pylon":
-                    pylons.append(Pylon(xmin, ymin, xmax, ymax))
-                elif classname == "obstacle":
-                    obstacles.append(Obstacle(xmin, ymin, xmax, ymax))
+        # nodes are labelled with the index of their box
+        node_indices = np.flatnonzero(confident & (classes == class_ids.get("nodes")))
+        centers = ((xyxy[node_indices, 0:2] + xyxy[node_indices, 2:4]) / 2).astype(int)
+        for index, (center_width, center_height) in zip(
+            node_indices.tolist(), centers.tolist()
+        ):
+            nodes.append(
+                VisualNode.position_only(str(index), (center_width, center_height))
+            )
+
+        pylon_mask = confident & (classes == class_ids.get("pylon"))
+        for xmin, ymin, xmax, ymax in xyxy[pylon_mask].tolist():
+            pylons.append(Pylon(xmin, ymin, xmax, ymax))
+
+        obstacle_mask = confident & (classes == class_ids.get("obstacle"))
+        for xmin, ymin, xmax, ymax in xyxy[obstacle_mask].tolist():
+            obstacles.append(Obstacle(xmin, ymin, xmax, ymax))
 
         # SELF ADDED CODE - append all the pylon visual nodes
         # - can't be first because that causes a bug somewhere else TODO
         for p in pylons:
             nodes.append(self.camera.compute_hidden_node_image_position(p))
 
-        return (nodes, obstacles, frame)
+        return (nodes, obstacles, prepared.frame)